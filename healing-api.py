@@ -23,38 +23,48 @@ Usage:
 
 import argparse
 import asyncio
+import atexit
 import base64
+import bisect
+import functools
 import hashlib
 import io
+import itertools
 import json
 import logging
 import math
 import os
+import queue
 import random
 import re
-import secrets
 import sqlite3
 import sys
 import threading
 import time
 import uuid
-import webbrowser
-from collections import Counter
+import weakref
+from collections import Counter, defaultdict
 from datetime import datetime
 from enum import Enum
-from typing import Dict, List, Optional, Union, Any, Tuple, Set, Callable
+from typing import Dict, List, Optional, Union, Any, Tuple, Set, Callable, Iterable, Iterator
 
 try:
-    from flask import Flask, request, jsonify, render_template, send_file
+    from flask import Flask, request, jsonify, render_template, send_file, g, Response
     HAS_FLASK = True
 except ImportError:
     HAS_FLASK = False
 
 try:
-    from rapidfuzz import process, fuzz
-    HAS_FUZZY_SEARCH = True
+    import orjson
+    HAS_ORJSON = True
 except ImportError:
-    HAS_FUZZY_SEARCH = False
+    HAS_ORJSON = False
+
+try:
+    import msgspec
+    HAS_MSGSPEC = True
+except ImportError:
+    HAS_MSGSPEC = False
 
 try:
     from openai_handler import OpenAIHandler
@@ -62,14 +72,32 @@ try:
 except ImportError:
     HAS_OPENAI_HANDLER = False
 
+try:
+    import ahocorasick
+    HAS_AHOCORASICK = True
+except ImportError:
+    HAS_AHOCORASICK = False
+
 try:
     import numpy as np
+    HAS_NUMPY = True
+except ImportError:
+    HAS_NUMPY = False
+
+try:
+    from numba import njit
+    HAS_NUMBA = True
+except ImportError:
+    HAS_NUMBA = False
+
+# Visualization needs NumPy (imported above) as well as matplotlib
+try:
     import matplotlib
     matplotlib.use('Agg')  # Non-interactive backend
     import matplotlib.pyplot as plt
     from matplotlib.figure import Figure
     from matplotlib.backends.backend_agg import FigureCanvasAgg as FigureCanvas
-    HAS_VISUALIZATION = True
+    HAS_VISUALIZATION = HAS_NUMPY
 except ImportError:
     HAS_VISUALIZATION = False
 
@@ -79,6 +107,18 @@ try:
 except ImportError:
     HAS_WEBSOCKETS = False
 
+try:
+    import uvloop
+    HAS_UVLOOP = True
+except ImportError:
+    HAS_UVLOOP = False
+
+try:
+    from gunicorn.app.base import BaseApplication
+    HAS_GUNICORN = True
+except ImportError:
+    HAS_GUNICORN = False
+
 # Configure logging
 logging.basicConfig(
     level=logging.INFO,
@@ -86,9 +126,56 @@ logging.basicConfig(
 )
 logger = logging.getLogger('sacred-healing')
 
+# Compact JSON (de)serialization, using orjson's C implementation when available
+if HAS_ORJSON:
+    # Like json.dumps, accept non-string dict keys (stringified)
+    _ORJSON_OPTIONS = orjson.OPT_NON_STR_KEYS
+    
+    def _dumps_bytes(obj: Any) -> bytes:
+        return orjson.dumps(obj, option=_ORJSON_OPTIONS)
+    
+    def _dumps(obj: Any) -> str:
+        return orjson.dumps(obj, option=_ORJSON_OPTIONS).decode('utf-8')
+    
+    _loads = orjson.loads
+    
+    def _dumps_sorted_bytes(obj: Any) -> bytes:
+        return orjson.dumps(obj, option=_ORJSON_OPTIONS | orjson.OPT_SORT_KEYS)
+    
+    def _dumps_indented_bytes(obj: Any) -> bytes:
+        return orjson.dumps(obj, option=_ORJSON_OPTIONS | orjson.OPT_INDENT_2)
+else:
+    def _dumps_bytes(obj: Any) -> bytes:
+        return json.dumps(obj, separators=(',', ':'), ensure_ascii=False).encode('utf-8')
+    
+    def _dumps(obj: Any) -> str:
+        return json.dumps(obj, separators=(',', ':'), ensure_ascii=False)
+    
+    _loads = json.loads
+    
+    def _dumps_sorted_bytes(obj: Any) -> bytes:
+        return json.dumps(obj, separators=(',', ':'), sort_keys=True).encode('utf-8')
+    
+    def _dumps_indented_bytes(obj: Any) -> bytes:
+        return json.dumps(obj, indent=2, ensure_ascii=False).encode('utf-8')
+
+# orjson 3.9+ embeds pre-serialized JSON verbatim, letting stored JSON columns
+# pass through to responses without a parse/dump round trip
+HAS_RAW_JSON = HAS_ORJSON and hasattr(orjson, 'Fragment')
+
 # API server port
 API_PORT = 5000
 
+# Gunicorn worker processes (one per core, splitting the OpenAI rate limits
+# between them), and threads per worker (each thread leases one pooled SQLite
+# connection, so threads match the connection pool size)
+API_WORKERS = os.cpu_count() or 4
+API_THREADS = 8
+
+# SQLite file holding healing code embeddings, so workers embed the catalog
+# once between them and reload it on restart (overridden by $SACRED_EMBEDDINGS_PATH)
+EMBEDDINGS_DB_PATH = 'sacred_embeddings.db'
+
 #########################################
 # CORE SACRED GEOMETRY CONSTANTS & ENUMS
 #########################################
@@ -100,9 +187,14 @@ SQRT2 = 2 ** 0.5          # Used in Octahedron
 SCHUMANN_RESONANCE = 7.83 # Earth's primary resonance frequency
 
 # Sacred Number Sequences
-FIBONACCI = [1, 1, 2, 3, 5, 8, 13, 21, 34, 55, 89, 144, 233, 377, 610, 987]
-METATRON = [3, 6, 9, 12, 15, 18, 21, 24, 27, 30, 33, 36, 39, 42, 45, 48]  # Tesla's 3-6-9 sequence
-SOLFEGGIO = [396, 417, 528, 639, 741, 852, 963]  # Solfeggio frequencies
+FIBONACCI = (1, 1, 2, 3, 5, 8, 13, 21, 34, 55, 89, 144, 233, 377, 610, 987)
+METATRON = (3, 6, 9, 12, 15, 18, 21, 24, 27, 30, 33, 36, 39, 42, 45, 48)  # Tesla's 3-6-9 sequence
+SOLFEGGIO = (396, 417, 528, 639, 741, 852, 963)  # Solfeggio frequencies
+
+# PHI spiral powers (PHI^1 .. PHI^7) used for the phi-segment encoding
+PHI_POWERS = tuple(PHI ** (k + 1) for k in range(7))
+if HAS_NUMPY:
+    PHI_POWERS_ARRAY = np.array(PHI_POWERS)
 
 # Planetary geometric relationships (angular positions)
 PLANETARY_ANGLES = {
@@ -127,6 +219,30 @@ ELEMENT_FREQUENCIES = {
     "ether": 741    # Solfeggio frequency for expression
 }
 
+# Properties of the platonic solids (vertices, edges, faces)
+PLATONIC_PROPERTIES = {
+    "tetrahedron": {"vertices": 4, "edges": 6, "faces": 4, "element": "fire"},
+    "hexahedron": {"vertices": 8, "edges": 12, "faces": 6, "element": "earth"},
+    "octahedron": {"vertices": 6, "edges": 12, "faces": 8, "element": "air"},
+    "dodecahedron": {"vertices": 20, "edges": 30, "faces": 12, "element": "ether"},
+    "icosahedron": {"vertices": 12, "edges": 30, "faces": 20, "element": "water"}
+}
+
+# Sorted lookup tables for nearest-value searches
+PLANET_ANGLE_TABLE = tuple(sorted(PLANETARY_ANGLES.values()))
+PLANET_BY_ANGLE = {angle: planet for planet, angle in reversed(list(PLANETARY_ANGLES.items()))}
+SOLFEGGIO_SORTED = tuple(sorted(SOLFEGGIO))
+
+# Per-index hash seeds for the geometry generators, encoded once at import
+# (each generator hashes intention bytes + seed)
+METATRON_SPHERE_SEEDS = tuple(str(METATRON[i % len(METATRON)]).encode('utf-8') for i in range(13))
+SEED_OF_LIFE_SEEDS = tuple(f":{i * (360 / 7)}:{(i + 1) * PHI}".encode('utf-8') for i in range(7))
+SRI_YANTRA_TRIANGLE_SEEDS = tuple(
+    (f"shiva{i}" if i % 2 == 0 else f"shakti{i}").encode('utf-8') for i in range(9)
+)
+PLATONIC_VERTEX_SEEDS = tuple(f"v{i}".encode('utf-8') for i in range(20))  # Up to 20 vertices (dodecahedron)
+PLATONIC_OUTPUT_LIMIT = 5  # Vertices, edges and faces reported per platonic solid
+
 class PacketType(Enum):
     """Network packet types for sacred intention transmission"""
     DATA = 0
@@ -163,7 +279,7 @@ class HealingCategory(Enum):
 # Global sequence counter for packet IDs
 SEQUENCE_COUNTER = 0
 
-# Connected WebSocket clients
+# Connected WebSocket clients (WebSocketClient instances)
 WEBSOCKET_CLIENTS = set()
 
 
@@ -211,11 +327,14 @@ class IntentionPacket:
         self.field_type = field_type
         self.target_device = target_device
         
+        # One CSPRNG draw for both the energy signature and the quantum key
+        raw = os.urandom(24)
+        
         # Create energy signature with quantum noise
-        self.energy_signature = secrets.token_hex(8)
+        self.energy_signature = raw[:8].hex()
         
         # Generate quantum entanglement key
-        self.quantum_key = secrets.token_hex(16)
+        self.quantum_key = raw[8:].hex()
         
         # Calculate intention strength based on frequency and length
         self.intention_strength = min((len(intention) * frequency) / 100, 100)
@@ -229,12 +348,12 @@ class IntentionPacket:
             "quantum_entanglement_key": self.quantum_key
         }
         
-        # Create header
-        payload_str = json.dumps(self.payload)
-        self.header = PacketHeader(PacketType.INTENTION, len(payload_str))
+        # Create header (length is the serialized payload size in bytes)
+        payload_bytes = _dumps_bytes(self.payload)
+        self.header = PacketHeader(PacketType.INTENTION, len(payload_bytes))
         
         # Calculate checksum
-        self.header.checksum = self._calculate_checksum(payload_str)
+        self.header.checksum = self._calculate_checksum(payload_bytes)
         
         # Metadata
         self.metadata = {
@@ -244,9 +363,9 @@ class IntentionPacket:
             "sacred_encoding": "merkaba-torus-fibonacci"
         }
     
-    def _calculate_checksum(self, payload: str) -> str:
-        """Calculate SHA-256 checksum of payload"""
-        return hashlib.sha256(payload.encode('utf-8')).hexdigest()[:16]
+    def _calculate_checksum(self, payload: bytes) -> str:
+        """Calculate SHA-256 checksum of the serialized payload"""
+        return hashlib.sha256(payload).digest()[:8].hex()
     
     def to_dict(self) -> Dict[str, Any]:
         """Convert packet to dictionary for JSON serialization"""
@@ -256,21 +375,26 @@ class IntentionPacket:
             "metadata": self.metadata
         }
     
+    def to_bytes(self) -> bytes:
+        """Convert packet to compact UTF-8 JSON bytes"""
+        return _dumps_bytes(self.to_dict())
+    
     def to_json(self) -> str:
         """Convert packet to JSON string"""
-        return json.dumps(self.to_dict())
+        return self.to_bytes().decode('utf-8')
     
-    def to_base64(self) -> str:
+    def to_base64(self, packet_bytes: Optional[bytes] = None) -> str:
         """Convert packet to base64 string (for network transmission)"""
-        return base64.b64encode(self.to_json().encode('utf-8')).decode('utf-8')
+        if packet_bytes is None:
+            packet_bytes = self.to_bytes()
+        return base64.b64encode(packet_bytes).decode('ascii')
 
 
 def extract_intention_from_packet(packet_base64: str) -> Optional[str]:
     """Extract intention from a base64-encoded packet (for receiving devices)"""
     try:
         # Decode from base64
-        json_str = base64.b64decode(packet_base64).decode('utf-8')
-        packet = json.loads(json_str)
+        packet = _loads(base64.b64decode(packet_base64))
         
         # Extract intention
         return packet["payload"]["intention"]
@@ -289,10 +413,149 @@ async def embed_intention_in_network_packet(
     return packet.to_base64()
 
 
+#########################################
+# WEBSOCKET BROADCASTING
+#########################################
+
+# Maximum messages buffered per client; further broadcasts to it are dropped
+CLIENT_QUEUE_SIZE = 1000
+
+# Upper bound on the size of a coalesced batch frame (characters)
+MAX_BATCH_FRAME_SIZE = 16384
+
+
+class WebSocketClient:
+    """Connected WebSocket client with its own outgoing queue and writer task"""
+    
+    def __init__(self, connection):
+        self.connection = connection
+        self.out_queue = asyncio.Queue(maxsize=CLIENT_QUEUE_SIZE)
+        self.writer_task = asyncio.create_task(self._writer_loop())
+    
+    async def _writer_loop(self):
+        """
+        Drain the outgoing queue into the connection until it fails
+        
+        When several messages are backlogged they are merged into a single
+        frame of the form {"batch": [message, ...]}, so clients must accept
+        either a plain message or a batch envelope.
+        """
+        try:
+            while True:
+                message = await self.out_queue.get()
+                batch = [message]
+                batch_size = len(message)
+                
+                # Coalesce whatever else is already queued, up to the frame size limit
+                while batch_size < MAX_BATCH_FRAME_SIZE and not self.out_queue.empty():
+                    message = self.out_queue.get_nowait()
+                    batch.append(message)
+                    batch_size += len(message)
+                
+                if len(batch) == 1:
+                    await self.connection.send(batch[0])
+                else:
+                    await self.connection.send('{"batch": [' + ', '.join(batch) + ']}')
+        except asyncio.CancelledError:
+            raise
+        except Exception as e:
+            logger.error(f"Error sending message to client: {e}")
+        finally:
+            WEBSOCKET_CLIENTS.discard(self)
+    
+    def enqueue(self, message: str) -> bool:
+        """Queue a message for sending without blocking; False if the queue is full"""
+        try:
+            self.out_queue.put_nowait(message)
+            return True
+        except asyncio.QueueFull:
+            logger.warning("Client send queue full, dropping message")
+            return False
+    
+    def close(self):
+        """Stop the writer task"""
+        self.writer_task.cancel()
+
+
+def register_client(connection) -> WebSocketClient:
+    """Register a new WebSocket connection for broadcasts"""
+    client = WebSocketClient(connection)
+    WEBSOCKET_CLIENTS.add(client)
+    return client
+
+
+def unregister_client(client: WebSocketClient) -> None:
+    """Remove a WebSocket client and stop its writer"""
+    WEBSOCKET_CLIENTS.discard(client)
+    client.close()
+
+
+def broadcast_to_clients(payload: str) -> int:
+    """
+    Queue a payload for every connected WebSocket client, returning how many accepted it
+    
+    The payload must be a JSON document, since backlogged messages are sent
+    together inside a {"batch": [...]} envelope.
+    """
+    return sum(client.enqueue(payload) for client in list(WEBSOCKET_CLIENTS))
+
+
 #########################################
 # SACRED GEOMETRY CALCULATIONS
 #########################################
 
+def _closest_value(table: Tuple[float, ...], value: float) -> float:
+    """Nearest entry of an ascending table to value; ties go to the lower entry"""
+    i = bisect.bisect_left(table, value)
+    if i == 0:
+        return table[0]
+    if i == len(table):
+        return table[-1]
+    lower, upper = table[i - 1], table[i]
+    return upper if upper - value < value - lower else lower
+
+
+def _seeded_hexdigests(base, seeds, length: int) -> List[str]:
+    """Hash each seed on top of a shared prefix hash, returning truncated hex digests"""
+    # Hex-encode only the bytes that survive truncation (odd lengths need one extra)
+    byte_count = (length + 1) // 2
+    digests = []
+    for seed in seeds:
+        seeded = base.copy()  # Reuse the already-processed prefix blocks
+        seeded.update(seed)
+        digests.append(seeded.digest()[:byte_count].hex()[:length])
+    return digests
+
+
+def _torus_math(hz: float, schumann: float) -> Tuple[float, float, float, int]:
+    """Numeric core of the torus field: Schumann ratio, phase angle, coherence and Tesla node"""
+    # Map frequency to the optimal torus ratio based on Earth's Schumann resonance
+    schumann_ratio = hz / schumann
+    
+    # Calculate the phase angle for maximum resonance
+    phase_angle = (hz * 360) % 360
+    
+    # Determine the coherence ratio (based on cardiac coherence principles)
+    coherence = 0.618 * schumann_ratio  # 0.618 is the inverse of the golden ratio
+    
+    # Find the closest Tesla number (3, 6, or 9) for the torus power node;
+    # the midpoints 4.5 and 7.5 go to the lower node
+    remainder = hz % 10
+    if remainder <= 4.5:
+        tesla_node = 3
+    elif remainder <= 7.5:
+        tesla_node = 6
+    else:
+        tesla_node = 9
+    
+    return schumann_ratio, phase_angle, coherence, tesla_node
+
+
+if HAS_NUMBA:
+    # Compile the torus kernel to machine code on first use
+    _torus_math = njit(_torus_math)
+
+
 class SacredGeometryCalculator:
     """Sacred geometry calculations for various fields and patterns"""
     
@@ -306,13 +569,23 @@ class SacredGeometryCalculator:
         intention_hash = hashlib.sha512(intention.encode('utf-8')).hexdigest()
         
         # Use PHI spiral to generate fibonacci-aligned energetic signature
-        phi_segments = []
-        for i in range(len(intention_hash)):
-            char_code = ord(intention_hash[i])
-            segment_value = char_code * (PHI ** ((i % 7) + 1))
-            phi_segments.append(f"{int(segment_value % 100):02d}")
-        
-        amplified = ''.join(phi_segments)
+        if HAS_NUMPY:
+            # Vectorized: scale every hex char code by its PHI power, then
+            # render each value as two ASCII digits in a single buffer
+            char_codes = np.frombuffer(intention_hash.encode('ascii'), dtype=np.uint8)
+            powers = np.resize(PHI_POWERS_ARRAY, len(char_codes))
+            segment_values = ((char_codes * powers) % 100).astype(np.uint8)
+            digits = np.empty((len(char_codes), 2), dtype=np.uint8)
+            digits[:, 0] = segment_values // 10 + ord('0')
+            digits[:, 1] = segment_values % 10 + ord('0')
+            amplified = digits.tobytes().decode('ascii')
+        else:
+            phi_segments = []
+            for i, char in enumerate(intention_hash):
+                segment_value = ord(char) * PHI_POWERS[i % 7]
+                phi_segments.append(f"{int(segment_value % 100):02d}")
+
+            amplified = ''.join(phi_segments)
         
         # Create a phi-spiral encoding with the intention
         spiral_hash_data = amplified + intention
@@ -340,14 +613,12 @@ class SacredGeometryCalculator:
             raise ValueError("Frequency must be positive")
         
         # Create counter-rotating tetrahedrons (male/female energies)
-        tetra_up_data = intention + "ascend"
-        tetra_up = hashlib.sha256(tetra_up_data.encode('utf-8')).hexdigest()[:12]
-        
-        tetra_down_data = intention + "descend"
-        tetra_down = hashlib.sha256(tetra_down_data.encode('utf-8')).hexdigest()[:12]
+        tetra_up, tetra_down = _seeded_hexdigests(
+            hashlib.sha256(intention.encode('utf-8')), (b"ascend", b"descend"), 12
+        )
         
         # Determine the right spin frequency using solfeggio relationship
-        closest_solfeggio = min(SOLFEGGIO, key=lambda x: abs(x - frequency * 100))
+        closest_solfeggio = _closest_value(SOLFEGGIO_SORTED, frequency * 100)
         
         # Calculate the merkaba field intensity (sacred geometry)
         field_intensity = ((frequency * SQRT3) / PHI) * (frequency % 9 or 9)
@@ -375,23 +646,13 @@ class SacredGeometryCalculator:
         cosmic_degree = (now.hour * 15) + (now.minute / 4)  # 24 hours = 360 degrees
         
         # Find planetary alignment
-        closest_planet = "sun"
-        closest_degree = 360
-        
-        for planet, angle in PLANETARY_ANGLES.items():
-            diff = abs(angle - cosmic_degree)
-            if diff < closest_degree:
-                closest_degree = diff
-                closest_planet = planet
+        closest_planet = PLANET_BY_ANGLE[_closest_value(PLANET_ANGLE_TABLE, cosmic_degree)]
         
         # Generate the seven interlocking circles of the Seed of Life
-        seed_patterns = []
-        for i in range(7):
-            angle = i * (360 / 7)
-            radius = (i + 1) * PHI
-            seed_data = f"{intention}:{angle}:{radius}"
-            seed_hash = hashlib.sha256(seed_data.encode('utf-8')).hexdigest()[:8]
-            seed_patterns.append(seed_hash)
+        # (each seed encodes the circle's angle and PHI radius)
+        seed_patterns = _seeded_hexdigests(
+            hashlib.sha256(intention.encode('utf-8')), SEED_OF_LIFE_SEEDS, 8
+        )
         
         # Create the full Flower of Life pattern with 19 overlapping circles
         fol_pattern = ''.join(seed_patterns)
@@ -415,13 +676,10 @@ class SacredGeometryCalculator:
             raise ValueError("Intention cannot be empty")
         
         # The 13 spheres of Metatron's Cube (Archangel Metatron's energy)
-        intention_spheres = []
-        
         # Create the 13 information spheres in the pattern of Metatron's Cube
-        for i in range(13):
-            sphere_data = intention + str(METATRON[i % len(METATRON)])
-            sphere_hash = hashlib.sha512(sphere_data.encode('utf-8')).hexdigest()[:6]
-            intention_spheres.append(sphere_hash)
+        intention_spheres = _seeded_hexdigests(
+            hashlib.sha512(intention.encode('utf-8')), METATRON_SPHERE_SEEDS, 6
+        )
         
         # Connect the spheres with 78 lines representing consciousness pathways
         if boost:
@@ -448,6 +706,14 @@ class SacredGeometryCalculator:
             "activation_key": f"{harmonic * 3}-{harmonic * 6}-{harmonic * 9}"
         }
     
+    @staticmethod
+    def batch_metatrons_cube(intentions: List[str], boost: bool = False) -> List[Dict[str, Any]]:
+        """Generate Metatron's Cube data for many intentions (batch/CLI mode)"""
+        return [
+            SacredGeometryCalculator.metatrons_cube_amplifier(intention, boost)
+            for intention in intentions
+        ]
+    
     @staticmethod
     def torus_field_generator(intention: str, hz: float = SCHUMANN_RESONANCE) -> Dict[str, Any]:
         """Generate torus field data based on intention and frequency"""
@@ -456,25 +722,13 @@ class SacredGeometryCalculator:
         if hz <= 0:
             raise ValueError("Frequency must be positive")
         
-        # Map frequency to the optimal torus ratio based on Earth's Schumann resonance
-        schumann_ratio = hz / SCHUMANN_RESONANCE
+        # Schumann ratio, phase angle, coherence and Tesla power node
+        schumann_ratio, phase_angle, coherence, tesla_node = _torus_math(hz, SCHUMANN_RESONANCE)
         
         # Generate the torus inner and outer flows (energy circulation patterns)
-        inner_flow_data = intention + "inner"
-        inner_flow = hashlib.sha512(inner_flow_data.encode('utf-8')).hexdigest()[:12]
-        
-        outer_flow_data = intention + "outer"
-        outer_flow = hashlib.sha512(outer_flow_data.encode('utf-8')).hexdigest()[:12]
-        
-        # Calculate the phase angle for maximum resonance
-        phase_angle = (hz * 360) % 360
-        
-        # Determine the coherence ratio (based on cardiac coherence principles)
-        coherence = 0.618 * schumann_ratio  # 0.618 is the inverse of the golden ratio
-        
-        # Find the closest Tesla number (3, 6, or 9) for the torus power node
-        tesla_nodes = [3, 6, 9]
-        tesla_node = min(tesla_nodes, key=lambda x: abs(x - (hz % 10)))
+        inner_flow, outer_flow = _seeded_hexdigests(
+            hashlib.sha512(intention.encode('utf-8')), (b"inner", b"outer"), 12
+        )
         
         return {
             "intention": intention,
@@ -495,31 +749,23 @@ class SacredGeometryCalculator:
             raise ValueError("Intention cannot be empty")
         
         # The 9 interlocking triangles of the Sri Yantra
-        triangles = []
-        
-        for i in range(9):
-            if i % 2 == 0:  # Shiva (masculine) triangles point downward
-                triangle_data = intention + f"shiva{i}"
-            else:  # Shakti (feminine) triangles point upward
-                triangle_data = intention + f"shakti{i}"
-            
-            triangle_hash = hashlib.sha256(triangle_data.encode('utf-8')).hexdigest()[:8]
-            triangles.append(triangle_hash)
+        # (even: Shiva triangles point downward, odd: Shakti triangles point upward)
+        intention_hash = hashlib.sha256(intention.encode('utf-8'))
+        triangles = _seeded_hexdigests(intention_hash, SRI_YANTRA_TRIANGLE_SEEDS, 8)
         
         # Generate the 43 intersecting points of power (marmas)
         marma_data = ''.join(triangles)
         marma_points = hashlib.sha512(marma_data.encode('utf-8')).hexdigest()
         
         # Calculate the central bindu point (singularity/unity consciousness)
-        bindu_data = intention + "bindu"
-        bindu = hashlib.sha256(bindu_data.encode('utf-8')).hexdigest()[:9]
+        bindu = _seeded_hexdigests(intention_hash, (b"bindu",), 9)[0]
         
         # Map to the 9 surrounding circuits (avaranas) for complete encoding
-        circuits = []
-        for i in range(9):
-            circuit_data = triangles[i] + bindu
-            circuit = hashlib.sha256(circuit_data.encode('utf-8')).hexdigest()[:6]
-            circuits.append(circuit)
+        bindu_bytes = bindu.encode('utf-8')
+        circuits = [
+            hashlib.sha256(triangle.encode('utf-8') + bindu_bytes).digest()[:3].hex()
+            for triangle in triangles
+        ]
         
         return {
             "intention": intention,
@@ -540,38 +786,39 @@ class SacredGeometryCalculator:
         """
         if not intention:
             raise ValueError("Intention cannot be empty")
-            
-        # Properties of the platonic solids (vertices, edges, faces)
-        platonic_properties = {
-            "tetrahedron": {"vertices": 4, "edges": 6, "faces": 4, "element": "fire"},
-            "hexahedron": {"vertices": 8, "edges": 12, "faces": 6, "element": "earth"},
-            "octahedron": {"vertices": 6, "edges": 12, "faces": 8, "element": "air"},
-            "dodecahedron": {"vertices": 20, "edges": 30, "faces": 12, "element": "ether"},
-            "icosahedron": {"vertices": 12, "edges": 30, "faces": 20, "element": "water"}
-        }
         
-        if solid_type not in platonic_properties:
+        if solid_type not in PLATONIC_PROPERTIES:
             solid_type = "dodecahedron"  # Default to ether element
         
-        properties = platonic_properties[solid_type]
+        properties = PLATONIC_PROPERTIES[solid_type]
+        vertex_count = properties["vertices"]
         
-        # Generate vertex encodings (information nodes)
-        vertices = []
-        for i in range(properties["vertices"]):
-            v_hash = hashlib.sha256((intention + f"v{i}").encode()).hexdigest()[:6]
-            vertices.append(v_hash)
+        # Only the first PLATONIC_OUTPUT_LIMIT vertices, edges and faces are
+        # reported, so only the elements those depend on are hashed
         
-        # Create the edge connections (information pathways)
-        edges = []
-        for i in range(properties["edges"]):
-            e_hash = hashlib.sha256((vertices[i % len(vertices)] + vertices[(i+1) % len(vertices)]).encode()).hexdigest()[:4]
-            edges.append(e_hash)
+        # Generate vertex encodings (information nodes); the reported edges
+        # reach one vertex past the reported ones
+        intention_bytes = intention.encode('utf-8')
+        vertices = _seeded_hexdigests(
+            hashlib.sha256(intention_bytes),
+            PLATONIC_VERTEX_SEEDS[:min(vertex_count, PLATONIC_OUTPUT_LIMIT + 1)],
+            6
+        )
         
-        # Generate the face encodings (manifestation planes)
-        faces = []
-        for i in range(properties["faces"]):
-            f_hash = hashlib.sha256((edges[i % len(edges)] + intention).encode()).hexdigest()[:6]
-            faces.append(f_hash)
+        # Create the edge connections (information pathways); edge i joins
+        # vertex i and i+1 (mod V), so only V distinct edge hashes exist
+        edge_hashes = [
+            hashlib.sha256((vertices[i] + vertices[(i + 1) % vertex_count]).encode()).digest()[:2].hex()
+            for i in range(min(vertex_count, PLATONIC_OUTPUT_LIMIT))
+        ]
+        edges = [edge_hashes[i % vertex_count] for i in range(min(properties["edges"], PLATONIC_OUTPUT_LIMIT))]
+        
+        # Generate the face encodings (manifestation planes); every solid has
+        # more edges than reported faces, so face i uses edge i
+        faces = [
+            hashlib.sha256(edge.encode('utf-8') + intention_bytes).digest()[:3].hex()
+            for edge in edges[:properties["faces"]]
+        ]
         
         # Calculate the resonance frequency based on the element
         element_frequency = ELEMENT_FREQUENCIES[properties["element"]]
@@ -583,31 +830,283 @@ class SacredGeometryCalculator:
             "intention": intention,
             "solid_type": solid_type,
             "element": properties["element"],
-            "vertices": vertices[:5],  # Limiting output size
-            "edges": edges[:5],  # Limiting output size
-            "faces": faces[:5],  # Limiting output size
+            "vertices": vertices[:PLATONIC_OUTPUT_LIMIT],  # Limiting output size
+            "edges": edges,
+            "faces": faces,
             "element_frequency": element_frequency,
             "activation_code": activation_code,
             "harmonic_pattern": "".join(vertices[:3]) + "".join(faces[:3])
         }
 
+# Pure (time-independent) generator results are memoized as JSON bodies per
+# argument tuple, only for intentions up to GEOMETRY_CACHE_MAX_INTENTION characters
+GEOMETRY_CACHE_SIZE = 4096
+GEOMETRY_CACHE_MAX_INTENTION = 256
+
+# Decimal places numeric geometry options (frequency, multiplier) are rounded to
+GEOMETRY_OPTION_DIGITS = 4
+
+
+# Field type -> generator taking the intention and keyword options
+# (frequency, boost, duration, solid_type); unused options are ignored
+FIELD_GENERATORS: Dict[str, Callable[..., Dict[str, Any]]] = {
+    "torus": lambda intention, frequency=SCHUMANN_RESONANCE, **_: (
+        SacredGeometryCalculator.torus_field_generator(intention, float(frequency))),
+    "merkaba": lambda intention, frequency=SCHUMANN_RESONANCE, **_: (
+        SacredGeometryCalculator.merkaba_field_generator(intention, float(frequency))),
+    "metatron": lambda intention, boost=False, **_: (
+        SacredGeometryCalculator.metatrons_cube_amplifier(intention, boost)),
+    "sri_yantra": lambda intention, **_: (
+        SacredGeometryCalculator.sri_yantra_encoder(intention)),
+    "flower_of_life": lambda intention, duration=60, **_: (
+        SacredGeometryCalculator.flower_of_life_pattern(intention, int(duration))),
+    "platonic_solid": lambda intention, solid_type='dodecahedron', **_: (
+        SacredGeometryCalculator.platonic_solid_resonator(intention, solid_type)),
+}
+
 
 #########################################
 # STORAGE IMPLEMENTATION
 #########################################
 
+# INSERT ... RETURNING is available from SQLite 3.35
+HAS_SQLITE_RETURNING = sqlite3.sqlite_version_info >= (3, 35, 0)
+
+# Selected columns of the record tables, in result dict order
+SOUL_ARCHIVE_COLUMNS = ('id', 'title', 'description', 'intention', 'frequency',
+                        'boost', 'multiplier', 'pattern_type', 'pattern_data',
+                        'user_id', 'created_at')
+PAST_LIFE_INSIGHT_COLUMNS = ('id', 'user_id', 'past_life_pattern', 'life_period',
+                             'key_lesson', 'resolution_code', 'created_at')
+ENVIRONMENTAL_ANCHOR_COLUMNS = ('id', 'location_name', 'coordinates', 'intention',
+                                'field_type', 'field_data', 'activation_code', 'created_at')
+
+SOUL_ARCHIVE_SELECT = f"SELECT {', '.join(SOUL_ARCHIVE_COLUMNS)} FROM soul_archive"
+PAST_LIFE_INSIGHT_SELECT = f"SELECT {', '.join(PAST_LIFE_INSIGHT_COLUMNS)} FROM past_life_insights"
+ENVIRONMENTAL_ANCHOR_SELECT = f"SELECT {', '.join(ENVIRONMENTAL_ANCHOR_COLUMNS)} FROM environmental_anchoring"
+
+# Hot statements built once, so every call hands SQLite's statement cache the same text
+SOUL_ARCHIVES_SQL = f'{SOUL_ARCHIVE_SELECT} ORDER BY created_at DESC'
+SOUL_ARCHIVE_BY_ID_SQL = f'{SOUL_ARCHIVE_SELECT} WHERE id = ?'
+PAST_LIFE_INSIGHTS_SQL = f'{PAST_LIFE_INSIGHT_SELECT} ORDER BY created_at DESC'
+PAST_LIFE_INSIGHTS_BY_USER_SQL = f'{PAST_LIFE_INSIGHT_SELECT} WHERE user_id = ? ORDER BY created_at DESC'
+ENVIRONMENTAL_ANCHORS_SQL = f'{ENVIRONMENTAL_ANCHOR_SELECT} ORDER BY created_at DESC'
+DATA_VERSION_SQL = 'SELECT epoch, version FROM db_version WHERE id = 0'
+HEALING_CODE_INSERT_SQL = (
+    'INSERT INTO healing_code (code, description, category, affirmation, vibration, source) '
+    'VALUES (?, ?, ?, ?, ?, ?)'
+)
+
+# Prepared statements kept per connection (sqlite3 defaults to 128)
+SQLITE_CACHED_STATEMENTS = 256
+
+# Idle SQLite connections kept for reuse by new threads
+SQLITE_POOL_SIZE = 8
+
+# Tables whose writes bump the db_version counter (see SacredStorage.data_version)
+VERSIONED_TABLES = ('users', 'soul_archive', 'healing_code', 'past_life_insights', 'environmental_anchoring')
+
+
+@functools.lru_cache(maxsize=None)
+def _insert_statements(table: str, columns: Tuple[str, ...], sql: str) -> Tuple[str, str]:
+    """Build an INSERT's RETURNING form (or plain form plus re-select) once per statement"""
+    column_list = ', '.join(columns)
+    if HAS_SQLITE_RETURNING:
+        return f'{sql} RETURNING {column_list}', ''
+    return sql, f'SELECT {column_list} FROM {table} WHERE id = ?'
+
+
+# Rows per executemany() call when bulk-inserting healing codes
+HEALING_CODE_BATCH_SIZE = 10000
+
+# Below this many keywords repeated str.find scans beat building an Aho-Corasick automaton
+AHOCORASICK_MIN_KEYWORDS = 5
+
+# Related description keywords for healing recommendations
+BODY_AREA_KEYWORDS = {
+    'head': ('headache', 'migraine', 'brain', 'skull', 'mind'),
+    'back': ('spine', 'back pain', 'vertebrae', 'posture'),
+    'heart': ('cardiac', 'chest', 'circulation', 'blood pressure'),
+    'stomach': ('digestion', 'intestine', 'gut', 'abdomen'),
+    'throat': ('voice', 'speech', 'throat chakra', 'thyroid'),
+    'eye': ('vision', 'sight', 'perception'),
+    'ear': ('hearing', 'balance', 'sound'),
+}
+EMOTIONAL_KEYWORDS = {
+    'anxiety': ('stress', 'worry', 'tension', 'nervousness'),
+    'depression': ('sadness', 'melancholy', 'grief', 'sorrow'),
+    'anger': ('rage', 'irritation', 'frustration', 'temper'),
+    'fear': ('phobia', 'terror', 'dread', 'insecurity'),
+    'love': ('heart', 'connection', 'relationship', 'bonding'),
+    'confidence': ('self-esteem', 'worth', 'value', 'belief'),
+    'peace': ('calm', 'serenity', 'tranquility', 'quiet'),
+}
+# Fallback keywords for general wellbeing codes
+GENERAL_WELLBEING_KEYWORDS = ('general', 'wellbeing', 'balance')
+
+
+def _keyword_pattern(keywords: Iterable[str]) -> 're.Pattern[str]':
+    """Compile one alternation matching any of the (non-empty) keywords at the start of a word"""
+    # Anchoring at word starts avoids matches inside other words ("ear" in "heart")
+    # while still matching inflections ("headache" in "headaches") and phrases
+    keywords = sorted(set(keywords), key=lambda keyword: (-len(keyword), keyword))
+    return re.compile(r'(?<!\w)(?:' + '|'.join(map(re.escape, keywords)) + ')')
+
+
+# One precompiled alternation per known body area and emotional state,
+# covering the name itself and its related keywords
+BODY_AREA_PATTERNS = {
+    area: _keyword_pattern((area, *keywords)) for area, keywords in BODY_AREA_KEYWORDS.items()
+}
+EMOTIONAL_PATTERNS = {
+    state: _keyword_pattern((state, *keywords)) for state, keywords in EMOTIONAL_KEYWORDS.items()
+}
+GENERAL_WELLBEING_PATTERN = _keyword_pattern(GENERAL_WELLBEING_KEYWORDS)
+
+# Healing recommendations remembered per code index, keyed by request inputs
+RECOMMENDATION_CACHE_SIZE = 1024
+
+
+class _ConnectionLease:
+    """Thread-local handle on a pooled connection; released when its thread ends"""
+    
+    def __init__(self, conn: sqlite3.Connection):
+        self.conn = conn
+
+
 class SacredStorage:
     """Storage for healing codes, soul archives, and users"""
     
-    def __init__(self, db_path: str = 'sacred_healing.db'):
+    def __init__(self, db_path: str = 'sacred_healing.db', pool_size: int = SQLITE_POOL_SIZE):
         self.db_path = db_path
+
+        # Each thread leases one connection (SQLite connections are not
+        # thread-safe); when the thread ends its connection goes back to a
+        # bounded idle pool so the next thread reuses it with a warm cache
+        self._local = threading.local()
+        self._idle = queue.LifoQueue(maxsize=pool_size)
+        self._connections = []
+        self._connections_lock = threading.RLock()
+        atexit.register(self.close)
+
+        # In-memory healing code index, built lazily on first lookup and
+        # rebuilt when the database's data_version moves
+        self._codes_lock = threading.Lock()
+        self._codes_index = None
+
+        # Forked server workers must not share the parent's SQLite handles
+        if hasattr(os, 'register_at_fork'):
+            forget = weakref.WeakMethod(self._forget_connections)
+            
+            def after_fork():
+                method = forget()
+                if method is not None:
+                    method()
+            
+            os.register_at_fork(after_in_child=after_fork)
+
         self._setup_database()
-    
+
+    def _conn(self) -> sqlite3.Connection:
+        """Get the calling thread's connection, leasing one from the pool on first use"""
+        lease = getattr(self._local, 'lease', None)
+        if lease is None:
+            try:
+                conn = self._idle.get_nowait()
+            except queue.Empty:
+                conn = self._open_connection()
+            lease = _ConnectionLease(conn)
+            weakref.finalize(lease, self._release, conn)
+            self._local.lease = lease
+        return lease.conn
+
+    def _open_connection(self) -> sqlite3.Connection:
+        """Open and configure a new connection"""
+        conn = sqlite3.connect(
+            self.db_path, check_same_thread=False, cached_statements=SQLITE_CACHED_STATEMENTS
+        )
+        conn.execute('PRAGMA journal_mode=WAL')
+        conn.execute('PRAGMA synchronous=NORMAL')
+        conn.execute('PRAGMA temp_store=MEMORY')
+        conn.execute('PRAGMA cache_size=-131072')  # ~128MB page cache
+        conn.execute('PRAGMA mmap_size=268435456')  # Map up to 256MB instead of read() per page
+        conn.execute('PRAGMA busy_timeout=5000')
+        with self._connections_lock:
+            self._connections.append(conn)
+        return conn
+
+    def _release(self, conn: sqlite3.Connection) -> None:
+        """Return a finished thread's connection to the idle pool, closing it if the pool is full"""
+        with self._connections_lock:
+            if conn not in self._connections:
+                return  # Already closed by close()
+            if conn.in_transaction:
+                conn.rollback()
+            try:
+                self._idle.put_nowait(conn)
+                return
+            except queue.Full:
+                self._connections.remove(conn)
+        conn.close()
+
+    def _forget_connections(self) -> None:
+        """Drop (without closing) connections inherited from the parent process after a fork"""
+        self._local = threading.local()
+        self._idle = queue.LifoQueue(maxsize=self._idle.maxsize)
+        self._connections = []
+        self._connections_lock = threading.RLock()
+
+    def _insert_row(
+        self,
+        conn: sqlite3.Connection,
+        table: str,
+        columns: Tuple[str, ...],
+        sql: str,
+        params: Tuple
+    ) -> Dict[str, Any]:
+        """Run an INSERT, commit it and return the new row as a dict (RETURNING when supported)"""
+        cursor = conn.cursor()
+        insert_sql, select_sql = _insert_statements(table, columns, sql)
+        cursor.execute(insert_sql, params)
+        if HAS_SQLITE_RETURNING:
+            row = cursor.fetchall()[0]
+            conn.commit()
+        else:
+            conn.commit()
+            cursor.execute(select_sql, (cursor.lastrowid,))
+            row = cursor.fetchone()
+        return dict(zip(columns, row))
+
+    def close(self):
+        """Close all pooled connections"""
+        with self._connections_lock:
+            for conn in self._connections:
+                conn.close()
+            self._connections.clear()
+            while not self._idle.empty():
+                self._idle.get_nowait()
+        self._local = threading.local()
+    
+    def data_version(self) -> str:
+        """
+        Get a token that changes whenever any connection or process commits a data change
+        
+        Read from the db_version row on the calling thread's own connection,
+        so concurrent checks never wait on one another.
+        """
+        epoch, version = self._conn().execute(DATA_VERSION_SQL).fetchone()
+        return f"{epoch}:{version}"
+
     def _setup_database(self):
         """Set up database tables if they don't exist"""
-        conn = sqlite3.connect(self.db_path)
+        conn = self._conn()
         cursor = conn.cursor()
         
+        # Create the schema and seed data in a single transaction, skipping
+        # fsyncs for this one-shot bootstrap
+        cursor.execute('PRAGMA synchronous=OFF')
+        cursor.execute('BEGIN IMMEDIATE')
+        
         # Users table
         cursor.execute('''
         CREATE TABLE IF NOT EXISTS users (
@@ -677,7 +1176,17 @@ class SacredStorage:
         )
         ''')
         
-        conn.commit()
+        # Indexes for the category filter and per-user lookups
+        cursor.execute('CREATE INDEX IF NOT EXISTS idx_healing_category ON healing_code(category)')
+        cursor.execute('CREATE INDEX IF NOT EXISTS idx_soul_user ON soul_archive(user_id)')
+        cursor.execute('CREATE INDEX IF NOT EXISTS idx_past_life_user ON past_life_insights(user_id, created_at)')
+        
+        # Substring search index over healing codes (created before seeding
+        # so its triggers index the seeded rows)
+        self._has_code_fts = self._create_code_fts(cursor)
+        
+        # Change counter bumped on every write to the data tables
+        self._create_version_counter(cursor)
         
         # Initialize with sample healing codes if table is empty
         cursor.execute('SELECT COUNT(*) FROM healing_code')
@@ -685,7 +1194,77 @@ class SacredStorage:
         if count == 0:
             self._initialize_healing_codes(cursor, conn)
         
-        conn.close()
+        conn.commit()
+        cursor.execute('PRAGMA synchronous=NORMAL')
+    
+    def _create_version_counter(self, cursor):
+        """Create the db_version row and the triggers that bump it whenever a data table changes"""
+        cursor.execute('''
+        CREATE TABLE IF NOT EXISTS db_version (
+            id INTEGER PRIMARY KEY CHECK (id = 0),
+            epoch TEXT NOT NULL,
+            version INTEGER NOT NULL
+        )
+        ''')
+        
+        # A random epoch per database file, so versions never repeat if the file is recreated
+        cursor.execute('INSERT OR IGNORE INTO db_version (id, epoch, version) VALUES (0, ?, 0)', (uuid.uuid4().hex,))
+        
+        for table in VERSIONED_TABLES:
+            for event in ('INSERT', 'UPDATE', 'DELETE'):
+                cursor.execute(f'''
+                CREATE TRIGGER IF NOT EXISTS {table}_version_{event.lower()} AFTER {event} ON {table} BEGIN
+                    UPDATE db_version SET version = version + 1 WHERE id = 0;
+                END
+                ''')
+    
+    def _create_code_fts(self, cursor) -> bool:
+        """Create the trigram FTS5 index over healing codes, returning False if SQLite lacks it"""
+        cursor.execute("SELECT 1 FROM sqlite_master WHERE type = 'table' AND name = 'healing_code_fts'")
+        if cursor.fetchone():
+            return True
+        
+        cursor.execute('SAVEPOINT code_fts')
+        try:
+            # External-content table over healing_code, kept in sync by triggers
+            cursor.execute('''
+            CREATE VIRTUAL TABLE healing_code_fts USING fts5(
+                code, description, category,
+                content='healing_code', content_rowid='id', tokenize='trigram'
+            )
+            ''')
+            cursor.execute('''
+            CREATE TRIGGER healing_code_fts_insert AFTER INSERT ON healing_code BEGIN
+                INSERT INTO healing_code_fts (rowid, code, description, category)
+                VALUES (new.id, new.code, new.description, new.category);
+            END
+            ''')
+            cursor.execute('''
+            CREATE TRIGGER healing_code_fts_delete AFTER DELETE ON healing_code BEGIN
+                INSERT INTO healing_code_fts (healing_code_fts, rowid, code, description, category)
+                VALUES ('delete', old.id, old.code, old.description, old.category);
+            END
+            ''')
+            cursor.execute('''
+            CREATE TRIGGER healing_code_fts_update AFTER UPDATE ON healing_code BEGIN
+                INSERT INTO healing_code_fts (healing_code_fts, rowid, code, description, category)
+                VALUES ('delete', old.id, old.code, old.description, old.category);
+                INSERT INTO healing_code_fts (rowid, code, description, category)
+                VALUES (new.id, new.code, new.description, new.category);
+            END
+            ''')
+            
+            # Index any codes that predate the FTS table
+            cursor.execute("INSERT INTO healing_code_fts (healing_code_fts) VALUES ('rebuild')")
+        except sqlite3.OperationalError as e:
+            # FTS5 or the trigram tokenizer (SQLite 3.34+) is not available
+            logger.warning(f"Healing code full-text index unavailable, using LIKE search: {e}")
+            cursor.execute('ROLLBACK TO code_fts')
+            cursor.execute('RELEASE code_fts')
+            return False
+        
+        cursor.execute('RELEASE code_fts')
+        return True
     
     def _initialize_healing_codes(self, cursor, conn):
         """Initialize with healing codes from attached file"""
@@ -695,6 +1274,10 @@ class SacredStorage:
             return
         
         try:
+            # Roll back to here if the file can't be loaded, so the sample
+            # codes go into a clean table
+            cursor.execute('SAVEPOINT file_codes')
+            
             healing_codes = []
             current_category = "UNCATEGORIZED"
             current_subcategory = ""
@@ -740,20 +1323,25 @@ class SacredStorage:
                             current_subcategory if current_subcategory else "Divine Healing Codes"
                         ))
             
-            # If we have healing codes, insert them
+            # If we have healing codes, insert them (the file repeats some
+            # codes; the first occurrence wins)
             if healing_codes:
                 cursor.executemany(
-                    'INSERT INTO healing_code (code, description, category, affirmation, vibration, source) VALUES (?, ?, ?, ?, ?, ?)',
+                    'INSERT OR IGNORE INTO healing_code (code, description, category, affirmation, vibration, source) VALUES (?, ?, ?, ?, ?, ?)',
                     healing_codes
                 )
-                conn.commit()
-                print(f"Loaded {len(healing_codes)} healing codes from file")
+                loaded = cursor.rowcount
+                cursor.execute('RELEASE file_codes')
+                print(f"Loaded {loaded} healing codes from file")
             else:
                 # Fallback to sample codes if no codes were parsed from file
+                cursor.execute('RELEASE file_codes')
                 self._load_sample_codes(cursor, conn)
                 
         except Exception as e:
             print(f"Error loading healing codes from file: {str(e)}")
+            cursor.execute('ROLLBACK TO file_codes')
+            cursor.execute('RELEASE file_codes')
             # Fallback to sample codes
             self._load_sample_codes(cursor, conn)
     
@@ -781,20 +1369,18 @@ class SacredStorage:
         ]
         
         cursor.executemany(
-            'INSERT INTO healing_code (code, description, category, affirmation, vibration, source) VALUES (?, ?, ?, ?, ?, ?)',
+            HEALING_CODE_INSERT_SQL,
             sample_codes
         )
-        conn.commit()
         print("Loaded sample healing codes")
     
     # User methods
     def get_user(self, user_id: int) -> Optional[Dict[str, Any]]:
         """Get user by ID"""
-        conn = sqlite3.connect(self.db_path)
+        conn = self._conn()
         cursor = conn.cursor()
         cursor.execute('SELECT id, username, created_at FROM users WHERE id = ?', (user_id,))
         row = cursor.fetchone()
-        conn.close()
         
         if row:
             return {
@@ -806,11 +1392,10 @@ class SacredStorage:
     
     def get_user_by_username(self, username: str) -> Optional[Dict[str, Any]]:
         """Get user by username"""
-        conn = sqlite3.connect(self.db_path)
+        conn = self._conn()
         cursor = conn.cursor()
         cursor.execute('SELECT id, username, created_at FROM users WHERE username = ?', (username,))
         row = cursor.fetchone()
-        conn.close()
         
         if row:
             return {
@@ -822,7 +1407,7 @@ class SacredStorage:
     
     def create_user(self, username: str, password: str) -> Dict[str, Any]:
         """Create a new user"""
-        conn = sqlite3.connect(self.db_path)
+        conn = self._conn()
         cursor = conn.cursor()
         
         # Hash the password (in a real system, use better password hashing)
@@ -834,7 +1419,6 @@ class SacredStorage:
         )
         user_id = cursor.lastrowid
         conn.commit()
-        conn.close()
         
         return {
             'id': user_id,
@@ -842,42 +1426,49 @@ class SacredStorage:
         }
     
     # Soul Archive methods
-    def get_soul_archives(self) -> List[Dict[str, Any]]:
+    @staticmethod
+    def _json_column_decoder(raw_json: bool) -> Callable[[str], Any]:
+        """Decoder for stored JSON columns; raw_json keeps them serialized for orjson responses"""
+        return orjson.Fragment if raw_json and HAS_RAW_JSON else _loads
+    
+    def get_soul_archives(self, raw_json: bool = False) -> List[Dict[str, Any]]:
         """Get all soul archives"""
-        conn = sqlite3.connect(self.db_path)
+        conn = self._conn()
         cursor = conn.cursor()
-        cursor.execute('SELECT * FROM soul_archive ORDER BY created_at DESC')
+        cursor.execute(SOUL_ARCHIVES_SQL)
         rows = cursor.fetchall()
-        conn.close()
-        
-        columns = ['id', 'title', 'description', 'intention', 'frequency', 
-                 'boost', 'multiplier', 'pattern_type', 'pattern_data', 
-                 'user_id', 'created_at']
         
-        archives = []
-        for row in rows:
-            archive = dict(zip(columns, row))
-            archive['boost'] = bool(archive['boost'])
-            archive['pattern_data'] = json.loads(archive['pattern_data'])
-            archives.append(archive)
+        # Decode the pattern_data column in one pass, then assemble rows
+        patterns = list(map(self._json_column_decoder(raw_json), [row[8] for row in rows]))
         
-        return archives
+        return [
+            {
+                'id': row[0],
+                'title': row[1],
+                'description': row[2],
+                'intention': row[3],
+                'frequency': row[4],
+                'boost': bool(row[5]),
+                'multiplier': row[6],
+                'pattern_type': row[7],
+                'pattern_data': pattern_data,
+                'user_id': row[9],
+                'created_at': row[10]
+            }
+            for row, pattern_data in zip(rows, patterns)
+        ]
     
-    def get_soul_archive_by_id(self, archive_id: int) -> Optional[Dict[str, Any]]:
+    def get_soul_archive_by_id(self, archive_id: int, raw_json: bool = False) -> Optional[Dict[str, Any]]:
         """Get soul archive by ID"""
-        conn = sqlite3.connect(self.db_path)
+        conn = self._conn()
         cursor = conn.cursor()
-        cursor.execute('SELECT * FROM soul_archive WHERE id = ?', (archive_id,))
+        cursor.execute(SOUL_ARCHIVE_BY_ID_SQL, (archive_id,))
         row = cursor.fetchone()
-        conn.close()
         
         if row:
-            columns = ['id', 'title', 'description', 'intention', 'frequency', 
-                     'boost', 'multiplier', 'pattern_type', 'pattern_data', 
-                     'user_id', 'created_at']
-            archive = dict(zip(columns, row))
+            archive = dict(zip(SOUL_ARCHIVE_COLUMNS, row))
             archive['boost'] = bool(archive['boost'])
-            archive['pattern_data'] = json.loads(archive['pattern_data'])
+            archive['pattern_data'] = self._json_column_decoder(raw_json)(archive['pattern_data'])
             return archive
         return None
     
@@ -894,10 +1485,12 @@ class SacredStorage:
         user_id: Optional[int] = None
     ) -> Dict[str, Any]:
         """Create a new soul archive"""
-        conn = sqlite3.connect(self.db_path)
-        cursor = conn.cursor()
+        conn = self._conn()
         
-        cursor.execute(
+        archive = self._insert_row(
+            conn,
+            'soul_archive',
+            SOUL_ARCHIVE_COLUMNS,
             '''
             INSERT INTO soul_archive 
             (title, description, intention, frequency, boost, multiplier, pattern_type, pattern_data, user_id) 
@@ -911,101 +1504,347 @@ class SacredStorage:
                 1 if boost else 0, 
                 multiplier, 
                 pattern_type, 
-                json.dumps(pattern_data),
+                _dumps(pattern_data),
                 user_id
             )
         )
-        archive_id = cursor.lastrowid
-        conn.commit()
-        
-        # Get the created archive with datetime
-        cursor.execute('SELECT * FROM soul_archive WHERE id = ?', (archive_id,))
-        row = cursor.fetchone()
-        conn.close()
         
-        columns = ['id', 'title', 'description', 'intention', 'frequency', 
-                 'boost', 'multiplier', 'pattern_type', 'pattern_data', 
-                 'user_id', 'created_at']
-        archive = dict(zip(columns, row))
         archive['boost'] = bool(archive['boost'])
-        archive['pattern_data'] = json.loads(archive['pattern_data'])
+        archive['pattern_data'] = _loads(archive['pattern_data'])
         
         return archive
     
     def delete_soul_archive(self, archive_id: int) -> bool:
         """Delete a soul archive"""
-        conn = sqlite3.connect(self.db_path)
+        conn = self._conn()
         cursor = conn.cursor()
         cursor.execute('DELETE FROM soul_archive WHERE id = ?', (archive_id,))
         deleted = cursor.rowcount > 0
         conn.commit()
-        conn.close()
         return deleted
     
     # Healing Code methods
+    def _healing_codes_index(self) -> Dict[str, Any]:
+        """Get the cached healing code index, loading every row in one query on first use
+        
+        Writes from any connection or process move the database's data_version,
+        which makes the next lookup reload the index.
+        """
+        # Read before loading, so a write racing the load triggers another reload
+        version = self.data_version()
+        index = self._codes_index
+        if index is not None and index['data_version'] == version:
+            return index
+        
+        with self._codes_lock:
+            index = self._codes_index
+            if index is None or index['data_version'] != version:
+                conn = self._conn()
+                cursor = conn.cursor()
+                cursor.execute('SELECT id, code, description, category, affirmation, vibration, source FROM healing_code')
+                
+                codes = []
+                by_id = {}
+                by_code = {}
+                by_category = defaultdict(list)
+                for row in cursor.fetchall():
+                    entry = {
+                        'id': row[0],
+                        'code': row[1],
+                        'description': row[2],
+                        'category': row[3],
+                        'affirmation': row[4],
+                        'vibration': row[5],
+                        'source': row[6]
+                    }
+                    codes.append(entry)
+                    by_id[entry['id']] = entry
+                    by_code.setdefault(entry['code'], entry)
+                    by_category[entry['category']].append(entry)
+                
+                # Lowercased descriptions joined into one NUL-separated blob so keyword
+                # matching is a single C-level scan instead of a per-code Python loop
+                descriptions_lower = [c['description'].lower() for c in codes]
+                description_starts = []
+                offset = 0
+                for description in descriptions_lower:
+                    description_starts.append(offset)
+                    offset += len(description) + 1
+                
+                index = {
+                    'data_version': version,
+                    'codes': codes,
+                    'by_id': by_id,
+                    'by_code': by_code,
+                    'by_category': by_category,
+                    'fuzzy_choices': None,  # Built by the first fuzzy search
+                    'descriptions_lower': descriptions_lower,
+                    'description_blob': '\x00'.join(descriptions_lower),
+                    'description_starts': description_starts,
+                    'recommendations': {},  # Recommended code positions, keyed by request inputs
+                    'json': {}  # Encoded list responses, keyed by category (None = all)
+                }
+                # The general wellbeing fallback is static, so match it once per load
+                index['general_positions'] = tuple(self._pattern_positions(index, GENERAL_WELLBEING_PATTERN))
+                self._codes_index = index
+            return index
+    
+    def invalidate_codes_cache(self) -> None:
+        """Drop the in-memory healing code index so the next lookup reloads it"""
+        with self._codes_lock:
+            self._codes_index = None
+    
+    @property
+    def all_codes(self) -> List[Dict[str, Any]]:
+        """Cached healing code rows shared with the index, without per-call copies (treat as read-only)"""
+        return self._healing_codes_index()['codes']
+    
     def get_healing_codes(self) -> List[Dict[str, Any]]:
         """Get all healing codes"""
-        conn = sqlite3.connect(self.db_path)
-        cursor = conn.cursor()
-        cursor.execute('SELECT id, code, description, category, affirmation, vibration, source FROM healing_code')
-        rows = cursor.fetchall()
-        conn.close()
-        
-        return [
-            {
-                'id': row[0],
-                'code': row[1],
-                'description': row[2],
-                'category': row[3],
-                'affirmation': row[4],
-                'vibration': row[5],
-                'source': row[6]
-            }
-            for row in rows
-        ]
+        return [dict(entry) for entry in self._healing_codes_index()['codes']]
     
     def get_healing_codes_by_category(self, category: str) -> List[Dict[str, Any]]:
         """Get healing codes by category"""
-        conn = sqlite3.connect(self.db_path)
-        cursor = conn.cursor()
-        cursor.execute(
-            'SELECT id, code, description, category, affirmation, vibration, source FROM healing_code WHERE category = ?',
-            (category,)
-        )
-        rows = cursor.fetchall()
-        conn.close()
+        by_category = self._healing_codes_index()['by_category']
+        return [dict(entry) for entry in by_category.get(category, ())]
+    
+    def get_healing_code_by_id(self, code_id: int) -> Optional[Dict[str, Any]]:
+        """Get a healing code by ID"""
+        entry = self._healing_codes_index()['by_id'].get(code_id)
+        return dict(entry) if entry is not None else None
+    
+    def get_healing_codes_json(self, category: Optional[str] = None) -> bytes:
+        """Get all healing codes, or one category, as a JSON array encoded once per index"""
+        index = self._healing_codes_index()
+        encoded = index['json'].get(category)
+        if encoded is None:
+            if category is None:
+                codes = index['codes']
+            else:
+                codes = index['by_category'].get(category, [])
+            encoded = _dumps_sorted_bytes(codes)
+            if category is None or category in index['by_category']:
+                index['json'][category] = encoded
+        return encoded
+    
+    def get_healing_code(self, code: str) -> Optional[Dict[str, Any]]:
+        """Get a healing code by its code sequence"""
+        entry = self._healing_codes_index()['by_code'].get(code)
+        return dict(entry) if entry is not None else None
+    
+    def fuzzy_search_healing_codes(
+        self,
+        query: str,
+        limit: Optional[int] = 10,
+        score_cutoff: float = 70
+    ) -> List[Dict[str, Any]]:
+        """Fuzzy search healing codes by code and description scoring above score_cutoff, best matches first"""
+        # rapidfuzz is imported on first use so other modes start without it
+        try:
+            from rapidfuzz import process, fuzz
+            from rapidfuzz import utils as fuzz_utils
+        except ImportError:
+            return self.search_healing_codes(query)[:limit]
+        
+        index = self._healing_codes_index()
+        processed_query = fuzz_utils.default_process(query)
+        
+        # Fuzzy search corpus, preprocessed once per index instead of on every query:
+        # every code string followed by every description
+        if index['fuzzy_choices'] is None:
+            fuzzy_choices = [fuzz_utils.default_process(c['code']) for c in index['codes']]
+            fuzzy_choices += [fuzz_utils.default_process(c['description'] or '') for c in index['codes']]
+            index['fuzzy_choices'] = fuzzy_choices
+        
+        count = len(index['codes'])
+        if HAS_NUMPY:
+            # One multithreaded pass over codes and descriptions, then the best
+            # score per code across both halves
+            scores = process.cdist(
+                [processed_query],
+                index['fuzzy_choices'],
+                scorer=fuzz.token_set_ratio,
+                processor=None,
+                score_cutoff=score_cutoff,
+                dtype=np.float64,
+                workers=-1
+            )[0]
+            best = np.maximum(scores[:count], scores[count:])
+            
+            # rapidfuzz's score_cutoff is inclusive; matches must score above it
+            matched = np.flatnonzero(best > score_cutoff)
+            scores = dict(zip(matched.tolist(), best[matched].tolist()))
+        else:
+            # Best score per code across both corpora
+            scores = {}
+            matches = process.extract(
+                processed_query,
+                index['fuzzy_choices'],
+                scorer=fuzz.token_set_ratio,
+                processor=None,
+                score_cutoff=score_cutoff,
+                limit=None
+            )
+            for _, score, i in matches:
+                i %= count
+                if score > score_cutoff and score > scores.get(i, -1):
+                    scores[i] = score
         
-        return [
-            {
-                'id': row[0],
-                'code': row[1],
-                'description': row[2],
-                'category': row[3],
-                'affirmation': row[4],
-                'vibration': row[5],
-                'source': row[6]
-            }
-            for row in rows
-        ]
+        ranked = sorted(scores, key=lambda i: (-scores[i], i))[:limit]
+        return [dict(index['codes'][i]) for i in ranked]
+    
+    def find_healing_codes_by_keywords(self, keywords: Iterable[str]) -> List[Dict[str, Any]]:
+        """Get healing codes whose lowercased description contains any of the keywords"""
+        index = self._healing_codes_index()
+        codes = index['codes']
+        return [dict(codes[i]) for i in self._keyword_positions(index, keywords)]
+    
+    @staticmethod
+    def _keyword_positions(index: Dict[str, Any], keywords: Iterable[str]) -> List[int]:
+        """Positions of the codes whose lowercased description contains any of the keywords"""
+        keywords = set(keywords)
+        if not keywords:
+            return []
+        
+        descriptions = index['descriptions_lower']
+        if '' in keywords:
+            matches = range(len(descriptions))
+        elif any('\x00' in keyword for keyword in keywords):
+            # Keywords spanning the blob separator need the per-description check
+            matches = [i for i, description in enumerate(descriptions)
+                       if any(keyword in description for keyword in keywords)]
+        else:
+            blob = index['description_blob']
+            starts = index['description_starts']
+            hits = set()
+            if HAS_AHOCORASICK and len(keywords) >= AHOCORASICK_MIN_KEYWORDS:
+                # One pass over the blob for all keywords
+                automaton = ahocorasick.Automaton()
+                for keyword in keywords:
+                    automaton.add_word(keyword, len(keyword))
+                automaton.make_automaton()
+                for end, length in automaton.iter(blob):
+                    hits.add(bisect.bisect_right(starts, end - length + 1) - 1)
+            else:
+                # One str.find scan per keyword, skipping to the next description on a hit
+                for keyword in keywords:
+                    position = blob.find(keyword)
+                    while position != -1:
+                        i = bisect.bisect_right(starts, position) - 1
+                        hits.add(i)
+                        if i + 1 >= len(starts):
+                            break
+                        position = blob.find(keyword, starts[i + 1])
+            matches = sorted(hits)
+        
+        return list(matches)
+    
+    @staticmethod
+    def _pattern_positions(index: Dict[str, Any], pattern: 're.Pattern[str]') -> Iterator[int]:
+        """Lazily yield positions of the codes whose lowercased description matches the pattern"""
+        # Recommendations stop after a few codes, so one alternation scan per
+        # description that can stop early beats scanning the blob per keyword
+        descriptions = index['descriptions_lower']
+        return itertools.compress(range(len(descriptions)), map(pattern.search, descriptions))
+    
+    def recommend_healing_codes(
+        self,
+        situation: str,
+        body_area: str = '',
+        emotional_state: str = ''
+    ) -> List[Dict[str, Any]]:
+        """
+        Recommend up to three healing codes for lowercased situation, body area and emotional state
+        
+        Results are memoized on the code index, so reloading the codes drops them.
+        """
+        index = self._healing_codes_index()
+        key = (situation, body_area, emotional_state)
+        positions = index['recommendations'].get(key)
+        if positions is None:
+            positions = self._recommend_positions(index, situation, body_area, emotional_state)
+            cache = index['recommendations']
+            if len(cache) >= RECOMMENDATION_CACHE_SIZE:
+                cache.clear()
+            cache[key] = positions
+        
+        codes = index['codes']
+        return [dict(codes[i]) for i in positions]
+    
+    def _recommend_positions(
+        self,
+        index: Dict[str, Any],
+        situation: str,
+        body_area: str,
+        emotional_state: str
+    ) -> Tuple[int, ...]:
+        """Pick recommended code positions by keyword priority: body area, emotion, situation, general"""
+        recommended = []
+        seen = set()
+        
+        def recommend(positions):
+            # Only the first three codes are returned, so stop collecting there
+            for i in positions:
+                if i in seen:
+                    continue
+                recommended.append(i)
+                seen.add(i)
+                if len(recommended) >= 3:
+                    break
+        
+        # Search priority based on specificity
+        if body_area:
+            # Physical issue with specific body area, or its related keywords
+            pattern = BODY_AREA_PATTERNS.get(body_area) or _keyword_pattern((body_area,))
+            recommend(self._pattern_positions(index, pattern))
+        
+        # Emotional issues
+        if emotional_state and len(recommended) < 3:
+            pattern = EMOTIONAL_PATTERNS.get(emotional_state) or _keyword_pattern((emotional_state,))
+            recommend(self._pattern_positions(index, pattern))
+        
+        # General situation
+        words = situation.split()
+        if words and len(recommended) < 3:
+            recommend(self._pattern_positions(index, _keyword_pattern(words)))
+        
+        # If still not enough, add some general codes
+        if len(recommended) < 2:
+            recommend(index['general_positions'])
+        
+        return tuple(recommended)
     
     def search_healing_codes(self, query: str) -> List[Dict[str, Any]]:
         """Search healing codes"""
         if not query:
             return self.get_healing_codes()
         
-        conn = sqlite3.connect(self.db_path)
+        conn = self._conn()
         cursor = conn.cursor()
         
-        search_pattern = f"%{query}%"
-        cursor.execute(
-            '''
-            SELECT id, code, description, category, affirmation, vibration, source FROM healing_code 
-            WHERE code LIKE ? OR description LIKE ? OR category LIKE ?
-            ''',
-            (search_pattern, search_pattern, search_pattern)
-        )
+        # A trigram phrase match is an indexed substring match; patterns under
+        # three characters or with LIKE wildcards keep the LIKE scan
+        if self._has_code_fts and len(query) >= 3 and '%' not in query and '_' not in query:
+            phrase = '"' + query.replace('"', '""') + '"'
+            cursor.execute(
+                '''
+                SELECT id, code, description, category, affirmation, vibration, source FROM healing_code 
+                WHERE id IN (SELECT rowid FROM healing_code_fts WHERE healing_code_fts MATCH ?)
+                ORDER BY id
+                ''',
+                (phrase,)
+            )
+        else:
+            search_pattern = f"%{query}%"
+            cursor.execute(
+                '''
+                SELECT id, code, description, category, affirmation, vibration, source FROM healing_code 
+                WHERE code LIKE ? OR description LIKE ? OR category LIKE ?
+                ORDER BY id
+                ''',
+                (search_pattern, search_pattern, search_pattern)
+            )
         rows = cursor.fetchall()
-        conn.close()
         
         return [
             {
@@ -1027,19 +1866,25 @@ class SacredStorage:
         category: Optional[str] = None,
         affirmation: Optional[str] = None,
         vibration: Optional[int] = None,
-        source: Optional[str] = None
+        source: Optional[str] = None,
+        auto_commit: bool = True
     ) -> Dict[str, Any]:
-        """Create a new healing code"""
-        conn = sqlite3.connect(self.db_path)
+        """
+        Create a new healing code
+        
+        With auto_commit=False the insert joins the thread's open transaction;
+        call commit() once after the last insert.
+        """
+        conn = self._conn()
         cursor = conn.cursor()
         
         cursor.execute(
-            'INSERT INTO healing_code (code, description, category, affirmation, vibration, source) VALUES (?, ?, ?, ?, ?, ?)',
+            HEALING_CODE_INSERT_SQL,
             (code, description, category, affirmation, vibration, source)
         )
         code_id = cursor.lastrowid
-        conn.commit()
-        conn.close()
+        if auto_commit:
+            self.commit()
         
         return {
             'id': code_id,
@@ -1051,6 +1896,45 @@ class SacredStorage:
             'source': source
         }
     
+    def create_healing_codes_bulk(
+        self,
+        rows: Iterable[Tuple[str, str, Optional[str], Optional[str], Optional[int], Optional[str]]]
+    ) -> int:
+        """
+        Insert many healing codes in a single transaction
+        
+        rows are (code, description, category, affirmation, vibration, source)
+        tuples; returns the number of rows inserted.
+        """
+        conn = self._conn()
+        cursor = conn.cursor()
+        rows = iter(rows)
+        inserted = 0
+        
+        try:
+            while True:
+                batch = list(itertools.islice(rows, HEALING_CODE_BATCH_SIZE))
+                if not batch:
+                    break
+                cursor.executemany(
+                    HEALING_CODE_INSERT_SQL,
+                    batch
+                )
+                inserted += cursor.rowcount
+            conn.commit()
+        except Exception:
+            conn.rollback()
+            raise
+        finally:
+            self.invalidate_codes_cache()
+        
+        return inserted
+    
+    def commit(self) -> None:
+        """Commit the calling thread's pending writes"""
+        self._conn().commit()
+        self.invalidate_codes_cache()
+    
     # Past Life Insights methods
     def create_past_life_insight(
         self,
@@ -1061,10 +1945,12 @@ class SacredStorage:
         resolution_code: Optional[str] = None
     ) -> Dict[str, Any]:
         """Create a new past life insight"""
-        conn = sqlite3.connect(self.db_path)
-        cursor = conn.cursor()
+        conn = self._conn()
         
-        cursor.execute(
+        return self._insert_row(
+            conn,
+            'past_life_insights',
+            PAST_LIFE_INSIGHT_COLUMNS,
             '''
             INSERT INTO past_life_insights 
             (user_id, past_life_pattern, life_period, key_lesson, resolution_code) 
@@ -1072,35 +1958,33 @@ class SacredStorage:
             ''',
             (user_id, past_life_pattern, life_period, key_lesson, resolution_code)
         )
-        insight_id = cursor.lastrowid
-        conn.commit()
-        
-        # Get the created insight with datetime
-        cursor.execute('SELECT * FROM past_life_insights WHERE id = ?', (insight_id,))
-        row = cursor.fetchone()
-        conn.close()
-        
-        columns = ['id', 'user_id', 'past_life_pattern', 'life_period', 
-                  'key_lesson', 'resolution_code', 'created_at']
-        return dict(zip(columns, row))
     
     def get_past_life_insights(self, user_id: Optional[int] = None) -> List[Dict[str, Any]]:
         """Get past life insights, optionally filtered by user"""
-        conn = sqlite3.connect(self.db_path)
+        conn = self._conn()
         cursor = conn.cursor()
         
         if user_id:
-            cursor.execute('SELECT * FROM past_life_insights WHERE user_id = ? ORDER BY created_at DESC', (user_id,))
+            cursor.execute(PAST_LIFE_INSIGHTS_BY_USER_SQL, (user_id,))
         else:
-            cursor.execute('SELECT * FROM past_life_insights ORDER BY created_at DESC')
+            cursor.execute(PAST_LIFE_INSIGHTS_SQL)
             
         rows = cursor.fetchall()
-        conn.close()
-        
-        columns = ['id', 'user_id', 'past_life_pattern', 'life_period', 
-                  'key_lesson', 'resolution_code', 'created_at']
         
-        return [dict(zip(columns, row)) for row in rows]
+        # Literal dicts from unpacked rows build about twice as fast as dict(zip(...))
+        return [
+            {
+                'id': insight_id,
+                'user_id': user_id,
+                'past_life_pattern': past_life_pattern,
+                'life_period': life_period,
+                'key_lesson': key_lesson,
+                'resolution_code': resolution_code,
+                'created_at': created_at
+            }
+            for (insight_id, user_id, past_life_pattern, life_period,
+                 key_lesson, resolution_code, created_at) in rows
+        ]
     
     # Environmental Anchoring methods
     def create_environmental_anchor(
@@ -1113,10 +1997,12 @@ class SacredStorage:
         activation_code: Optional[str] = None
     ) -> Dict[str, Any]:
         """Create a new environmental anchor"""
-        conn = sqlite3.connect(self.db_path)
-        cursor = conn.cursor()
+        conn = self._conn()
         
-        cursor.execute(
+        result = self._insert_row(
+            conn,
+            'environmental_anchoring',
+            ENVIRONMENTAL_ANCHOR_COLUMNS,
             '''
             INSERT INTO environmental_anchoring 
             (location_name, coordinates, intention, field_type, field_data, activation_code) 
@@ -1127,62 +2013,359 @@ class SacredStorage:
                 coordinates,
                 intention,
                 field_type,
-                json.dumps(field_data),
+                _dumps(field_data),
                 activation_code
             )
         )
-        anchor_id = cursor.lastrowid
-        conn.commit()
         
-        # Get the created anchor with datetime
-        cursor.execute('SELECT * FROM environmental_anchoring WHERE id = ?', (anchor_id,))
-        row = cursor.fetchone()
-        conn.close()
-        
-        columns = ['id', 'location_name', 'coordinates', 'intention', 
-                  'field_type', 'field_data', 'activation_code', 'created_at']
-        
-        result = dict(zip(columns, row))
-        result['field_data'] = json.loads(result['field_data'])
+        result['field_data'] = _loads(result['field_data'])
         
         return result
     
-    def get_environmental_anchors(self) -> List[Dict[str, Any]]:
+    def get_environmental_anchors(self, raw_json: bool = False) -> List[Dict[str, Any]]:
         """Get all environmental anchors"""
-        conn = sqlite3.connect(self.db_path)
+        conn = self._conn()
         cursor = conn.cursor()
-        cursor.execute('SELECT * FROM environmental_anchoring ORDER BY created_at DESC')
+        cursor.execute(ENVIRONMENTAL_ANCHORS_SQL)
         rows = cursor.fetchall()
-        conn.close()
         
-        columns = ['id', 'location_name', 'coordinates', 'intention', 
-                  'field_type', 'field_data', 'activation_code', 'created_at']
+        # Decode the field_data column in one pass, then assemble rows
+        field_data = list(map(self._json_column_decoder(raw_json), [row[5] for row in rows]))
         
-        results = []
-        for row in rows:
-            result = dict(zip(columns, row))
-            result['field_data'] = json.loads(result['field_data'])
-            results.append(result)
+        return [
+            {
+                'id': row[0],
+                'location_name': row[1],
+                'coordinates': row[2],
+                'intention': row[3],
+                'field_type': row[4],
+                'field_data': data,
+                'activation_code': row[6],
+                'created_at': row[7]
+            }
+            for row, data in zip(rows, field_data)
+        ]
+
+
+class AsyncSacredStorage:
+    """Awaitable view of SacredStorage for use inside coroutines
+    
+    Every storage method is exposed as a coroutine that runs the call on a
+    worker thread, so SQLite I/O never stalls the event loop. Worker threads
+    get their own pooled connection from the wrapped storage.
+    """
+    
+    def __init__(self, storage: SacredStorage):
+        self.storage = storage
+    
+    def __getattr__(self, name: str) -> Callable[..., Any]:
+        method = getattr(self.storage, name)
+        if name.startswith('_') or not callable(method):
+            raise AttributeError(name)
+        
+        async def call(*args, **kwargs):
+            return await asyncio.to_thread(method, *args, **kwargs)
         
-        return results
+        call.__name__ = name
+        call.__doc__ = method.__doc__
+        return call
 
 
 #########################################
 # FLASK API IMPLEMENTATION
 #########################################
 
+# Fallback intention recommendations per context:
+# (intention template, field type, frequency, reason)
+INTENTION_RECOMMENDATIONS = {
+    # For healing, focus on present tense, positive framing (528Hz DNA repair frequency)
+    'healing': ("I am completely healed and vibrant with {}", "flower_of_life", 528,
+                "Healing intentions work best with present tense affirmations and the repair frequency of 528Hz"),
+    # For manifestation, use torus as it's the creation pattern (Earth frequency for grounding)
+    'manifestation': ("I am gratefully experiencing {} in my life now", "torus", 7.83,
+                      "Manifestation intentions work best with gratitude and present tense phrasing"),
+    # For protection, use merkaba (higher frequency for stronger field)
+    'protection': ("I am divinely protected from all forms of {}", "merkaba", 13.0,
+                   "Protection intentions work best with the Merkaba field, which creates a natural energetic boundary"),
+    # For transformation, use metatron's cube (Tesla's completion number)
+    'transformation': ("I am easily transforming {} with divine grace", "metatron", 9.0,
+                       "Transformation intentions benefit from Metatron's Cube which connects all platonic solids"),
+    # For connection, use Sri Yantra (Schumann resonance for connection)
+    'connection': ("I am deeply connected to {} at all levels of my being", "sri_yantra", 7.83,
+                   "Connection intentions work best with Sri Yantra which represents the cosmos and unity consciousness"),
+}
+# Default balanced approach
+DEFAULT_INTENTION_RECOMMENDATION = (
+    "I am in perfect harmony with {}", "torus", 7.83,
+    "This balanced intention works for general purposes and aligns with Earth's natural frequency"
+)
+
+# Request body schemas: msgspec decodes and validates the JSON in one pass;
+# without it the same annotations drive a manual check of request.json that
+# accepts and rejects the same values (see _decode_request)
+if HAS_MSGSPEC:
+    _RequestSchema = msgspec.Struct
+else:
+    class _RequestSchema:
+        """Plain stand-in for msgspec.Struct; class attributes are field defaults"""
+        
+        def __init__(self, **fields: Any):
+            for name, value in fields.items():
+                setattr(self, name, value)
+            if hasattr(self, '__post_init__'):
+                self.__post_init__()
+
+# Strings msgspec accepts for a float field when decoding with strict=False
+NUMERIC_STRING_PATTERN = re.compile(r'-?(?:(?:0|[1-9][0-9]*)(?:\.[0-9]+)?(?:[eE][-+]?[0-9]+)?|nan|inf(?:inity)?)', re.IGNORECASE)
+
+# JSON type names used in request validation errors, matching msgspec's
+JSON_TYPE_NAMES = {type(None): 'null', bool: 'bool', int: 'int', float: 'float', str: 'str', list: 'array', dict: 'object'}
+
+
+def _truncate_number(value: float) -> int:
+    """Truncate a decoded number to an int like the original int() coercion, rejecting NaN and infinities"""
+    if not math.isfinite(value):
+        raise ValueError(f"Expected a finite number, got {value}")
+    return int(value)
+
+
+class TorusFieldRequest(_RequestSchema):
+    intention: str
+    frequency: float = SCHUMANN_RESONANCE
+
+
+class MerkabaFieldRequest(_RequestSchema):
+    intention: str
+    frequency: float = SCHUMANN_RESONANCE
+
+
+class MetatronCubeRequest(_RequestSchema):
+    intention: str
+    boost: Any = False  # Only its truthiness matters
+
+
+class SriYantraRequest(_RequestSchema):
+    intention: str
+
+
+class FlowerOfLifeRequest(_RequestSchema):
+    intention: str
+    duration: float = 60  # Any number, truncated to whole seconds
+    
+    def __post_init__(self):
+        self.duration = _truncate_number(self.duration)
+
+
+class PlatonicSolidRequest(_RequestSchema):
+    intention: str
+    solid_type: str = 'dodecahedron'
+
+
+class DivineAmplifyRequest(_RequestSchema):
+    intention: str
+    multiplier: float = 1.0
+
+
+class NetworkPacketRequest(_RequestSchema):
+    intention: str
+    frequency: float = SCHUMANN_RESONANCE
+    field_type: str = 'torus'
+
+
+class SoulArchiveRequest(_RequestSchema):
+    title: str
+    pattern_type: str
+    pattern_data: Any
+    description: Optional[str] = None
+    intention: Optional[str] = None
+    frequency: Any = SCHUMANN_RESONANCE  # Stored as given, via str()
+    boost: Any = False
+    multiplier: Any = 1
+    user_id: Any = None
+
+
+class PastLifeInsightRequest(_RequestSchema):
+    user_id: Any
+    past_life_pattern: str
+    life_period: Optional[str] = None
+    key_lesson: Optional[str] = None
+    resolution_code: Optional[str] = None
+
+
+class EnvironmentalAnchorRequest(_RequestSchema):
+    location_name: str
+    intention: str
+    field_type: str
+    field_data: Any
+    coordinates: Any = None
+    activation_code: Optional[str] = None
+
+
+class IntentionRecommendationRequest(_RequestSchema):
+    userInput: Any
+    context: Any = 'healing'  # Unknown contexts get the default recommendation
+
+
+class SemanticSearchRequest(_RequestSchema):
+    issue: str
+    limit: float = 5  # Any number, truncated to a whole count
+    
+    def __post_init__(self):
+        self.limit = _truncate_number(self.limit)
+
+
+class HealingRecommendationRequest(_RequestSchema):
+    situation: str
+    bodyArea: str = ''
+    emotionalState: str = ''
+
+
+# Database-backed GET endpoints answered with ETag revalidation; ETags derive
+# from the database's data_version, so every worker process agrees on them
+HTTP_CACHEABLE_ENDPOINTS = frozenset({
+    'api_healing_codes',
+    'api_healing_code',
+    'api_soul_archives',
+    'api_soul_archive',
+    'api_past_life_insights',
+    'api_environmental_anchors',
+})
+HTTP_CACHE_CONTROL = 'private, max-age=5, must-revalidate'
+# CORS headers added to every API response
+CORS_HEADERS = (
+    ('Access-Control-Allow-Origin', '*'),
+    ('Access-Control-Allow-Headers', 'Content-Type,Authorization'),
+    ('Access-Control-Allow-Methods', 'GET,POST,PUT,DELETE,OPTIONS'),
+)
+
+if HAS_FLASK and HAS_ORJSON:
+    from flask.json.provider import DefaultJSONProvider
+    
+    class ORJSONProvider(DefaultJSONProvider):
+        """Flask JSON provider backed by orjson, keeping Flask's key sorting and type fallbacks"""
+        
+        def _dumps_bytes(self, obj: Any, sort_keys: bool, indent: bool) -> bytes:
+            option = orjson.OPT_NON_STR_KEYS | orjson.OPT_PASSTHROUGH_DATETIME | orjson.OPT_PASSTHROUGH_DATACLASS
+            if sort_keys:
+                option |= orjson.OPT_SORT_KEYS
+            if indent:
+                option |= orjson.OPT_INDENT_2
+            return orjson.dumps(obj, default=self.default, option=option)
+        
+        def dumps(self, obj: Any, **kwargs: Any) -> str:
+            return self._dumps_bytes(obj, kwargs.get('sort_keys', self.sort_keys), kwargs.get('indent')).decode('utf-8')
+        
+        def response(self, *args: Any, **kwargs: Any) -> Response:
+            """Like Flask's, but hands orjson's bytes straight to the response without a str round trip"""
+            obj = self._prepare_response_obj(args, kwargs)
+            indent = (self.compact is None and self._app.debug) or self.compact is False
+            body = self._dumps_bytes(obj, self.sort_keys, indent) + b'\n'
+            return self._app.response_class(body, mimetype=self.mimetype)
+        
+        def loads(self, s: Union[str, bytes], **kwargs: Any) -> Any:
+            return orjson.loads(s)
+
 if HAS_FLASK:
     app = Flask(__name__)
+    if HAS_ORJSON:
+        app.json = ORJSONProvider(app)
+    app.config['API_WORKERS'] = 1  # Server processes sharing the OpenAI rate limits
     storage = SacredStorage()
     
-    # Initialize OpenAI handler if available
+    # OpenAI handler of this process, created on first use so that forked
+    # server workers each build their own after the fork
     openai_handler = None
-    if HAS_OPENAI_HANDLER:
-        openai_handler = OpenAIHandler()
-        if openai_handler.enabled:
-            logger.info("OpenAI handler initialized successfully for semantic matching")
-        else:
-            logger.warning("OpenAI handler initialized but API key not available or invalid")
+    _openai_handler_lock = threading.Lock()
+    
+    def _get_openai_handler() -> Optional["OpenAIHandler"]:
+        """Get this process's OpenAI handler, initializing it if available"""
+        global openai_handler
+        if openai_handler is None and HAS_OPENAI_HANDLER:
+            with _openai_handler_lock:
+                if openai_handler is None:
+                    handler = OpenAIHandler(
+                        processes=app.config['API_WORKERS'],
+                        embeddings_path=os.environ.get('SACRED_EMBEDDINGS_PATH', EMBEDDINGS_DB_PATH)
+                    )
+                    if handler.enabled:
+                        logger.info("OpenAI handler initialized successfully for semantic matching")
+                        # Load (or, in the first worker to get the store's lock, embed) the
+                        # code descriptions in the background so the first semantic search
+                        # only has to embed the issue
+                        threading.Thread(
+                            target=handler.precompute_healing_embeddings, args=(storage.all_codes,), daemon=True
+                        ).start()
+                    else:
+                        logger.warning("OpenAI handler initialized but API key not available or invalid")
+                    openai_handler = handler
+        return openai_handler
+
+    @functools.lru_cache(maxsize=GEOMETRY_CACHE_SIZE)
+    def _geometry_body(generator: str, *args) -> bytes:
+        """Return the memoized JSON body for a pure geometry generator call"""
+        return app.json.response(getattr(SacredGeometryCalculator, generator)(*args)).get_data()
+    
+    def _geometry_response(generator: str, intention: str, *options):
+        """Build a JSON response for a geometry generator, served from cache for short intentions"""
+        # Round numeric options whether cached or not, so equal keys (7 and
+        # 7.0) always give the same body
+        options = tuple(
+            round(float(option), GEOMETRY_OPTION_DIGITS) if type(option) in (int, float) else option
+            for option in options
+        )
+        if len(intention) > GEOMETRY_CACHE_MAX_INTENTION:
+            return jsonify(getattr(SacredGeometryCalculator, generator)(intention, *options))
+        return app.response_class(_geometry_body(generator, intention, *options), mimetype='application/json')
+    
+    def _decode_request(schema: type, error: str):
+        """
+        Decode and validate the JSON request body, returning (request, None) or (None, 400 response)
+        
+        Both paths accept the same bodies: a JSON object with the schema's required
+        fields, str fields holding strings (or null when Optional), and float
+        fields holding numbers or numeric strings (not booleans).
+        """
+        # Like request.json, refuse bodies not sent as JSON (415 on Flask 2.3+)
+        if not request.is_json:
+            request.get_json()
+            return None, (jsonify({"error": error}), 400)
+        
+        if HAS_MSGSPEC:
+            try:
+                return msgspec.json.decode(request.get_data(), type=schema, strict=False), None
+            except msgspec.MsgspecError as e:
+                return None, (jsonify({"error": error, "details": str(e)}), 400)
+        
+        data = request.json
+        if not isinstance(data, dict):
+            got = JSON_TYPE_NAMES.get(type(data), type(data).__name__)
+            return None, (jsonify({"error": error, "details": f"Expected `object`, got `{got}`"}), 400)
+        
+        fields = {}
+        for name, kind in schema.__annotations__.items():
+            if name not in data:
+                if not hasattr(schema, name):
+                    return None, (jsonify({"error": error, "details": f"Object missing required field `{name}`"}), 400)
+                continue
+            value = data[name]
+            if kind is str or kind == Optional[str]:
+                valid = isinstance(value, str) or (value is None and kind is not str)
+            elif kind is float:
+                valid = (type(value) in (int, float)
+                         or (isinstance(value, str) and NUMERIC_STRING_PATTERN.fullmatch(value) is not None))
+                if valid:
+                    value = float(value)
+            else:
+                valid = True
+            if not valid:
+                expected = 'str | null' if kind == Optional[str] else kind.__name__
+                got = JSON_TYPE_NAMES.get(type(value), type(value).__name__)
+                return None, (jsonify({"error": error, "details": f"Expected `{expected}`, got `{got}` - at `$.{name}`"}), 400)
+            fields[name] = value
+        try:
+            return schema(**fields), None
+        except (TypeError, ValueError) as e:
+            return None, (jsonify({"error": error, "details": str(e)}), 400)
 
     # === Web Frontend Routes ===
     @app.route('/')
@@ -1282,7 +2465,7 @@ if HAS_FLASK:
         elif category:
             codes = storage.get_healing_codes_by_category(category)
         else:
-            codes = storage.get_healing_codes()
+            codes = storage.all_codes
             
         categories = set(code.get('category', 'Uncategorized') for code in codes)
         
@@ -1305,95 +2488,88 @@ if HAS_FLASK:
         search = request.args.get('search')
         
         if search:
-            codes = storage.search_healing_codes(search)
-        elif category:
-            codes = storage.get_healing_codes_by_category(category)
-        else:
-            codes = storage.get_healing_codes()
+            return jsonify(storage.search_healing_codes(search))
         
-        return jsonify(codes)
+        # Category and full listings are served pre-encoded from the code cache
+        body = storage.get_healing_codes_json(category or None)
+        return app.response_class(body + b'\n', mimetype='application/json')
 
     @app.route('/api/healing-codes/<int:code_id>', methods=['GET'])
     def api_healing_code(code_id):
         """API endpoint to get a specific healing code"""
-        codes = storage.get_healing_codes()
-        for code in codes:
-            if code['id'] == code_id:
-                return jsonify(code)
+        code = storage.get_healing_code_by_id(code_id)
+        if code:
+            return jsonify(code)
         return jsonify({"error": "Healing code not found"}), 404
 
     @app.route('/api/sacred-geometry/torus', methods=['POST'])
     def api_torus_field():
         """API endpoint to generate a torus field"""
-        data = request.json
-        if not data or 'intention' not in data:
-            return jsonify({"error": "Intention is required"}), 400
+        req, error = _decode_request(TorusFieldRequest, "Intention is required")
+        if error:
+            return error
         
-        intention = data['intention']
-        frequency = float(data.get('frequency', SCHUMANN_RESONANCE))
+        intention = req.intention
+        frequency = req.frequency
         
         try:
-            result = SacredGeometryCalculator.torus_field_generator(intention, frequency)
-            return jsonify(result)
+            return _geometry_response('torus_field_generator', intention, frequency)
         except Exception as e:
             return jsonify({"error": str(e)}), 500
 
     @app.route('/api/sacred-geometry/merkaba', methods=['POST'])
     def api_merkaba_field():
         """API endpoint to generate a merkaba field"""
-        data = request.json
-        if not data or 'intention' not in data:
-            return jsonify({"error": "Intention is required"}), 400
+        req, error = _decode_request(MerkabaFieldRequest, "Intention is required")
+        if error:
+            return error
         
-        intention = data['intention']
-        frequency = float(data.get('frequency', SCHUMANN_RESONANCE))
+        intention = req.intention
+        frequency = req.frequency
         
         try:
-            result = SacredGeometryCalculator.merkaba_field_generator(intention, frequency)
-            return jsonify(result)
+            return _geometry_response('merkaba_field_generator', intention, frequency)
         except Exception as e:
             return jsonify({"error": str(e)}), 500
 
     @app.route('/api/sacred-geometry/metatron', methods=['POST'])
     def api_metatron_cube():
         """API endpoint to generate Metatron's Cube"""
-        data = request.json
-        if not data or 'intention' not in data:
-            return jsonify({"error": "Intention is required"}), 400
+        req, error = _decode_request(MetatronCubeRequest, "Intention is required")
+        if error:
+            return error
         
-        intention = data['intention']
-        boost = data.get('boost', False)
+        intention = req.intention
+        boost = req.boost
         
         try:
-            result = SacredGeometryCalculator.metatrons_cube_amplifier(intention, boost)
-            return jsonify(result)
+            return _geometry_response('metatrons_cube_amplifier', intention, bool(boost))
         except Exception as e:
             return jsonify({"error": str(e)}), 500
 
     @app.route('/api/sacred-geometry/sri-yantra', methods=['POST'])
     def api_sri_yantra():
         """API endpoint to generate Sri Yantra"""
-        data = request.json
-        if not data or 'intention' not in data:
-            return jsonify({"error": "Intention is required"}), 400
+        req, error = _decode_request(SriYantraRequest, "Intention is required")
+        if error:
+            return error
         
-        intention = data['intention']
+        intention = req.intention
         
         try:
-            result = SacredGeometryCalculator.sri_yantra_encoder(intention)
-            return jsonify(result)
+            return _geometry_response('sri_yantra_encoder', intention)
         except Exception as e:
             return jsonify({"error": str(e)}), 500
 
     @app.route('/api/sacred-geometry/flower-of-life', methods=['POST'])
     def api_flower_of_life():
         """API endpoint to generate Flower of Life"""
-        data = request.json
-        if not data or 'intention' not in data:
-            return jsonify({"error": "Intention is required"}), 400
+        req, error = _decode_request(FlowerOfLifeRequest, "Intention is required")
+        if error:
+            return error
         
-        intention = data['intention']
-        duration = int(data.get('duration', 60))
+        intention = req.intention
+        duration = req.duration
         
         try:
             result = SacredGeometryCalculator.flower_of_life_pattern(intention, duration)
@@ -1404,52 +2580,54 @@ if HAS_FLASK:
     @app.route('/api/sacred-geometry/platonic-solid', methods=['POST'])
     def api_platonic_solid():
         """API endpoint to generate Platonic Solid resonator"""
-        data = request.json
-        if not data or 'intention' not in data:
-            return jsonify({"error": "Intention is required"}), 400
+        req, error = _decode_request(PlatonicSolidRequest, "Intention is required")
+        if error:
+            return error
         
-        intention = data['intention']
-        solid_type = data.get('solid_type', 'dodecahedron')
+        intention = req.intention
+        solid_type = req.solid_type
         
         try:
-            result = SacredGeometryCalculator.platonic_solid_resonator(intention, solid_type)
-            return jsonify(result)
+            return _geometry_response('platonic_solid_resonator', intention, solid_type)
         except Exception as e:
             return jsonify({"error": str(e)}), 500
 
     @app.route('/api/amplify', methods=['POST'])
     def api_divine_amplify():
         """API endpoint to amplify intention with divine proportion"""
-        data = request.json
-        if not data or 'intention' not in data:
-            return jsonify({"error": "Intention is required"}), 400
+        req, error = _decode_request(DivineAmplifyRequest, "Intention is required")
+        if error:
+            return error
         
-        intention = data['intention']
-        multiplier = float(data.get('multiplier', 1.0))
+        intention = req.intention
+        multiplier = req.multiplier
         
         try:
-            result = SacredGeometryCalculator.divine_proportion_amplify(intention, multiplier)
-            return jsonify(result)
+            return _geometry_response('divine_proportion_amplify', intention, multiplier)
         except Exception as e:
             return jsonify({"error": str(e)}), 500
 
     @app.route('/api/network-packet', methods=['POST'])
     def api_network_packet():
         """API endpoint to embed intention in network packet"""
-        data = request.json
-        if not data or 'intention' not in data:
-            return jsonify({"error": "Intention is required"}), 400
+        req, error = _decode_request(NetworkPacketRequest, "Intention is required")
+        if error:
+            return error
         
-        intention = data['intention']
-        frequency = float(data.get('frequency', SCHUMANN_RESONANCE))
-        field_type = data.get('field_type', 'torus')
+        intention = req.intention
+        frequency = req.frequency
+        field_type = req.field_type
         
         try:
             # Since Flask doesn't natively support async/await
             packet = IntentionPacket(intention, frequency, field_type)
+            
+            # Every packet has its own sequence id, timestamp and keys, so it
+            # cannot be memoized; serialize it once and embed those bytes as-is
+            packet_bytes = packet.to_bytes()
             return jsonify({
-                "packet": packet.to_dict(),
-                "packet_base64": packet.to_base64()
+                "packet": orjson.Fragment(packet_bytes) if HAS_RAW_JSON else packet.to_dict(),
+                "packet_base64": packet.to_base64(packet_bytes)
             })
         except Exception as e:
             return jsonify({"error": str(e)}), 500
@@ -1457,13 +2635,13 @@ if HAS_FLASK:
     @app.route('/api/soul-archives', methods=['GET'])
     def api_soul_archives():
         """API endpoint to get soul archives"""
-        archives = storage.get_soul_archives()
+        archives = storage.get_soul_archives(raw_json=HAS_RAW_JSON)
         return jsonify(archives)
 
     @app.route('/api/soul-archives/<int:archive_id>', methods=['GET'])
     def api_soul_archive(archive_id):
         """API endpoint to get a specific soul archive"""
-        archive = storage.get_soul_archive_by_id(archive_id)
+        archive = storage.get_soul_archive_by_id(archive_id, raw_json=HAS_RAW_JSON)
         if archive:
             return jsonify(archive)
         return jsonify({"error": "Soul archive not found"}), 404
@@ -1471,21 +2649,21 @@ if HAS_FLASK:
     @app.route('/api/soul-archives', methods=['POST'])
     def api_create_soul_archive():
         """API endpoint to create a soul archive"""
-        data = request.json
-        if not data or 'title' not in data or 'pattern_type' not in data or 'pattern_data' not in data:
-            return jsonify({"error": "Required fields: title, pattern_type, pattern_data"}), 400
+        req, error = _decode_request(SoulArchiveRequest, "Required fields: title, pattern_type, pattern_data")
+        if error:
+            return error
         
         try:
             archive = storage.create_soul_archive(
-                title=data['title'],
-                pattern_type=data['pattern_type'],
-                pattern_data=data['pattern_data'],
-                description=data.get('description'),
-                intention=data.get('intention'),
-                frequency=str(data.get('frequency', SCHUMANN_RESONANCE)),
-                boost=data.get('boost', False),
-                multiplier=data.get('multiplier', 1),
-                user_id=data.get('user_id')
+                title=req.title,
+                pattern_type=req.pattern_type,
+                pattern_data=req.pattern_data,
+                description=req.description,
+                intention=req.intention,
+                frequency=str(req.frequency),
+                boost=req.boost,
+                multiplier=req.multiplier,
+                user_id=req.user_id
             )
             return jsonify(archive), 201
         except Exception as e:
@@ -1505,17 +2683,17 @@ if HAS_FLASK:
     @app.route('/api/past-life-insights', methods=['POST'])
     def api_create_past_life_insight():
         """API endpoint to create a past life insight"""
-        data = request.json
-        if not data or 'user_id' not in data or 'past_life_pattern' not in data:
-            return jsonify({"error": "Required fields: user_id, past_life_pattern"}), 400
+        req, error = _decode_request(PastLifeInsightRequest, "Required fields: user_id, past_life_pattern")
+        if error:
+            return error
         
         try:
             insight = storage.create_past_life_insight(
-                user_id=data['user_id'],
-                past_life_pattern=data['past_life_pattern'],
-                life_period=data.get('life_period'),
-                key_lesson=data.get('key_lesson'),
-                resolution_code=data.get('resolution_code')
+                user_id=req.user_id,
+                past_life_pattern=req.past_life_pattern,
+                life_period=req.life_period,
+                key_lesson=req.key_lesson,
+                resolution_code=req.resolution_code
             )
             return jsonify(insight), 201
         except Exception as e:
@@ -1524,24 +2702,24 @@ if HAS_FLASK:
     @app.route('/api/environmental-anchors', methods=['GET'])
     def api_environmental_anchors():
         """API endpoint to get environmental anchors"""
-        anchors = storage.get_environmental_anchors()
+        anchors = storage.get_environmental_anchors(raw_json=HAS_RAW_JSON)
         return jsonify(anchors)
 
     @app.route('/api/environmental-anchors', methods=['POST'])
     def api_create_environmental_anchor():
         """API endpoint to create an environmental anchor"""
-        data = request.json
-        if not data or 'location_name' not in data or 'intention' not in data or 'field_type' not in data or 'field_data' not in data:
-            return jsonify({"error": "Required fields: location_name, intention, field_type, field_data"}), 400
+        req, error = _decode_request(EnvironmentalAnchorRequest, "Required fields: location_name, intention, field_type, field_data")
+        if error:
+            return error
         
         try:
             anchor = storage.create_environmental_anchor(
-                location_name=data['location_name'],
-                intention=data['intention'],
-                field_type=data['field_type'],
-                field_data=data['field_data'],
-                coordinates=data.get('coordinates'),
-                activation_code=data.get('activation_code')
+                location_name=req.location_name,
+                intention=req.intention,
+                field_type=req.field_type,
+                field_data=req.field_data,
+                coordinates=req.coordinates,
+                activation_code=req.activation_code
             )
             return jsonify(anchor), 201
         except Exception as e:
@@ -1552,56 +2730,27 @@ if HAS_FLASK:
     @app.route('/api/intention-recommendation', methods=['POST'])
     def api_intention_recommendation():
         """API endpoint to get intention recommendation"""
-        data = request.json
-        if not data or 'userInput' not in data:
-            return jsonify({"error": "User input is required"}), 400
+        req, error = _decode_request(IntentionRecommendationRequest, "User input is required")
+        if error:
+            return error
         
-        user_input = data['userInput']
-        context = data.get('context', 'healing')
+        user_input = req.userInput
+        context = req.context
         
         # Use OpenAI handler if available
-        if openai_handler and openai_handler.enabled:
-            result = openai_handler.enhance_intention(user_input, context)
+        handler = _get_openai_handler()
+        if handler and handler.enabled:
+            result = handler.enhance_intention(user_input, context)
             return jsonify(result)
         
         # Fallback to basic intention enhancement if OpenAI is not available
         # Based on context, create recommended intention and relevant field
-        if context == 'healing':
-            # For healing, focus on present tense, positive framing
-            recommended = f"I am completely healed and vibrant with {user_input}"
-            field_type = "flower_of_life"
-            frequency = 528  # DNA repair frequency
-            reason = "Healing intentions work best with present tense affirmations and the repair frequency of 528Hz"
-        elif context == 'manifestation':
-            # For manifestation, use torus as it's the creation pattern
-            recommended = f"I am gratefully experiencing {user_input} in my life now"
-            field_type = "torus"
-            frequency = 7.83  # Earth frequency for grounding manifestations
-            reason = "Manifestation intentions work best with gratitude and present tense phrasing"
-        elif context == 'protection':
-            # For protection, use merkaba
-            recommended = f"I am divinely protected from all forms of {user_input}"
-            field_type = "merkaba"
-            frequency = 13.0  # Higher frequency for stronger field
-            reason = "Protection intentions work best with the Merkaba field, which creates a natural energetic boundary"
-        elif context == 'transformation':
-            # For transformation, use metatron's cube
-            recommended = f"I am easily transforming {user_input} with divine grace"
-            field_type = "metatron"
-            frequency = 9.0  # Tesla's completion number
-            reason = "Transformation intentions benefit from Metatron's Cube which connects all platonic solids"
-        elif context == 'connection':
-            # For connection, use Sri Yantra
-            recommended = f"I am deeply connected to {user_input} at all levels of my being"
-            field_type = "sri_yantra"
-            frequency = 7.83  # Schumann resonance for connection
-            reason = "Connection intentions work best with Sri Yantra which represents the cosmos and unity consciousness"
+        if isinstance(context, str):
+            recommendation = INTENTION_RECOMMENDATIONS.get(context, DEFAULT_INTENTION_RECOMMENDATION)
         else:
-            # Default balanced approach
-            recommended = f"I am in perfect harmony with {user_input}"
-            field_type = "torus"
-            frequency = 7.83
-            reason = "This balanced intention works for general purposes and aligns with Earth's natural frequency"
+            recommendation = DEFAULT_INTENTION_RECOMMENDATION
+        template, field_type, frequency, reason = recommendation
+        recommended = template.format(user_input)
         
         # Return recommendation
         return jsonify({
@@ -1615,20 +2764,19 @@ if HAS_FLASK:
     @app.route('/api/healing-codes/semantic', methods=['POST'])
     def api_semantic_healing_codes():
         """API endpoint to semantically search healing codes based on an issue description"""
-        data = request.json
-        if not data or 'issue' not in data:
-            return jsonify({"error": "Issue description is required"}), 400
+        req, error = _decode_request(SemanticSearchRequest, "Issue description is required")
+        if error:
+            return error
         
-        user_issue = data['issue']
-        limit = int(data.get('limit', 5))  # Number of results to return
-        
-        # Get all healing codes
-        all_codes = storage.get_healing_codes()
+        user_issue = req.issue
+        limit = req.limit  # Number of results to return
         
         # If OpenAI is available, use semantic matching
-        if openai_handler and openai_handler.enabled:
-            # Use the semantic matching function to find relevant codes
-            matched_codes = openai_handler.semantic_healing_code_match(user_issue, all_codes, limit)
+        handler = _get_openai_handler()
+        if handler and handler.enabled:
+            # Match against the cached codes and copy only the matches
+            matched_codes = handler.semantic_healing_code_match(user_issue, storage.all_codes, limit)
+            matched_codes = [dict(code) for code in matched_codes]
             
             # Generate a recommendation based on the issue
             practice = "Recite each code 9 times daily while focusing on your intention of healing."
@@ -1653,98 +2801,16 @@ if HAS_FLASK:
     @app.route('/api/healing-recommendation', methods=['POST'])
     def api_healing_recommendation():
         """API endpoint to get healing code recommendation"""
-        data = request.json
-        if not data or 'situation' not in data:
-            return jsonify({"error": "Situation description is required"}), 400
-        
-        situation = data['situation'].lower()
-        body_area = data.get('bodyArea', '').lower()
-        emotional_state = data.get('emotionalState', '').lower()
+        req, error = _decode_request(HealingRecommendationRequest, "Situation description is required")
+        if error:
+            return error
         
-        # Get all healing codes
-        all_codes = storage.get_healing_codes()
+        situation = req.situation.lower()
+        body_area = req.bodyArea.lower()
+        emotional_state = req.emotionalState.lower()
         
         # Look for relevant codes based on keywords
-        recommended_codes = []
-        
-        # Search priority based on specificity
-        if body_area:
-            # Physical issue with specific body area
-            body_keywords = {
-                'head': ['headache', 'migraine', 'brain', 'skull', 'mind'],
-                'back': ['spine', 'back pain', 'vertebrae', 'posture'],
-                'heart': ['cardiac', 'chest', 'circulation', 'blood pressure'],
-                'stomach': ['digestion', 'intestine', 'gut', 'abdomen'],
-                'throat': ['voice', 'speech', 'throat chakra', 'thyroid'],
-                'eye': ['vision', 'sight', 'perception'],
-                'ear': ['hearing', 'balance', 'sound'],
-            }
-            
-            for code in all_codes:
-                desc = code['description'].lower()
-                if body_area in desc:
-                    recommended_codes.append(code)
-                else:
-                    # Check related keywords
-                    for area, keywords in body_keywords.items():
-                        if body_area == area:
-                            for keyword in keywords:
-                                if keyword in desc:
-                                    recommended_codes.append(code)
-                                    break
-        
-        # Emotional issues
-        if emotional_state and len(recommended_codes) < 3:
-            emotional_keywords = {
-                'anxiety': ['stress', 'worry', 'tension', 'nervousness'],
-                'depression': ['sadness', 'melancholy', 'grief', 'sorrow'],
-                'anger': ['rage', 'irritation', 'frustration', 'temper'],
-                'fear': ['phobia', 'terror', 'dread', 'insecurity'],
-                'love': ['heart', 'connection', 'relationship', 'bonding'],
-                'confidence': ['self-esteem', 'worth', 'value', 'belief'],
-                'peace': ['calm', 'serenity', 'tranquility', 'quiet']
-            }
-            
-            for code in all_codes:
-                if code in recommended_codes:
-                    continue
-                
-                desc = code['description'].lower()
-                if emotional_state in desc:
-                    recommended_codes.append(code)
-                else:
-                    # Check related keywords
-                    for emotion, keywords in emotional_keywords.items():
-                        if emotional_state == emotion:
-                            for keyword in keywords:
-                                if keyword in desc:
-                                    recommended_codes.append(code)
-                                    break
-        
-        # General situation
-        if len(recommended_codes) < 3:
-            for code in all_codes:
-                if code in recommended_codes:
-                    continue
-                
-                if any(keyword in code['description'].lower() for keyword in situation.split()):
-                    recommended_codes.append(code)
-                    if len(recommended_codes) >= 3:
-                        break
-        
-        # If still not enough, add some general codes
-        if len(recommended_codes) < 2:
-            # Add codes for general wellbeing
-            general_codes = [code for code in all_codes if 
-                            ('general' in code['description'].lower() or
-                             'wellbeing' in code['description'].lower() or
-                             'balance' in code['description'].lower())]
-            
-            for code in general_codes:
-                if code not in recommended_codes:
-                    recommended_codes.append(code)
-                    if len(recommended_codes) >= 3:
-                        break
+        recommended_codes = storage.recommend_healing_codes(situation, body_area, emotional_state)
         
         # Generate practice recommendation based on situation
         if body_area:
@@ -1755,17 +2821,36 @@ if HAS_FLASK:
             practice = "Recite each code 9 times while visualizing golden light surrounding you."
         
         return jsonify({
-            "recommended_codes": recommended_codes[:3],  # Return top 3 recommendations
+            "recommended_codes": recommended_codes,  # Top 3 recommendations
             "explanation": f"These codes were selected based on your specific needs related to {situation}",
             "recommended_practice": practice
         })
 
+    # HTTP caching for database-backed listings
+    @app.before_request
+    def check_etag():
+        """Answer a conditional GET with 304 before any storage query when the data is unchanged"""
+        if request.method != 'GET' or request.endpoint not in HTTP_CACHEABLE_ENDPOINTS:
+            return None
+        
+        version_key = f"{storage.data_version()}:{request.full_path}"
+        g.etag = hashlib.sha256(version_key.encode('utf-8')).hexdigest()[:32]
+        if g.etag in request.if_none_match:
+            return app.response_class(status=304)
+        return None
+    
+    @app.after_request
+    def add_etag_headers(response):
+        etag = g.get('etag')
+        if etag is not None and response.status_code in (200, 304):
+            response.set_etag(etag)
+            response.headers['Cache-Control'] = HTTP_CACHE_CONTROL
+        return response
+
     # CORS support for API access
     @app.after_request
     def add_cors_headers(response):
-        response.headers.add('Access-Control-Allow-Origin', '*')
-        response.headers.add('Access-Control-Allow-Headers', 'Content-Type,Authorization')
-        response.headers.add('Access-Control-Allow-Methods', 'GET,POST,PUT,DELETE,OPTIONS')
+        response.headers.extend(CORS_HEADERS)
         return response
 
 
@@ -1773,6 +2858,11 @@ if HAS_FLASK:
 # COMMAND LINE INTERFACE
 #########################################
 
+# Interactive menu choices, in menu order (broadcasting offers all but platonic solids)
+FIELD_TYPES = ("torus", "merkaba", "metatron", "sri_yantra", "flower_of_life", "platonic_solid")
+BROADCAST_FIELD_TYPES = FIELD_TYPES[:5]
+SOLID_TYPES = tuple(PLATONIC_PROPERTIES)
+
 class SacredHealer:
     """Main class for the Sacred Healing CLI"""
     
@@ -1791,25 +2881,10 @@ class SacredHealer:
         """Generate a sacred geometry field"""
         logger.info(f"Generating {field_type} field for intention: '{intention}'")
         
-        if field_type == "torus":
-            frequency = float(kwargs.get('frequency', SCHUMANN_RESONANCE))
-            return SacredGeometryCalculator.torus_field_generator(intention, frequency)
-        elif field_type == "merkaba":
-            frequency = float(kwargs.get('frequency', SCHUMANN_RESONANCE))
-            return SacredGeometryCalculator.merkaba_field_generator(intention, frequency)
-        elif field_type == "metatron":
-            boost = kwargs.get('boost', False)
-            return SacredGeometryCalculator.metatrons_cube_amplifier(intention, boost)
-        elif field_type == "sri_yantra":
-            return SacredGeometryCalculator.sri_yantra_encoder(intention)
-        elif field_type == "flower_of_life":
-            duration = int(kwargs.get('duration', 60))
-            return SacredGeometryCalculator.flower_of_life_pattern(intention, duration)
-        elif field_type == "platonic_solid":
-            solid_type = kwargs.get('solid_type', 'dodecahedron')
-            return SacredGeometryCalculator.platonic_solid_resonator(intention, solid_type)
-        else:
+        generator = FIELD_GENERATORS.get(field_type)
+        if generator is None:
             raise ValueError(f"Unknown field type: {field_type}")
+        return generator(intention, **kwargs)
     
     def create_packet(self, intention: str, frequency: float = SCHUMANN_RESONANCE, field_type: str = "torus") -> Dict[str, Any]:
         """Create an intention packet"""
@@ -1824,32 +2899,14 @@ class SacredHealer:
     
     def save_to_file(self, data: Dict[str, Any], filename: str) -> None:
         """Save data to a JSON file"""
-        with open(filename, 'w') as f:
-            json.dump(data, f, indent=2)
+        with open(filename, 'wb') as f:
+            f.write(_dumps_indented_bytes(data))
         logger.info(f"Data saved to {filename}")
     
     def get_healing_code(self, query: str) -> List[Dict[str, Any]]:
         """Search for healing codes"""
-        if HAS_FUZZY_SEARCH:
-            # Use fuzzy matching for better results
-            all_codes = self.storage.get_healing_codes()
-            
-            # Search by code
-            code_matches = process.extract(query, [c['code'] for c in all_codes], scorer=fuzz.token_set_ratio)
-            code_ids = [i for i, (_, score) in enumerate(code_matches) if score > 70]
-            
-            # Search by description
-            desc_matches = process.extract(query, [c['description'] for c in all_codes], scorer=fuzz.token_set_ratio)
-            desc_ids = [i for i, (_, score) in enumerate(desc_matches) if score > 70]
-            
-            # Combine results
-            result_ids = set(code_ids + desc_ids)
-            results = [all_codes[i] for i in result_ids]
-            
-            return results
-        else:
-            # Fall back to simple search
-            return self.storage.search_healing_codes(query)
+        # Fuzzy matching when rapidfuzz is available, simple search otherwise
+        return self.storage.fuzzy_search_healing_codes(query, limit=None)
     
     def run_interactive_cli(self):
         """Run an interactive CLI"""
@@ -1877,13 +2934,12 @@ class SacredHealer:
                 print("6. Platonic Solid")
                 
                 field_choice = input("\nSelect field type (1-6): ")
-                field_types = ["torus", "merkaba", "metatron", "sri_yantra", "flower_of_life", "platonic_solid"]
                 
                 try:
-                    field_type = field_types[int(field_choice) - 1]
+                    field_type = FIELD_TYPES[int(field_choice) - 1]
                     
                     kwargs = {}
-                    if field_type in ["torus", "merkaba"]:
+                    if field_type in ("torus", "merkaba"):
                         frequency = input("Enter frequency (default 7.83 Hz): ")
                         if frequency:
                             kwargs['frequency'] = float(frequency)
@@ -1903,9 +2959,8 @@ class SacredHealer:
                         print("5. Icosahedron (Water)")
                         
                         solid_choice = input("\nSelect solid type (1-5): ")
-                        solid_types = ["tetrahedron", "hexahedron", "octahedron", "dodecahedron", "icosahedron"]
                         if 1 <= int(solid_choice) <= 5:
-                            kwargs['solid_type'] = solid_types[int(solid_choice) - 1]
+                            kwargs['solid_type'] = SOLID_TYPES[int(solid_choice) - 1]
                     
                     result = self.generate_field(intention, field_type, **kwargs)
                     print("\nGenerated Field Data:")
@@ -1951,10 +3006,9 @@ class SacredHealer:
                 print("5. Flower of Life")
                 
                 field_choice = input("\nSelect field type (1-5): ")
-                field_types = ["torus", "merkaba", "metatron", "sri_yantra", "flower_of_life"]
                 
                 try:
-                    field_type = field_types[int(field_choice) - 1]
+                    field_type = BROADCAST_FIELD_TYPES[int(field_choice) - 1]
                     result = self.create_packet(intention, frequency, field_type)
                     
                     print("\nIntention Packet Generated:")
@@ -1986,13 +3040,12 @@ class SacredHealer:
                 print("6. Platonic Solid")
                 
                 field_choice = input("\nSelect field type (1-6): ")
-                field_types = ["torus", "merkaba", "metatron", "sri_yantra", "flower_of_life", "platonic_solid"]
                 
                 try:
-                    field_type = field_types[int(field_choice) - 1]
+                    field_type = FIELD_TYPES[int(field_choice) - 1]
                     
                     kwargs = {}
-                    if field_type in ["torus", "merkaba"]:
+                    if field_type in ("torus", "merkaba"):
                         frequency = input("Enter frequency (default 7.83 Hz): ")
                         if frequency:
                             kwargs['frequency'] = float(frequency)
@@ -2010,7 +3063,7 @@ class SacredHealer:
                     field_data = self.generate_field(intention, field_type, **kwargs)
                     
                     description = input("Enter description (optional): ")
-                    frequency_str = str(kwargs.get('frequency', SCHUMANN_RESONANCE)) if field_type in ["torus", "merkaba"] else str(SCHUMANN_RESONANCE)
+                    frequency_str = str(kwargs.get('frequency', SCHUMANN_RESONANCE)) if field_type in ("torus", "merkaba") else str(SCHUMANN_RESONANCE)
                     
                     archive = self.storage.create_soul_archive(
                         title=title,
@@ -2077,18 +3130,9 @@ class SacredIntentionBroadcaster:
         
         # Calculate sacred geometry data
         geometry_data = None
-        if field_type == "torus":
-            geometry_data = SacredGeometryCalculator.torus_field_generator(intention, frequency)
-        elif field_type == "merkaba":
-            geometry_data = SacredGeometryCalculator.merkaba_field_generator(intention, frequency)
-        elif field_type == "metatron":
-            geometry_data = SacredGeometryCalculator.metatrons_cube_amplifier(intention, amplify)
-        elif field_type == "sri_yantra":
-            geometry_data = SacredGeometryCalculator.sri_yantra_encoder(intention)
-        elif field_type == "flower_of_life":
-            geometry_data = SacredGeometryCalculator.flower_of_life_pattern(intention, 60)
-        elif field_type == "platonic_solid":
-            geometry_data = SacredGeometryCalculator.platonic_solid_resonator(intention)
+        generator = FIELD_GENERATORS.get(field_type)
+        if generator is not None:
+            geometry_data = generator(intention, frequency=frequency, boost=amplify)
         
         # Apply divine amplification if requested
         amplified_data = None
@@ -2096,9 +3140,10 @@ class SacredIntentionBroadcaster:
             amplified_data = SacredGeometryCalculator.divine_proportion_amplify(intention, multiplier)
             logger.info(f"Divine amplification applied. Fibonacci multiplier: {amplified_data['fibonacci_multiplier']}")
         
-        # Extract intention from packet to verify
-        extracted = extract_intention_from_packet(packet_base64)
-        logger.info(f"Verification - extracted intention: '{extracted}'")
+        # Decoding the packet back is only a sanity check, so only do it when debugging
+        if self.debug:
+            extracted = extract_intention_from_packet(packet_base64)
+            logger.info(f"Verification - extracted intention: '{extracted}'")
         
         # Return result
         result = {
@@ -2124,7 +3169,24 @@ class SacredIntentionBroadcaster:
 # MAIN APPLICATION
 #########################################
 
-def run_api_server(port: int = API_PORT):
+if HAS_FLASK and HAS_GUNICORN:
+    class GunicornServer(BaseApplication):
+        """Embedded gunicorn server running the Flask app with threaded workers"""
+        
+        def __init__(self, application, options: Dict[str, Any]):
+            self.application = application
+            self.options = options
+            super().__init__()
+        
+        def load_config(self):
+            for key, value in self.options.items():
+                self.cfg.set(key, value)
+        
+        def load(self):
+            return self.application
+
+
+def run_api_server(port: int = API_PORT, workers: int = API_WORKERS, threads: int = API_THREADS):
     """Run the application in Flask API mode"""
     if not HAS_FLASK:
         logger.error("Flask is required for API mode. Install it with 'pip install flask'")
@@ -2134,12 +3196,29 @@ def run_api_server(port: int = API_PORT):
     
     # Open browser
     try:
+        import webbrowser
         webbrowser.open(f"http://localhost:{port}")
     except Exception:
         logger.info(f"Please open your browser to http://localhost:{port}")
     
+    # Serve with gunicorn's threaded workers when available, so concurrent
+    # requests overlap on SQLite I/O instead of queueing behind one another
+    # Each worker gets its own OpenAI handler, pacing itself to its share
+    # of the rate limits, once it has forked from the master
+    if HAS_GUNICORN:
+        app.config['API_WORKERS'] = workers
+        GunicornServer(app, {
+            'bind': f"0.0.0.0:{port}",
+            'workers': workers,
+            'threads': threads,
+            'worker_class': 'gthread',
+            'post_worker_init': lambda worker: _get_openai_handler(),
+        }).run()
+        return
+    
     # Start Flask server
-    app.run(host="0.0.0.0", port=port, debug=False)
+    _get_openai_handler()
+    app.run(host="0.0.0.0", port=port, debug=False, threaded=True)
 
 
 async def run_broadcast_mode(
@@ -2172,8 +3251,8 @@ async def run_broadcast_mode(
     
     # Save to file if requested
     if output:
-        with open(output, 'w') as f:
-            json.dump(result, f, indent=2)
+        with open(output, 'wb') as f:
+            f.write(_dumps_indented_bytes(result))
         logger.info(f"Intention data saved to {output}")
     
     print("Packet ready for transmission to end users")
@@ -2185,6 +3264,13 @@ def run_cli_mode(debug: bool = False):
     healer.run_interactive_cli()
 
 
+def run_coroutine(coro):
+    """Run a coroutine to completion, on uvloop's event loop when available"""
+    if HAS_UVLOOP:
+        asyncio.set_event_loop_policy(uvloop.EventLoopPolicy())
+    return asyncio.run(coro)
+
+
 def main():
     """Main function for command-line usage"""
     parser = argparse.ArgumentParser(description="Sacred Healing API")
@@ -2204,6 +3290,8 @@ def main():
     
     # API options
     parser.add_argument("--port", type=int, default=API_PORT, help="API server port")
+    parser.add_argument("--workers", type=int, default=API_WORKERS, help="API worker processes (gunicorn)")
+    parser.add_argument("--threads", type=int, default=API_THREADS, help="Threads per API worker (gunicorn)")
     
     args = parser.parse_args()
     
@@ -2213,13 +3301,13 @@ def main():
     
     # Run appropriate mode
     if args.mode == "api":
-        run_api_server(args.port)
+        run_api_server(args.port, args.workers, args.threads)
     
     elif args.mode == "broadcast":
         if not args.intention:
             print("Error: --intention is required for broadcast mode")
             return
-        asyncio.run(run_broadcast_mode(
+        run_coroutine(run_broadcast_mode(
             intention=args.intention,
             frequency=args.frequency,
             field_type=args.field_type,
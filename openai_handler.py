@@ -2,29 +2,770 @@
 OpenAI Integration for Sacred Computing Platform
 """
 import os
+import re
 import json
+import time
+import asyncio
+import bisect
+import functools
+import hashlib
+import heapq
+import itertools
 import logging
-from typing import Dict, Any, List, Optional
+import sqlite3
+import threading
+from collections import Counter, OrderedDict
+from typing import Dict, Any, AsyncIterator, Iterable, Iterator, List, Optional, Set, Tuple
 
-# Setup logging
-logging.basicConfig(level=logging.INFO, 
-                   format='%(asctime)s - %(name)s - %(levelname)s - %(message)s')
+# Module logger; logging is configured by the importing application
 logger = logging.getLogger("openai_handler")
 
 # Check if OpenAI is available, but make it optional
 try:
     import openai
+    import httpx  # Installed with openai; backs the pooled async client
     OPENAI_AVAILABLE = True
 except ImportError:
     OPENAI_AVAILABLE = False
     logger.warning("OpenAI package not installed. AI-enhanced functions will be limited.")
 
+# httpx's own async connection pool degrades under heavy concurrency; with
+# the optional httpx-aiohttp package installed the async client sends requests
+# through aiohttp instead (it is not pinned in the requirements)
+try:
+    from httpx_aiohttp import HttpxAiohttpClient
+    AIOHTTP_TRANSPORT_AVAILABLE = True
+except ImportError:
+    AIOHTTP_TRANSPORT_AVAILABLE = False
+
+# tiktoken counts prompt tokens exactly for the rate limiter; otherwise they are estimated
+try:
+    import tiktoken
+    TIKTOKEN_AVAILABLE = True
+except ImportError:
+    TIKTOKEN_AVAILABLE = False
+
+# NumPy backs the semantic cache's embedding matrix; without it only exact matches are cached
+try:
+    import numpy as np
+    NUMPY_AVAILABLE = True
+except ImportError:
+    NUMPY_AVAILABLE = False
+
+# Aho-Corasick finds every fallback keyword in one pass over the descriptions
+try:
+    import ahocorasick
+    AHOCORASICK_AVAILABLE = True
+except ImportError:
+    AHOCORASICK_AVAILABLE = False
+
+# Chat model for every completion; the four-field enhancement and short
+# recommendation tasks do not need a larger model, but callers can opt in
+DEFAULT_MODEL = "gpt-4o-mini"
+
+# Sync and async connection pool limits, and the request timeout (seconds)
+SYNC_MAX_CONNECTIONS = 50
+SYNC_MAX_KEEPALIVE_CONNECTIONS = 20
+ASYNC_MAX_CONNECTIONS = 100
+ASYNC_MAX_KEEPALIVE_CONNECTIONS = 50
+OPENAI_TIMEOUT = 60.0
+
+# Retries of rate-limited (429), server (5xx), timed-out and dropped requests;
+# the client backs off exponentially with jitter and honors Retry-After
+OPENAI_MAX_RETRIES = 5
+
+# Sacred geometry fields a response may recommend
+VALID_FIELD_TYPES = frozenset({"torus", "merkaba", "metatron", "sri_yantra", "flower_of_life"})
+
+# Structured output format of an intention enhancement (and of a packed batch
+# of them); strict mode makes the model return exactly these fields as JSON
+ENHANCEMENT_SCHEMA = {
+    "type": "object",
+    "properties": {
+        "enhanced_intention": {"type": "string"},
+        "rationale": {"type": "string"},
+        "recommended_field": {"type": "string", "enum": sorted(VALID_FIELD_TYPES)},
+        "frequency_hz": {"type": "number"}
+    },
+    "required": ["enhanced_intention", "rationale", "recommended_field", "frequency_hz"],
+    "additionalProperties": False
+}
+ENHANCEMENT_RESPONSE_FORMAT = {
+    "type": "json_schema",
+    "json_schema": {"name": "enhanced_intention", "strict": True, "schema": ENHANCEMENT_SCHEMA}
+}
+ENHANCEMENT_BATCH_RESPONSE_FORMAT = {
+    "type": "json_schema",
+    "json_schema": {
+        "name": "enhanced_intentions",
+        "strict": True,
+        "schema": {
+            "type": "object",
+            "properties": {"enhancements": {"type": "array", "items": ENHANCEMENT_SCHEMA}},
+            "required": ["enhancements"],
+            "additionalProperties": False
+        }
+    }
+}
+
+# Healing codes listed in a chat-model ranking prompt, and the characters of
+# each description included
+SEMANTIC_MATCH_PROMPT_CODES = 100
+SEMANTIC_MATCH_DESCRIPTION_CHARS = 200
+
+# Structured output format of a chat-model healing code ranking
+SEMANTIC_MATCH_RESPONSE_FORMAT = {
+    "type": "json_schema",
+    "json_schema": {
+        "name": "healing_code_ids",
+        "strict": True,
+        "schema": {
+            "type": "object",
+            "properties": {
+                "ids": {"type": "array", "items": {"anyOf": [{"type": "integer"}, {"type": "string"}]}}
+            },
+            "required": ["ids"],
+            "additionalProperties": False
+        }
+    }
+}
+
+# Result key filled by each field of an enhancement response, in generation order
+ENHANCEMENT_RESULT_KEYS = {
+    "enhanced_intention": "recommended_intention",
+    "rationale": "reason",
+    "recommended_field": "suggested_field_type",
+    "frequency_hz": "suggested_frequency"
+}
+
+# Intentions packed into one completion by aenhance_intention_batched, and the
+# longest a request waits for others to join it (seconds)
+INTENTION_BATCH_SIZE = 16
+INTENTION_BATCH_WAIT = 0.2
+
+# Completion tokens allowed per enhanced intention; a strict JSON reply cut
+# off at this limit cannot be parsed
+INTENTION_MAX_TOKENS = 300
+
+# Context line of the intention prompt, per intention context
+CONTEXT_PROMPTS = {
+    "healing": "This intention is for physical or emotional healing.",
+    "manifestation": "This intention is for manifesting abundance or opportunities.",
+    "protection": "This intention is for spiritual or energetic protection.",
+    "transformation": "This intention is for personal transformation and growth.",
+    "connection": "This intention is for spiritual connection or higher consciousness."
+}
+DEFAULT_CONTEXT_PROMPT = "This is a general intention."
+
+# Offline enhancements per context: (intention template, field type, frequency, reason)
+FALLBACK_ENHANCEMENTS = {
+    "healing": (
+        "I am completely healed and vibrant with {}", "flower_of_life", 528.0,
+        "Healing intentions work best with present tense affirmations and the repair frequency of 528Hz"
+    ),
+    "manifestation": (
+        "I am gratefully experiencing {} in my life now", "torus", 7.83,
+        "Manifestation intentions work best with gratitude and present tense phrasing"
+    ),
+    "protection": (
+        "I am divinely protected from all forms of {}", "merkaba", 13.0,
+        "Protection intentions work best with the Merkaba field, which creates a natural energetic boundary"
+    ),
+    "transformation": (
+        "I am easily transforming {} with divine grace", "metatron", 9.0,
+        "Transformation intentions benefit from Metatron's Cube which connects all platonic solids"
+    ),
+    "connection": (
+        "I am deeply connected to {} at all levels of my being", "sri_yantra", 7.83,
+        "Connection intentions work best with Sri Yantra which represents the cosmos and unity consciousness"
+    )
+}
+DEFAULT_FALLBACK_ENHANCEMENT = (
+    "I am in perfect harmony with {}", "torus", 7.83,
+    "This balanced intention works for general purposes and aligns with Earth's natural frequency"
+)
+
+# Intentions outside these lengths (after stripping) get the basic enhancement
+# without a paid API call
+MIN_INTENTION_LENGTH = 3
+MAX_INTENTION_LENGTH = 2000
+INVALID_INTENTION_NOTE = "Basic enhancement provided (intention is empty or outside the supported length)"
+
+# Static system messages; per-call data goes only in the user message, so equal
+# inputs always build the same request and response cache key. Never format
+# per-call data into them.
+INTENTION_SYSTEM_PROMPT = """You are a sacred geometry and intention expert. Enhance the user's intention for optimal resonance and manifestation power.
+
+Write the enhanced version following these sacred intention principles:
+- Present tense phrasing
+- Positive language (avoid negations)
+- Emotional resonance
+- Clarity and specificity
+- Divine alignment
+
+Respond with the enhanced intention, a brief rationale explaining why this wording is more effective, the recommended sacred geometry field, and an optimal frequency in Hz."""
+
+HEALING_SYSTEM_PROMPT = """You are an expert in healing codes and frequencies. Recommend the most effective codes for the user's situation, based on your expertise with Grabovoi codes and healing frequencies.
+
+Include:
+1. At least 3 relevant healing codes with descriptions
+2. A suggested practice for applying these codes
+3. Any affirmations that would complement the codes"""
+
+SEMANTIC_MATCH_SYSTEM_PROMPT = """You are a semantic matching system that connects health issues with the most relevant healing codes based on meaning and context, not just keywords.
+
+Given a database of healing codes and a user's health issue or concern, identify the 5 most semantically relevant healing codes based on their descriptions and intended purposes. Respond with their IDs, ranked by relevance."""
+
+# Client-side request shaping, kept under the account's OpenAI rate limits
+MAX_REQUESTS_PER_MINUTE = 5000
+MAX_TOKENS_PER_MINUTE = 15000000
+MAX_CONCURRENT_REQUESTS = 250
+
+
+class CompletionTruncatedError(ValueError):
+    """A structured completion was cut off at max_tokens, so its JSON is incomplete"""
+
+
+class RateLimiter:
+    """
+    Thread-safe request and token buckets refilled continuously per minute
+    
+    Callers reserve capacity up front and wait out any deficit, so requests
+    are paced on the client instead of being rejected with 429s.
+    """
+    
+    def __init__(self, requests_per_minute: float = MAX_REQUESTS_PER_MINUTE,
+                 tokens_per_minute: float = MAX_TOKENS_PER_MINUTE):
+        self.requests_per_minute = requests_per_minute
+        self.tokens_per_minute = tokens_per_minute
+        self._requests = float(requests_per_minute)
+        self._tokens = float(tokens_per_minute)
+        self._updated = time.monotonic()
+        self._lock = threading.Lock()
+    
+    def _reserve(self, tokens: int) -> float:
+        """Take one request and the tokens from the buckets, returning how long to wait for them"""
+        with self._lock:
+            now = time.monotonic()
+            elapsed = now - self._updated
+            self._updated = now
+            self._requests = min(self.requests_per_minute, self._requests + elapsed * self.requests_per_minute / 60)
+            self._tokens = min(self.tokens_per_minute, self._tokens + elapsed * self.tokens_per_minute / 60)
+            
+            self._requests -= 1
+            self._tokens -= tokens
+            return max(0.0,
+                       -self._requests * 60 / self.requests_per_minute,
+                       -self._tokens * 60 / self.tokens_per_minute)
+    
+    def acquire(self, tokens: int) -> None:
+        """Block until a request of this many tokens fits under the limits"""
+        wait = self._reserve(tokens)
+        if wait:
+            time.sleep(wait)
+    
+    async def aacquire(self, tokens: int) -> None:
+        """Wait without blocking the event loop until a request of this many tokens fits under the limits"""
+        wait = self._reserve(tokens)
+        if wait:
+            await asyncio.sleep(wait)
+    
+    def update_from_headers(self, headers: Any) -> None:
+        """Lower the buckets to the remaining capacity the server reports"""
+        try:
+            remaining_requests = headers.get("x-ratelimit-remaining-requests")
+            remaining_tokens = headers.get("x-ratelimit-remaining-tokens")
+            with self._lock:
+                if remaining_requests is not None:
+                    self._requests = min(self._requests, float(remaining_requests))
+                if remaining_tokens is not None:
+                    self._tokens = min(self._tokens, float(remaining_tokens))
+        except (TypeError, ValueError):
+            pass
+
+
+@functools.lru_cache(maxsize=None)
+def _token_encoding(model: str):
+    """tiktoken encoding for a model, falling back to the GPT-4 family's"""
+    try:
+        return tiktoken.encoding_for_model(model)
+    except KeyError:
+        return tiktoken.get_encoding("cl100k_base")
+
+
+def estimate_request_tokens(request: Dict[str, Any]) -> int:
+    """Prompt tokens plus the completion budget of a chat completion request"""
+    text = "".join(message["content"] for message in request["messages"])
+    if TIKTOKEN_AVAILABLE:
+        prompt_tokens = len(_token_encoding(request["model"]).encode(text))
+    else:
+        prompt_tokens = len(text) // 4 + 1  # About four characters per token in English
+    return prompt_tokens + request.get("max_tokens", 0)
+
+
+# Issues matched at once by asemantic_healing_code_match_many
+SEMANTIC_MATCH_CONCURRENCY = 20
+
+# Below this many fallback keywords repeated str.find scans beat building and
+# running an Aho-Corasick automaton (about 20 on the bundled code descriptions)
+FALLBACK_AHOCORASICK_MIN_KEYWORDS = 20
+
+# Batch API completion window, and the first and longest delay between status polls (seconds)
+BATCH_COMPLETION_WINDOW = "24h"
+BATCH_POLL_INTERVAL = 5.0
+BATCH_MAX_POLL_INTERVAL = 300.0
+
+# Parsed responses remembered per identical request, and for how long (seconds)
+RESPONSE_CACHE_SIZE = 1024
+RESPONSE_CACHE_TTL = 3600
+
+
+class ResponseCache:
+    """Thread-safe LRU cache of parsed OpenAI responses with a time-to-live"""
+    
+    def __init__(self, maxsize: int = RESPONSE_CACHE_SIZE, ttl: float = RESPONSE_CACHE_TTL):
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self._entries = OrderedDict()  # key -> (expiry time, value)
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+    
+    @staticmethod
+    def key(request: Dict[str, Any]) -> str:
+        """SHA-256 of the canonical JSON form of a request"""
+        canonical = json.dumps(request, sort_keys=True, separators=(',', ':'), ensure_ascii=False)
+        return hashlib.sha256(canonical.encode('utf-8')).hexdigest()
+    
+    def get(self, key: str) -> Optional[Dict[str, Any]]:
+        """Get a copy of the cached value, or None when missing or expired"""
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None or entry[0] < time.monotonic():
+                if entry is not None:
+                    del self._entries[key]
+                self.misses += 1
+                return None
+            self._entries.move_to_end(key)
+            self.hits += 1
+            return dict(entry[1])
+    
+    def set(self, key: str, value: Dict[str, Any]) -> None:
+        """Store a copy of the value, evicting the least recently used entry when full"""
+        with self._lock:
+            self._entries[key] = (time.monotonic() + self.ttl, dict(value))
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.maxsize:
+                self._entries.popitem(last=False)
+    
+    @property
+    def stats(self) -> Dict[str, int]:
+        """Hit, miss and size counters"""
+        return {"hits": self.hits, "misses": self.misses, "size": len(self._entries)}
+
+
+# Responses kept on disk by the persistent cache
+RESPONSE_DISK_CACHE_SIZE = 100000
+
+# Prune expired and surplus rows after this many persistent cache writes
+RESPONSE_DISK_CACHE_PRUNE_EVERY = 256
+
+
+class PersistentResponseCache(ResponseCache):
+    """
+    ResponseCache backed by SQLite, so a warm cache survives restarts and is
+    shared by processes using the same file
+    
+    Recently used entries stay in the in-memory LRU; misses fall through to disk.
+    """
+    
+    def __init__(self, path: str, maxsize: int = RESPONSE_CACHE_SIZE, ttl: float = RESPONSE_CACHE_TTL,
+                 disk_size: int = RESPONSE_DISK_CACHE_SIZE):
+        super().__init__(maxsize, ttl)
+        self.path = path
+        self.disk_size = disk_size
+        self._writes = 0
+        self._db = sqlite3.connect(path, check_same_thread=False, isolation_level=None)
+        self._db.execute('PRAGMA journal_mode=WAL')
+        self._db.execute('PRAGMA synchronous=NORMAL')
+        self._db.execute(
+            'CREATE TABLE IF NOT EXISTS responses (key TEXT PRIMARY KEY, expires REAL NOT NULL, value TEXT NOT NULL)'
+        )
+        self._db.execute('CREATE INDEX IF NOT EXISTS responses_expires ON responses (expires)')
+        self._prune()
+    
+    def get(self, key: str) -> Optional[Dict[str, Any]]:
+        """Get a copy of the cached value from memory, then disk; None when missing or expired"""
+        value = super().get(key)
+        if value is not None:
+            return value
+        
+        with self._lock:
+            row = self._db.execute(
+                'SELECT expires, value FROM responses WHERE key = ? AND expires > ?', (key, time.time())
+            ).fetchone()
+            if row is None:
+                return None
+            
+            # Promote to memory for the rest of its lifetime; it was counted as a miss there
+            value = json.loads(row[1])
+            self._entries[key] = (time.monotonic() + row[0] - time.time(), value)
+            while len(self._entries) > self.maxsize:
+                self._entries.popitem(last=False)
+            self.misses -= 1
+            self.hits += 1
+            return dict(value)
+    
+    def set(self, key: str, value: Dict[str, Any]) -> None:
+        """Store a copy of the value in memory and on disk"""
+        super().set(key, value)
+        with self._lock:
+            self._db.execute(
+                'INSERT OR REPLACE INTO responses (key, expires, value) VALUES (?, ?, ?)',
+                (key, time.time() + self.ttl, json.dumps(value, ensure_ascii=False))
+            )
+            self._writes += 1
+            if self._writes % RESPONSE_DISK_CACHE_PRUNE_EVERY == 0:
+                self._prune()
+    
+    def _prune(self) -> None:
+        """Delete expired rows, then the soonest-expiring rows beyond disk_size"""
+        self._db.execute('DELETE FROM responses WHERE expires <= ?', (time.time(),))
+        self._db.execute(
+            'DELETE FROM responses WHERE key IN '
+            '(SELECT key FROM responses ORDER BY expires DESC LIMIT -1 OFFSET ?)', (self.disk_size,)
+        )
+    
+    def close(self) -> None:
+        """Close the SQLite connection"""
+        with self._lock:
+            self._db.close()
+
+
+# Embedding model for the semantic cache, cached intentions kept, and the
+# cosine similarity above which a stored response is reused
+EMBEDDING_MODEL = "text-embedding-3-small"
+SEMANTIC_CACHE_SIZE = 4096
+SEMANTIC_CACHE_THRESHOLD = 0.92
+
+# Healing code descriptions embedded per request (the embeddings endpoint takes up to 2048 inputs)
+EMBEDDING_BATCH_SIZE = 2048
+
+# Longest a process waits for another to finish embedding healing codes into
+# a shared EmbeddingStore (seconds), and keys looked up per store query
+EMBEDDING_STORE_LOCK_TIMEOUT = 600.0
+EMBEDDING_STORE_QUERY_SIZE = 500
+
+
+class SemanticCache:
+    """Thread-safe LRU cache of parsed responses keyed by normalized embeddings, reused for near-duplicate inputs"""
+    
+    def __init__(self, maxsize: int = SEMANTIC_CACHE_SIZE, threshold: float = SEMANTIC_CACHE_THRESHOLD):
+        self.maxsize = maxsize
+        self.threshold = threshold
+        self._matrix = None  # (maxsize, dim) float32 rows of L2-normalized embeddings
+        self._scopes = np.zeros(maxsize, dtype=np.int32)  # Scope id per row
+        self._last_used = np.zeros(maxsize, dtype=np.int64)  # Use tick per row, for LRU eviction
+        self._values = []
+        self._scope_ids = {}
+        self._tick = 0
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+    
+    @staticmethod
+    def _normalize(embedding: List[float]) -> "np.ndarray":
+        vector = np.asarray(embedding, dtype=np.float32)
+        norm = np.linalg.norm(vector)
+        return vector / norm if norm else vector
+    
+    def get(self, embedding: List[float], scope: str) -> Optional[Dict[str, Any]]:
+        """Get a copy of the response stored for the most similar input in the same scope, if similar enough"""
+        query = self._normalize(embedding)
+        with self._lock:
+            count = len(self._values)
+            scope_id = self._scope_ids.get(scope)
+            if count == 0 or scope_id is None or self._matrix.shape[1] != query.shape[0]:
+                self.misses += 1
+                return None
+            
+            # One matrix-vector product scores every stored input
+            similarities = self._matrix[:count] @ query
+            similarities[self._scopes[:count] != scope_id] = -1.0
+            best = int(np.argmax(similarities))
+            if similarities[best] < self.threshold:
+                self.misses += 1
+                return None
+            
+            self._tick += 1
+            self._last_used[best] = self._tick
+            self.hits += 1
+            return dict(self._values[best])
+    
+    def set(self, embedding: List[float], scope: str, value: Dict[str, Any]) -> None:
+        """Store a copy of the response, replacing the least recently used row when full"""
+        vector = self._normalize(embedding)
+        with self._lock:
+            if self._matrix is None or self._matrix.shape[1] != vector.shape[0]:
+                # First entry, or the embedding model changed: start over
+                self._matrix = np.zeros((self.maxsize, vector.shape[0]), dtype=np.float32)
+                self._last_used[:] = 0
+                self._values = []
+            
+            if len(self._values) < self.maxsize:
+                row = len(self._values)
+                self._values.append(None)
+            else:
+                row = int(np.argmin(self._last_used))
+            
+            self._tick += 1
+            self._matrix[row] = vector
+            self._scopes[row] = self._scope_ids.setdefault(scope, len(self._scope_ids))
+            self._last_used[row] = self._tick
+            self._values[row] = dict(value)
+    
+    @property
+    def stats(self) -> Dict[str, int]:
+        """Hit, miss and size counters"""
+        return {"hits": self.hits, "misses": self.misses, "size": len(self._values)}
+
+
+class EmbeddingStore:
+    """
+    Healing code embeddings persisted in SQLite, keyed on a hash of the model and text
+    
+    Processes sharing the file (e.g. server workers) load the vectors one of
+    them paid for. Embedding runs under the file's write lock (see lock), so
+    processes starting together embed each text once.
+    """
+    
+    def __init__(self, path: str):
+        self.path = path
+        db = self._connect()
+        try:
+            db.execute('PRAGMA journal_mode=WAL')
+            db.execute('CREATE TABLE IF NOT EXISTS code_embeddings (key TEXT PRIMARY KEY, vector BLOB NOT NULL)')
+        finally:
+            db.close()
+    
+    def _connect(self, timeout: float = EMBEDDING_STORE_LOCK_TIMEOUT) -> sqlite3.Connection:
+        # A connection per call, so the store is safe across threads and forks
+        return sqlite3.connect(self.path, timeout=timeout, isolation_level=None)
+    
+    @staticmethod
+    def key(text: str) -> str:
+        """Storage key of a text's embedding under EMBEDDING_MODEL"""
+        return hashlib.sha256(f"{EMBEDDING_MODEL}\x00{text}".encode("utf-8")).hexdigest()
+    
+    def load(self, texts: List[str]) -> Dict[str, "np.ndarray"]:
+        """Stored embeddings of whichever texts have one"""
+        texts_by_key = {self.key(text): text for text in texts}
+        keys = list(texts_by_key)
+        found = {}
+        db = self._connect()
+        try:
+            for start in range(0, len(keys), EMBEDDING_STORE_QUERY_SIZE):
+                chunk = keys[start:start + EMBEDDING_STORE_QUERY_SIZE]
+                rows = db.execute(
+                    f"SELECT key, vector FROM code_embeddings WHERE key IN ({','.join('?' * len(chunk))})", chunk
+                )
+                for key, vector in rows:
+                    found[texts_by_key[key]] = np.frombuffer(vector, dtype=np.float32)
+        finally:
+            db.close()
+        return found
+    
+    def lock(self, wait: bool) -> Optional[sqlite3.Connection]:
+        """
+        Take the file's write lock, returning a connection in an open transaction
+        
+        Returns None when another process holds the lock and wait is False.
+        Commit (or close) the connection to release the lock.
+        """
+        db = self._connect(EMBEDDING_STORE_LOCK_TIMEOUT if wait else 0)
+        try:
+            db.execute('BEGIN IMMEDIATE')
+        except sqlite3.OperationalError:
+            db.close()
+            if wait:
+                raise
+            return None
+        return db
+    
+    def save(self, db: sqlite3.Connection, vectors: Dict[str, "np.ndarray"]) -> None:
+        """Store embeddings through a connection returned by lock"""
+        db.executemany(
+            'INSERT OR REPLACE INTO code_embeddings (key, vector) VALUES (?, ?)',
+            [(self.key(text), vector.tobytes()) for text, vector in vectors.items()]
+        )
+
+
+class EnhancementStreamParser:
+    """Decodes a streamed enhancement JSON object incrementally, reporting each field once its value is complete"""
+    
+    KEY_RE = re.compile(r'"(\w+)"\s*:\s*')
+    VALUE_END_RE = re.compile(r'\s*[,}]')
+    
+    def __init__(self):
+        self.fields = {}
+        self._buffer = ""
+        self._pos = 0  # Where the next key starts, after the last complete value
+        self._decoder = json.JSONDecoder()
+    
+    def feed(self, text: str) -> List[str]:
+        """Add streamed text, returning the names of fields completed by it"""
+        self._buffer += text
+        completed = []
+        while True:
+            match = self.KEY_RE.search(self._buffer, self._pos)
+            if match is None:
+                return completed
+            try:
+                value, end = self._decoder.raw_decode(self._buffer, match.end())
+            except json.JSONDecodeError:
+                return completed  # The value is still streaming
+            if not isinstance(value, str) and not self.VALUE_END_RE.match(self._buffer, end):
+                return completed  # A number may still be growing
+            self._pos = end
+            self.fields[match.group(1)] = value
+            completed.append(match.group(1))
+    
+    @property
+    def complete(self) -> bool:
+        """Whether every enhancement field has been received"""
+        return self.fields.keys() >= ENHANCEMENT_RESULT_KEYS.keys()
+
+
+class IntentionBatcher:
+    """Collects concurrent intention enhancements on an event loop and sends them as packed completions"""
+    
+    def __init__(self, handler: "OpenAIHandler", max_batch: int = INTENTION_BATCH_SIZE,
+                 max_wait: float = INTENTION_BATCH_WAIT):
+        self.handler = handler
+        self.max_batch = max_batch
+        self.max_wait = max_wait
+        self._pending = []  # (intention, context, cache key, future)
+        self._flush_timer = None
+        self._tasks = set()
+    
+    def submit(self, original_intention: str, context: str, cache_key: str) -> "asyncio.Future":
+        """Queue an intention, returning a future for its enhancement result"""
+        loop = asyncio.get_running_loop()
+        future = loop.create_future()
+        self._pending.append((original_intention, context, cache_key, future))
+        if len(self._pending) >= self.max_batch:
+            self.flush()
+        elif self._flush_timer is None:
+            self._flush_timer = loop.call_later(self.max_wait, self.flush)
+        return future
+    
+    def flush(self) -> None:
+        """Send everything queued as one completion"""
+        if self._flush_timer is not None:
+            self._flush_timer.cancel()
+            self._flush_timer = None
+        batch, self._pending = self._pending, []
+        if batch:
+            task = asyncio.ensure_future(self.handler._enhance_intention_batch(batch))
+            self._tasks.add(task)
+            task.add_done_callback(self._tasks.discard)
+    
+    async def aclose(self) -> None:
+        """Send everything queued and wait for all sent batches to finish"""
+        self.flush()
+        if self._tasks:
+            await asyncio.gather(*self._tasks)
+
+
+# Sync OpenAI clients shared by every handler using the same API key
+_SYNC_CLIENTS = {}
+_SYNC_CLIENTS_LOCK = threading.Lock()
+
+
+def _forget_sync_clients() -> None:
+    """Drop (without closing) the shared clients inherited from the parent process after a fork"""
+    global _SYNC_CLIENTS, _SYNC_CLIENTS_LOCK
+    _SYNC_CLIENTS = {}
+    _SYNC_CLIENTS_LOCK = threading.Lock()
+
+
+# Forked server workers must not share the parent's pooled connections
+if hasattr(os, 'register_at_fork'):
+    os.register_at_fork(after_in_child=_forget_sync_clients)
+
+
+def _prewarm(client: "openai.OpenAI") -> None:
+    """Make a cheap authenticated request to warm a client's connection pool"""
+    try:
+        client.with_options(max_retries=0).models.list()
+    except Exception as e:
+        logger.debug("Connection prewarm failed: %s", e)
+
+
+def _get_sync_client(api_key: str) -> "openai.OpenAI":
+    """Get the shared sync client for an API key, created with a pooled httpx.Client on first use"""
+    with _SYNC_CLIENTS_LOCK:
+        client = _SYNC_CLIENTS.get(api_key)
+        if client is None:
+            # One long-lived pool so successive calls reuse TCP and TLS sessions
+            http_client = httpx.Client(
+                limits=httpx.Limits(max_connections=SYNC_MAX_CONNECTIONS,
+                                    max_keepalive_connections=SYNC_MAX_KEEPALIVE_CONNECTIONS),
+                timeout=OPENAI_TIMEOUT
+            )
+            client = _SYNC_CLIENTS[api_key] = openai.OpenAI(
+                api_key=api_key, http_client=http_client, max_retries=OPENAI_MAX_RETRIES
+            )
+            
+            # Open a pooled connection in the background so the first
+            # completion skips the TCP and TLS handshake
+            threading.Thread(target=_prewarm, args=(client,), daemon=True).start()
+    return client
+
+
 class OpenAIHandler:
     """Handler for OpenAI API interactions"""
     
-    def __init__(self, api_key: Optional[str] = None):
-        """Initialize the OpenAI handler"""
+    def __init__(self, api_key: Optional[str] = None, model: Optional[str] = None,
+                 cache: Optional[ResponseCache] = None, http_client: Optional["httpx.Client"] = None,
+                 async_http_client: Optional["httpx.AsyncClient"] = None, use_aiohttp: bool = True,
+                 processes: int = 1, embeddings_path: Optional[str] = None):
+        """
+        Initialize the OpenAI handler
+        
+        The model defaults to $OPENAI_MODEL, then DEFAULT_MODEL. Responses are
+        cached in memory, or also on disk when $SACRED_CACHE_PATH names a SQLite
+        file; pass a cache to share one between handlers. Handlers with the same
+        API key share one sync client; pass httpx clients to use an application's
+        connection pools instead. The handler does not close shared clients; a
+        forked child process opens its own shared client on first use.
+        The async pool runs on aiohttp when available, unless use_aiohttp is False.
+        Each of the processes sharing the account's rate limits (e.g. server
+        workers) paces its requests to an equal share of them. Healing code
+        embeddings are kept in the SQLite file embeddings_path (default
+        $SACRED_EMBEDDINGS_PATH), if set, so processes sharing it embed each code once.
+        """
         self.api_key = api_key or os.environ.get("OPENAI_API_KEY")
+        self.model = model or os.environ.get("OPENAI_MODEL", DEFAULT_MODEL)
+        self._owned_cache = None
+        if cache is None:
+            cache_path = os.environ.get("SACRED_CACHE_PATH")
+            cache = self._owned_cache = PersistentResponseCache(cache_path) if cache_path else ResponseCache()
+        self.cache = cache
+        self.semantic_cache = SemanticCache() if NUMPY_AVAILABLE else None
+        self._code_embeddings = {}  # Healing code text -> L2-normalized float32 embedding
+        self._code_index = None  # Per-code fields of the last matched code list (see _index_codes)
+        self._embedding_lock = threading.Lock()  # Held while healing codes are being embedded
+        embeddings_path = embeddings_path or os.environ.get("SACRED_EMBEDDINGS_PATH")
+        self.embedding_store = EmbeddingStore(embeddings_path) if embeddings_path and NUMPY_AVAILABLE else None
+        self._client = None  # Sync client built on a passed-in pool; None uses the shared one
+        self._loop_clients = {}  # Event loop -> its async client state (see _loop_state)
+        self._shared_async_http = async_http_client
+        self.use_aiohttp = use_aiohttp and AIOHTTP_TRANSPORT_AVAILABLE
+        
+        # Every completion is paced by the limiter and bounded in flight
+        self.limiter = RateLimiter(MAX_REQUESTS_PER_MINUTE / processes, MAX_TOKENS_PER_MINUTE / processes)
+        self._slots = threading.BoundedSemaphore(MAX_CONCURRENT_REQUESTS)
         
         if not self.api_key:
             logger.warning("No OpenAI API key found. AI enhancement features disabled.")
@@ -33,178 +774,626 @@ class OpenAIHandler:
             logger.warning("OpenAI package not installed. AI enhancement features disabled.")
             self.enabled = False
         else:
-            self.client = openai.OpenAI(api_key=self.api_key)
+            if http_client is None:
+                _get_sync_client(self.api_key)
+            else:
+                self._client = openai.OpenAI(
+                    api_key=self.api_key, http_client=http_client, max_retries=OPENAI_MAX_RETRIES
+                )
             self.enabled = True
             logger.info("OpenAI handler initialized successfully")
     
+    @property
+    def client(self) -> "openai.OpenAI":
+        """The sync client, looked up per call so handlers inherited across a fork use the child's"""
+        return self._client or _get_sync_client(self.api_key)
+    
+    @client.setter
+    def client(self, client: "openai.OpenAI") -> None:
+        self._client = client
+    
     def enhance_intention(self, original_intention: str, context: str = "general") -> Dict[str, Any]:
         """Enhance an intention with AI recommendations"""
         if not self.enabled:
             # Provide a basic response when OpenAI is not available
             return self._fallback_intention_enhancement(original_intention, context)
+        if not self._should_call_llm(original_intention):
+            return self._fallback_intention_enhancement(original_intention, context, INVALID_INTENTION_NOTE)
         
         try:
-            prompt = self._build_intention_prompt(original_intention, context)
+            request = self._intention_request(original_intention, context)
             
-            response = self.client.chat.completions.create(
-                model="gpt-4-turbo",
-                messages=[
-                    {"role": "system", "content": "You are a sacred geometry and intention expert. Enhance the user's intention for optimal resonance and manifestation power."},
-                    {"role": "user", "content": prompt}
-                ],
-                temperature=0.7,
-                max_tokens=300
-            )
+            # Identical requests reuse the parsed result instead of another round trip
+            cache_key = self.cache.key(request)
+            cached = self.cache.get(cache_key)
+            if cached is not None:
+                return cached
             
-            # Extract the enhanced intention from the response
-            enhancement_text = response.choices[0].message.content
+            # Paraphrases of an earlier intention in the same context reuse its
+            # enhancement, for the price of an embedding instead of a completion
+            embedding = self._embed(original_intention) if self.semantic_cache is not None else None
+            cached = self._semantic_lookup(embedding, original_intention, context)
+            if cached is not None:
+                return cached
             
-            # Parse the structured response
-            return self._parse_enhancement_response(enhancement_text, original_intention, context)
+            result = self._parse_enhancement_response(self._complete(request), original_intention, context)
+            return self._store_enhancement(cache_key, embedding, result, context)
             
         except Exception as e:
-            logger.error(f"Error enhancing intention with OpenAI: {str(e)}")
+            logger.error("Error enhancing intention with OpenAI: %s", e)
             return self._fallback_intention_enhancement(original_intention, context)
     
-    def recommend_healing_codes(self, situation: str, body_area: Optional[str] = None, 
-                              emotional_state: Optional[str] = None) -> Dict[str, Any]:
-        """Get AI-enhanced healing code recommendations"""
+    async def aenhance_intention(self, original_intention: str, context: str = "general") -> Dict[str, Any]:
+        """
+        Enhance an intention with AI recommendations without blocking the event loop
+        
+        Many intentions can be enhanced concurrently over one connection pool:
+            await asyncio.gather(*[handler.aenhance_intention(i, c) for i, c in inputs])
+        """
         if not self.enabled:
-            # Provide a message about the limitation
-            return {
-                "message": "AI-enhanced recommendations unavailable. Please check the healing codes database directly.",
-                "healing_codes_available": True
-            }
+            return self._fallback_intention_enhancement(original_intention, context)
+        if not self._should_call_llm(original_intention):
+            return self._fallback_intention_enhancement(original_intention, context, INVALID_INTENTION_NOTE)
         
         try:
-            prompt = self._build_healing_prompt(situation, body_area, emotional_state)
+            request = self._intention_request(original_intention, context)
             
-            response = self.client.chat.completions.create(
-                model="gpt-4-turbo",
-                messages=[
-                    {"role": "system", "content": "You are an expert in healing codes and frequencies. Recommend the most effective codes for the user's situation."},
-                    {"role": "user", "content": prompt}
-                ],
-                temperature=0.7,
-                max_tokens=500
-            )
+            cache_key = self.cache.key(request)
+            cached = self.cache.get(cache_key)
+            if cached is not None:
+                return cached
             
-            # Extract the recommendations
-            recommendation_text = response.choices[0].message.content
+            embedding = await self._aembed(original_intention) if self.semantic_cache is not None else None
+            cached = self._semantic_lookup(embedding, original_intention, context)
+            if cached is not None:
+                return cached
             
-            # Return a structured format with the AI recommendations
-            return {
-                "ai_recommendation": recommendation_text,
-                "note": "These are AI-enhanced suggestions. Always refer to the official healing codes database for validated codes."
-            }
+            result = self._parse_enhancement_response(await self._acomplete(request), original_intention, context)
+            return self._store_enhancement(cache_key, embedding, result, context)
             
         except Exception as e:
-            logger.error(f"Error getting healing recommendations from OpenAI: {str(e)}")
-            return {
-                "message": f"Error processing AI recommendation: {str(e)}",
-                "healing_codes_available": True
-            }
+            logger.error("Error enhancing intention with OpenAI: %s", e)
+            return self._fallback_intention_enhancement(original_intention, context)
     
-    def _build_intention_prompt(self, original_intention: str, context: str) -> str:
-        """Build the prompt for intention enhancement"""
-        # Context-specific prompts
-        context_prompts = {
-            "healing": "This intention is for physical or emotional healing.",
-            "manifestation": "This intention is for manifesting abundance or opportunities.",
-            "protection": "This intention is for spiritual or energetic protection.",
-            "transformation": "This intention is for personal transformation and growth.",
-            "connection": "This intention is for spiritual connection or higher consciousness."
-        }
+    def stream_enhance_intention(self, original_intention: str, context: str = "general") -> Iterator[Tuple[str, Any]]:
+        """
+        Enhance an intention, yielding (key, value) pairs of the result as they become available
         
-        context_info = context_prompts.get(context, "This is a general intention.")
+        The pairs make up the same dict enhance_intention returns. The enhanced
+        intention is generated first, so it can be shown while the rest of the
+        response is still streaming.
+        """
+        if not self.enabled or not self._should_call_llm(original_intention):
+            yield from self.enhance_intention(original_intention, context).items()
+            return
+        
+        emitted = set()
+        try:
+            request = self._intention_request(original_intention, context)
+            cache_key = self.cache.key(request)
+            cached = self.cache.get(cache_key)
+            embedding = None
+            if cached is None:
+                embedding = self._embed(original_intention) if self.semantic_cache is not None else None
+                cached = self._semantic_lookup(embedding, original_intention, context)
+            if cached is not None:
+                yield from cached.items()
+                return
+            
+            yield "original_input", original_intention
+            emitted.add("original_input")
+            parser = EnhancementStreamParser()
+            for delta in self._stream_completion(request):
+                for name in parser.feed(delta):
+                    if name in ENHANCEMENT_RESULT_KEYS:
+                        key = ENHANCEMENT_RESULT_KEYS[name]
+                        yield key, self._enhancement_result(parser.fields, original_intention, context)[key]
+                        emitted.add(key)
+            
+            result = self._enhancement_result(parser.fields, original_intention, context)
+            if parser.complete:
+                self._store_enhancement(cache_key, embedding, result, context)
+            for key, value in result.items():
+                if key not in emitted:
+                    yield key, value
+            
+        except Exception as e:
+            logger.error("Error enhancing intention with OpenAI: %s", e)
+            for key, value in self._fallback_intention_enhancement(original_intention, context).items():
+                if key not in emitted:
+                    yield key, value
+    
+    async def astream_enhance_intention(self, original_intention: str,
+                                        context: str = "general") -> AsyncIterator[Tuple[str, Any]]:
+        """Enhance an intention on the async client, yielding (key, value) pairs of the result as they become available"""
+        if not self.enabled or not self._should_call_llm(original_intention):
+            for item in (await self.aenhance_intention(original_intention, context)).items():
+                yield item
+            return
         
-        return f"""
-        Please enhance the following intention to maximize its resonance and manifestation potential:
+        emitted = set()
+        try:
+            request = self._intention_request(original_intention, context)
+            cache_key = self.cache.key(request)
+            cached = self.cache.get(cache_key)
+            embedding = None
+            if cached is None:
+                embedding = await self._aembed(original_intention) if self.semantic_cache is not None else None
+                cached = self._semantic_lookup(embedding, original_intention, context)
+            if cached is not None:
+                for item in cached.items():
+                    yield item
+                return
+            
+            yield "original_input", original_intention
+            emitted.add("original_input")
+            parser = EnhancementStreamParser()
+            async for delta in self._astream_completion(request):
+                for name in parser.feed(delta):
+                    if name in ENHANCEMENT_RESULT_KEYS:
+                        key = ENHANCEMENT_RESULT_KEYS[name]
+                        yield key, self._enhancement_result(parser.fields, original_intention, context)[key]
+                        emitted.add(key)
+            
+            result = self._enhancement_result(parser.fields, original_intention, context)
+            if parser.complete:
+                self._store_enhancement(cache_key, embedding, result, context)
+            for key, value in result.items():
+                if key not in emitted:
+                    yield key, value
+            
+        except Exception as e:
+            logger.error("Error enhancing intention with OpenAI: %s", e)
+            for key, value in self._fallback_intention_enhancement(original_intention, context).items():
+                if key not in emitted:
+                    yield key, value
+    
+    async def aenhance_intention_batched(self, original_intention: str, context: str = "general") -> Dict[str, Any]:
+        """
+        Enhance an intention in one completion with others requested at about the same time
         
-        Original intention: "{original_intention}"
+        Requests arriving within INTENTION_BATCH_WAIT of each other (up to
+        INTENTION_BATCH_SIZE) share a single API request, so a burst of callers
+        costs one request against the rate limit instead of one each.
+        """
+        if not self.enabled:
+            return self._fallback_intention_enhancement(original_intention, context)
+        if not self._should_call_llm(original_intention):
+            return self._fallback_intention_enhancement(original_intention, context, INVALID_INTENTION_NOTE)
         
-        Context: {context_info}
+        cache_key = self.cache.key(self._intention_request(original_intention, context))
+        cached = self.cache.get(cache_key)
+        if cached is not None:
+            return cached
         
-        Respond with an enhanced version that follows these sacred intention principles:
-        - Present tense phrasing
-        - Positive language (avoid negations)
-        - Emotional resonance
-        - Clarity and specificity
-        - Divine alignment
+        state = self._loop_state()
+        if state['batcher'] is None:
+            state['batcher'] = IntentionBatcher(self)
+        return await state['batcher'].submit(original_intention, context, cache_key)
+    
+    async def _enhance_intention_batch(self, batch: List[Tuple[str, str, str, "asyncio.Future"]]) -> None:
+        """Enhance queued intentions in one completion and resolve their futures"""
+        try:
+            request = self._intention_batch_request([(intention, context) for intention, context, _, _ in batch])
+            enhancements = json.loads(await self._acomplete(request))["enhancements"]
+            if len(enhancements) != len(batch):
+                raise ValueError(f"Expected {len(batch)} enhancements, got {len(enhancements)}")
+            
+            for (intention, context, cache_key, future), fields in zip(batch, enhancements):
+                result = self._enhancement_result(fields, intention, context)
+                self.cache.set(cache_key, result)
+                if not future.done():
+                    future.set_result(result)
+        except Exception as e:
+            logger.error("Error enhancing intentions with OpenAI: %s", e)
+            for intention, context, _, future in batch:
+                if not future.done():
+                    future.set_result(self._fallback_intention_enhancement(intention, context))
+    
+    def batch_enhance_intentions(self, inputs: List[Tuple[str, str]],
+                                 timeout: Optional[float] = None) -> List[Dict[str, Any]]:
+        """
+        Enhance many (intention, context) pairs through the OpenAI Batch API
         
-        Provide your response in this format:
-        ENHANCED INTENTION: [your enhanced version]
-        RATIONALE: [explain why this wording is more effective]
-        RECOMMENDED FIELD: [suggest one of: torus, merkaba, metatron, sri_yantra, flower_of_life]
-        FREQUENCY: [suggest an optimal frequency in Hz]
+        Meant for offline workloads: batched requests cost about half as much,
+        but results can take up to the completion window. Blocks while polling
+        and returns results in input order; cached inputs are not resubmitted,
+        and inputs without a batch result get the basic enhancement.
         """
+        results = [None] * len(inputs)
+        if not self.enabled:
+            return [self._fallback_intention_enhancement(intention, context) for intention, context in inputs]
+        
+        pending = {}  # custom_id -> (input position, cache key)
+        lines = []
+        for i, (intention, context) in enumerate(inputs):
+            if not self._should_call_llm(intention):
+                results[i] = self._fallback_intention_enhancement(intention, context, INVALID_INTENTION_NOTE)
+                continue
+            request = self._intention_request(intention, context)
+            cache_key = self.cache.key(request)
+            results[i] = self.cache.get(cache_key)
+            if results[i] is None:
+                custom_id = f"req-{i}"
+                pending[custom_id] = (i, cache_key)
+                lines.append(json.dumps({
+                    "custom_id": custom_id,
+                    "method": "POST",
+                    "url": "/v1/chat/completions",
+                    "body": request
+                }))
+        
+        try:
+            if lines:
+                for custom_id, text in self._run_batch(lines, timeout):
+                    if custom_id in pending:
+                        i, cache_key = pending.pop(custom_id)
+                        intention, context = inputs[i]
+                        try:
+                            result = self._parse_enhancement_response(text, intention, context)
+                        except Exception as e:
+                            logger.error("Error parsing OpenAI response: %s", e)
+                            continue
+                        results[i] = self._store_enhancement(cache_key, None, result, context)
+        except Exception as e:
+            logger.error("Error enhancing intentions with the OpenAI Batch API: %s", e)
+        
+        for i, (intention, context) in enumerate(inputs):
+            if results[i] is None:
+                results[i] = self._fallback_intention_enhancement(intention, context)
+        return results
     
-    def _build_healing_prompt(self, situation: str, body_area: Optional[str], emotional_state: Optional[str]) -> str:
-        """Build the prompt for healing code recommendations"""
-        body_info = f"Body area: {body_area}" if body_area else "No specific body area mentioned."
-        emotional_info = f"Emotional state: {emotional_state}" if emotional_state else "No specific emotional state mentioned."
+    def _run_batch(self, lines: List[str], timeout: Optional[float]) -> List[Tuple[str, str]]:
+        """Submit chat completion JSONL lines as a batch, wait for it and return (custom_id, content) pairs"""
+        batch_file = self.client.files.create(
+            file=("requests.jsonl", "\n".join(lines).encode("utf-8")),
+            purpose="batch"
+        )
+        batch = self.client.batches.create(
+            input_file_id=batch_file.id,
+            endpoint="/v1/chat/completions",
+            completion_window=BATCH_COMPLETION_WINDOW
+        )
         
-        return f"""
-        Please recommend appropriate healing codes for the following situation:
+        # Poll with exponential backoff until the batch settles
+        deadline = time.monotonic() + timeout if timeout is not None else None
+        delay = BATCH_POLL_INTERVAL
+        while batch.status not in ("completed", "failed", "expired", "cancelled"):
+            if deadline is not None and time.monotonic() + delay > deadline:
+                raise TimeoutError(f"Batch {batch.id} still {batch.status} after {timeout} seconds")
+            time.sleep(delay)
+            delay = min(delay * 2, BATCH_MAX_POLL_INTERVAL)
+            batch = self.client.batches.retrieve(batch.id)
         
-        Situation: {situation}
-        {body_info}
-        {emotional_info}
+        if not batch.output_file_id:
+            raise RuntimeError(f"Batch {batch.id} ended {batch.status} without output")
         
-        Based on your expertise with Grabovoi codes and healing frequencies, what would you recommend?
+        outputs = []
+        for line in self.client.files.content(batch.output_file_id).text.splitlines():
+            if not line.strip():
+                continue
+            record = json.loads(line)
+            response = record.get("response") or {}
+            if response.get("status_code") == 200:
+                outputs.append((record["custom_id"], response["body"]["choices"][0]["message"]["content"]))
+        return outputs
+    
+    def recommend_healing_codes(self, situation: str, body_area: Optional[str] = None, 
+                              emotional_state: Optional[str] = None) -> Dict[str, Any]:
+        """Get AI-enhanced healing code recommendations"""
+        if not self.enabled:
+            # Provide a message about the limitation
+            return self._healing_unavailable()
         
-        Include:
-        1. At least 3 relevant healing codes with descriptions
-        2. A suggested practice for applying these codes
-        3. Any affirmations that would complement the codes
-        """
+        try:
+            request = self._healing_request(situation, body_area, emotional_state)
+            
+            cache_key = self.cache.key(request)
+            cached = self.cache.get(cache_key)
+            if cached is not None:
+                return cached
+            
+            # Extract the recommendations
+            recommendation_text = self._complete(request)
+            
+            # Return a structured format with the AI recommendations
+            return self._store_healing(cache_key, recommendation_text)
+            
+        except Exception as e:
+            logger.error("Error getting healing recommendations from OpenAI: %s", e)
+            return self._healing_error(e)
     
-    def _parse_enhancement_response(self, response_text: str, original_intention: str, context: str) -> Dict[str, Any]:
-        """Parse the structured response from OpenAI"""
+    async def arecommend_healing_codes(self, situation: str, body_area: Optional[str] = None,
+                                       emotional_state: Optional[str] = None) -> Dict[str, Any]:
+        """Get AI-enhanced healing code recommendations without blocking the event loop"""
+        if not self.enabled:
+            return self._healing_unavailable()
+        
         try:
-            # Extract the enhanced intention
-            enhanced_intention = ""
-            rationale = ""
-            field_type = "torus"  # Default
-            frequency = 7.83  # Default to Schumann resonance
+            request = self._healing_request(situation, body_area, emotional_state)
             
-            # Simple parsing of the response
-            for line in response_text.split('\n'):
-                line = line.strip()
-                if line.startswith("ENHANCED INTENTION:"):
-                    enhanced_intention = line.replace("ENHANCED INTENTION:", "").strip()
-                elif line.startswith("RATIONALE:"):
-                    rationale = line.replace("RATIONALE:", "").strip()
-                elif line.startswith("RECOMMENDED FIELD:"):
-                    field_text = line.replace("RECOMMENDED FIELD:", "").strip().lower()
-                    if field_text in ["torus", "merkaba", "metatron", "sri_yantra", "flower_of_life"]:
-                        field_type = field_text
-                elif line.startswith("FREQUENCY:"):
-                    freq_text = line.replace("FREQUENCY:", "").strip()
-                    try:
-                        # Extract just the number from the frequency text
-                        import re
-                        number_match = re.search(r'(\d+\.?\d*)', freq_text)
-                        if number_match:
-                            frequency = float(number_match.group(1))
-                    except:
-                        pass
+            cache_key = self.cache.key(request)
+            cached = self.cache.get(cache_key)
+            if cached is not None:
+                return cached
             
-            # If we couldn't extract the enhanced intention, use the original with a prefix
-            if not enhanced_intention:
-                enhanced_intention = f"I am in perfect harmony with {original_intention}"
+            return self._store_healing(cache_key, await self._acomplete(request))
             
-            return {
-                "original_input": original_intention,
-                "recommended_intention": enhanced_intention,
-                "reason": rationale or f"This intention has been optimized for the context of {context}.",
-                "suggested_field_type": field_type,
-                "suggested_frequency": frequency
+        except Exception as e:
+            logger.error("Error getting healing recommendations from OpenAI: %s", e)
+            return self._healing_error(e)
+    
+    def _loop_state(self) -> Dict[str, Any]:
+        """
+        Async client, connection pool, concurrency slots and batcher of the running event loop
+        
+        Pools and asyncio primitives only work on the loop they were created
+        on, so each loop (e.g. each asyncio.run()) gets its own, created on
+        first use with the shared or a pooled httpx.AsyncClient. State left
+        behind by loops that have since closed is dropped.
+        """
+        loop = asyncio.get_running_loop()
+        state = self._loop_clients.get(loop)
+        if state is None:
+            for closed in [other for other in list(self._loop_clients) if other.is_closed()]:
+                self._loop_clients.pop(closed, None)
+            http_client, owned_http = self._shared_async_http, None
+            if http_client is None:
+                client_class = HttpxAiohttpClient if self.use_aiohttp else httpx.AsyncClient
+                http_client = owned_http = client_class(
+                    limits=httpx.Limits(max_connections=ASYNC_MAX_CONNECTIONS,
+                                        max_keepalive_connections=ASYNC_MAX_KEEPALIVE_CONNECTIONS),
+                    timeout=OPENAI_TIMEOUT
+                )
+            state = self._loop_clients[loop] = {
+                'aclient': openai.AsyncOpenAI(
+                    api_key=self.api_key, http_client=http_client, max_retries=OPENAI_MAX_RETRIES
+                ),
+                'http': owned_http,  # Pool opened (and closed) by the handler
+                'slots': asyncio.Semaphore(MAX_CONCURRENT_REQUESTS),
+                'batcher': None  # IntentionBatcher, created by the first batched enhancement
             }
-            
+        return state
+    
+    def _get_async_client(self) -> "openai.AsyncOpenAI":
+        """Get the running event loop's async client"""
+        return self._loop_state()['aclient']
+    
+    def _complete(self, request: Dict[str, Any]) -> str:
+        """Run a chat completion under the rate limiter and return the message content"""
+        with self._slots:
+            self.limiter.acquire(estimate_request_tokens(request))
+            raw = self.client.chat.completions.with_raw_response.create(**request)
+            self.limiter.update_from_headers(raw.headers)
+            return self._completion_content(request, raw.parse())
+    
+    async def _acomplete(self, request: Dict[str, Any]) -> str:
+        """Run a chat completion on the async client under the rate limiter and return the message content"""
+        state = self._loop_state()
+        async with state['slots']:
+            await self.limiter.aacquire(estimate_request_tokens(request))
+            raw = await state['aclient'].chat.completions.with_raw_response.create(**request)
+            self.limiter.update_from_headers(raw.headers)
+            return self._completion_content(request, raw.parse())
+    
+    @staticmethod
+    def _completion_content(request: Dict[str, Any], completion: Any) -> str:
+        """Message content of a completion, raising CompletionTruncatedError for a cut-off structured reply"""
+        choice = completion.choices[0]
+        if choice.finish_reason == "length" and "response_format" in request:
+            raise CompletionTruncatedError(f"Completion truncated at max_tokens={request.get('max_tokens')}")
+        return choice.message.content
+    
+    def _stream_completion(self, request: Dict[str, Any]) -> Iterator[str]:
+        """Stream a chat completion under the rate limiter, yielding content as it arrives"""
+        with self._slots:
+            self.limiter.acquire(estimate_request_tokens(request))
+            stream = self.client.chat.completions.create(**request, stream=True)
+            try:
+                self.limiter.update_from_headers(stream.response.headers)
+                for chunk in stream:
+                    if chunk.choices and chunk.choices[0].delta.content:
+                        yield chunk.choices[0].delta.content
+                    if chunk.choices and chunk.choices[0].finish_reason == "length":
+                        logger.warning("Streamed completion truncated at max_tokens=%s", request.get("max_tokens"))
+            finally:
+                stream.response.close()
+    
+    async def _astream_completion(self, request: Dict[str, Any]) -> AsyncIterator[str]:
+        """Stream a chat completion on the async client under the rate limiter, yielding content as it arrives"""
+        state = self._loop_state()
+        async with state['slots']:
+            await self.limiter.aacquire(estimate_request_tokens(request))
+            stream = await state['aclient'].chat.completions.create(**request, stream=True)
+            try:
+                self.limiter.update_from_headers(stream.response.headers)
+                async for chunk in stream:
+                    if chunk.choices and chunk.choices[0].delta.content:
+                        yield chunk.choices[0].delta.content
+                    if chunk.choices and chunk.choices[0].finish_reason == "length":
+                        logger.warning("Streamed completion truncated at max_tokens=%s", request.get("max_tokens"))
+            finally:
+                await stream.response.aclose()
+    
+    def close(self) -> None:
+        """Close the response cache if the handler opened it (the shared sync client stays open)"""
+        if isinstance(self._owned_cache, PersistentResponseCache):
+            self._owned_cache.close()
+            self._owned_cache = None
+    
+    def __enter__(self) -> "OpenAIHandler":
+        return self
+    
+    def __exit__(self, *exc_info) -> None:
+        self.close()
+    
+    def __del__(self):
+        try:
+            self.close()
+        except Exception:
+            pass
+    
+    async def aclose(self) -> None:
+        """
+        Finish the running loop's batched enhancements, then close its async
+        client's connection pool unless it was passed in
+        """
+        loop = asyncio.get_running_loop()
+        state = self._loop_clients.get(loop)
+        if state is None:
+            return
+        if state['batcher'] is not None:
+            await state['batcher'].aclose()
+        del self._loop_clients[loop]
+        if state['http'] is not None:
+            await state['http'].aclose()
+    
+    async def __aenter__(self) -> "OpenAIHandler":
+        return self
+    
+    async def __aexit__(self, *exc_info) -> None:
+        await self.aclose()
+    
+    @staticmethod
+    def _should_call_llm(original_intention: str) -> bool:
+        """Whether an intention is worth a completion (not blank, not too short or long)"""
+        return MIN_INTENTION_LENGTH <= len(original_intention.strip()) <= MAX_INTENTION_LENGTH
+    
+    def _intention_request(self, original_intention: str, context: str) -> Dict[str, Any]:
+        """Chat completion arguments for an intention enhancement"""
+        prompt = self._build_intention_prompt(original_intention, context)
+        return dict(
+            model=self.model,
+            messages=[
+                {"role": "system", "content": INTENTION_SYSTEM_PROMPT},
+                {"role": "user", "content": prompt}
+            ],
+            temperature=0.7,
+            max_tokens=INTENTION_MAX_TOKENS,
+            response_format=ENHANCEMENT_RESPONSE_FORMAT
+        )
+    
+    def _intention_batch_request(self, inputs: List[Tuple[str, str]]) -> Dict[str, Any]:
+        """Chat completion arguments for enhancing several intentions in one response"""
+        prompts = "\n\n".join(
+            f"{number}. {self._build_intention_prompt(intention, context)}"
+            for number, (intention, context) in enumerate(inputs, 1)
+        )
+        return dict(
+            model=self.model,
+            messages=[
+                {"role": "system", "content": INTENTION_SYSTEM_PROMPT},
+                {"role": "user", "content": f"Enhance each of these intentions separately, in order:\n\n{prompts}"}
+            ],
+            temperature=0.7,
+            max_tokens=INTENTION_MAX_TOKENS * len(inputs),
+            response_format=ENHANCEMENT_BATCH_RESPONSE_FORMAT
+        )
+    
+    def _healing_request(self, situation: str, body_area: Optional[str], emotional_state: Optional[str]) -> Dict[str, Any]:
+        """Chat completion arguments for healing code recommendations"""
+        prompt = self._build_healing_prompt(situation, body_area, emotional_state)
+        return dict(
+            model=self.model,
+            messages=[
+                {"role": "system", "content": HEALING_SYSTEM_PROMPT},
+                {"role": "user", "content": prompt}
+            ],
+            temperature=0.7,
+            max_tokens=500
+        )
+    
+    def _semantic_lookup(self, embedding: Optional[List[float]], original_intention: str, context: str) -> Optional[Dict[str, Any]]:
+        """Get the enhancement cached for a near-duplicate intention, echoing this caller's input"""
+        if embedding is None:
+            return None
+        cached = self.semantic_cache.get(embedding, context)
+        if cached is not None:
+            cached["original_input"] = original_intention
+        return cached
+    
+    def _store_enhancement(self, cache_key: str, embedding: Optional[List[float]],
+                           result: Dict[str, Any], context: str) -> Dict[str, Any]:
+        """Cache a parsed enhancement result"""
+        self.cache.set(cache_key, result)
+        if embedding is not None:
+            self.semantic_cache.set(embedding, context, result)
+        return result
+    
+    def _store_healing(self, cache_key: str, recommendation_text: str) -> Dict[str, Any]:
+        """Wrap healing recommendations and cache the result"""
+        result = {
+            "ai_recommendation": recommendation_text,
+            "note": "These are AI-enhanced suggestions. Always refer to the official healing codes database for validated codes."
+        }
+        self.cache.set(cache_key, result)
+        return result
+    
+    @staticmethod
+    def _healing_unavailable() -> Dict[str, Any]:
+        return {
+            "message": "AI-enhanced recommendations unavailable. Please check the healing codes database directly.",
+            "healing_codes_available": True
+        }
+    
+    @staticmethod
+    def _healing_error(e: Exception) -> Dict[str, Any]:
+        return {
+            "message": f"Error processing AI recommendation: {str(e)}",
+            "healing_codes_available": True
+        }
+    
+    def _embed(self, text: str) -> Optional[List[float]]:
+        """Embed text for the semantic cache, or None if the embedding call fails"""
+        try:
+            response = self.client.embeddings.create(model=EMBEDDING_MODEL, input=text)
+            return response.data[0].embedding
         except Exception as e:
-            logger.error(f"Error parsing OpenAI response: {str(e)}")
-            return self._fallback_intention_enhancement(original_intention, context)
+            logger.warning("Embedding failed, skipping semantic cache: %s", e)
+            return None
+    
+    async def _aembed(self, text: str) -> Optional[List[float]]:
+        """Embed text for the semantic cache without blocking, or None if the embedding call fails"""
+        try:
+            response = await self._get_async_client().embeddings.create(model=EMBEDDING_MODEL, input=text)
+            return response.data[0].embedding
+        except Exception as e:
+            logger.warning("Embedding failed, skipping semantic cache: %s", e)
+            return None
+    
+    def _build_intention_prompt(self, original_intention: str, context: str) -> str:
+        """Build the prompt for intention enhancement"""
+        context_info = CONTEXT_PROMPTS.get(context, DEFAULT_CONTEXT_PROMPT)
+        
+        return f'Enhance: "{original_intention}"\nContext: {context_info}'
+    
+    def _build_healing_prompt(self, situation: str, body_area: Optional[str], emotional_state: Optional[str]) -> str:
+        """Build the prompt for healing code recommendations"""
+        body_info = f"Body area: {body_area}" if body_area else "No specific body area mentioned."
+        emotional_info = f"Emotional state: {emotional_state}" if emotional_state else "No specific emotional state mentioned."
+        
+        return f"Situation: {situation}\n{body_info}\n{emotional_info}"
+    
+    def _parse_enhancement_response(self, response_text: str, original_intention: str, context: str) -> Dict[str, Any]:
+        """Build the enhancement result from the JSON response"""
+        return self._enhancement_result(json.loads(response_text), original_intention, context)
+    
+    @staticmethod
+    def _enhancement_result(fields: Dict[str, Any], original_intention: str, context: str) -> Dict[str, Any]:
+        """Build the enhancement result from decoded fields, with defaults for missing or invalid ones"""
+        # If we couldn't extract the enhanced intention, use the original with a prefix
+        enhanced_intention = fields.get("enhanced_intention") or f"I am in perfect harmony with {original_intention}"
+        field_type = fields.get("recommended_field")
+        frequency = fields.get("frequency_hz")
+        
+        return {
+            "original_input": original_intention,
+            "recommended_intention": enhanced_intention,
+            "reason": fields.get("rationale") or f"This intention has been optimized for the context of {context}.",
+            "suggested_field_type": field_type if field_type in VALID_FIELD_TYPES else "torus",
+            # Default to Schumann resonance
+            "suggested_frequency": float(frequency) if isinstance(frequency, (int, float)) else 7.83
+        }
     
     def semantic_healing_code_match(self, user_issue: str, healing_codes: List[Dict[str, Any]], limit: int = 5) -> List[Dict[str, Any]]:
         """
@@ -222,85 +1411,314 @@ class OpenAIHandler:
             # Return basic keyword matching if OpenAI is not available
             return self._fallback_semantic_match(user_issue, healing_codes, limit)
         
+        # Rank codes by cosine similarity of embeddings; once the code
+        # descriptions are embedded, only the issue is embedded per call
+        if self._code_embeddings_ready(healing_codes):
+            query = self._embed(user_issue)
+            if query is not None:
+                return self._rank_healing_codes(query, healing_codes, limit)
+        
         try:
-            # Prepare a condensed version of healing codes for the prompt
-            code_info = []
-            for code in healing_codes[:100]:  # Limit to first 100 to keep prompt size reasonable
-                code_info.append({
-                    "id": code.get("id"),
-                    "code": code.get("code"),
-                    "description": code.get("description"),
-                    "category": code.get("category", "UNCATEGORIZED")
-                })
-            
-            # Build a prompt to find the most relevant codes
-            prompt = f"""
-            The user is seeking healing codes for the following health issue or concern:
-            
-            "{user_issue}"
-            
-            Here is a database of healing codes. Please identify the 5 most semantically relevant 
-            healing codes for this issue, based on the descriptions and intended purposes:
-            
-            {json.dumps(code_info, indent=2)}
-            
-            Return ONLY a JSON array with the most relevant healing code IDs, ranked by relevance.
-            The format should be:
-            [ID1, ID2, ID3, ID4, ID5]
-            
-            Do not include any explanation or other text, ONLY the JSON array.
-            """
-            
-            response = self.client.chat.completions.create(
-                model="gpt-4-turbo",
-                messages=[
-                    {"role": "system", "content": "You are a semantic matching system that connects health issues with the most relevant healing codes based on meaning and context, not just keywords."},
-                    {"role": "user", "content": prompt}
-                ],
-                temperature=0.3,
-                max_tokens=100
-            )
-            
-            # Extract the array of IDs from the response
-            result_text = response.choices[0].message.content.strip()
-            
-            # Clean up response if needed to ensure it's valid JSON
-            result_text = result_text.replace("```json", "").replace("```", "").strip()
-            
-            # Parse the result
-            try:
-                relevant_ids = json.loads(result_text)
-                if not isinstance(relevant_ids, list):
-                    raise ValueError("Expected list result")
-                
-                # Get the full code objects for these IDs
-                result_codes = []
-                id_to_code = {code.get("id"): code for code in healing_codes}
-                
-                for code_id in relevant_ids:
-                    if code_id in id_to_code:
-                        result_codes.append(id_to_code[code_id])
-                        if len(result_codes) >= limit:
-                            break
-                
-                # If we didn't get enough results, add more from the original list
-                if len(result_codes) < limit:
-                    for code in healing_codes:
-                        if code not in result_codes:
-                            result_codes.append(code)
-                            if len(result_codes) >= limit:
-                                break
-                
-                return result_codes
-                
-            except json.JSONDecodeError:
-                logger.error(f"Could not parse OpenAI response as JSON: {result_text}")
-                return self._fallback_semantic_match(user_issue, healing_codes, limit)
-            
+            # Re-runs over the same issue and codes reuse the ranked IDs
+            request = self._semantic_match_request(user_issue, healing_codes)
+            cache_key = self.cache.key(request)
+            cached = self.cache.get(cache_key)
+            if cached is None:
+                # So do paraphrases of an earlier issue over the same codes
+                embedding = self._embed(user_issue) if self.semantic_cache is not None else None
+                scope = self._semantic_match_scope(healing_codes)
+                cached = self.semantic_cache.get(embedding, scope) if embedding is not None else None
+                if cached is None:
+                    cached = {"ids": self._parse_semantic_match_ids(self._complete(request))}
+                    self._store_semantic_match(cache_key, embedding, scope, cached)
+            return self._semantic_match_codes(cached["ids"], healing_codes, limit)
         except Exception as e:
-            logger.error(f"Error in semantic healing code matching: {str(e)}")
+            logger.error("Error in semantic healing code matching: %s", e)
             return self._fallback_semantic_match(user_issue, healing_codes, limit)
-            
+    
+    async def asemantic_healing_code_match(self, user_issue: str, healing_codes: List[Dict[str, Any]],
+                                           limit: int = 5) -> List[Dict[str, Any]]:
+        """Match a user's health issue semantically with healing codes without blocking the event loop"""
+        if not self.enabled or not healing_codes:
+            return self._fallback_semantic_match(user_issue, healing_codes, limit)
+        
+        if self._code_embeddings_ready(healing_codes):
+            query = await self._aembed(user_issue)
+            if query is not None:
+                return self._rank_healing_codes(query, healing_codes, limit)
+        
+        try:
+            request = self._semantic_match_request(user_issue, healing_codes)
+            cache_key = self.cache.key(request)
+            cached = self.cache.get(cache_key)
+            if cached is None:
+                embedding = await self._aembed(user_issue) if self.semantic_cache is not None else None
+                scope = self._semantic_match_scope(healing_codes)
+                cached = self.semantic_cache.get(embedding, scope) if embedding is not None else None
+                if cached is None:
+                    cached = {"ids": self._parse_semantic_match_ids(await self._acomplete(request))}
+                    self._store_semantic_match(cache_key, embedding, scope, cached)
+            return self._semantic_match_codes(cached["ids"], healing_codes, limit)
+        except Exception as e:
+            logger.error("Error in semantic healing code matching: %s", e)
+            return self._fallback_semantic_match(user_issue, healing_codes, limit)
+    
+    async def asemantic_healing_code_match_many(self, issues: List[str], healing_codes: List[Dict[str, Any]],
+                                                limit: int = 5,
+                                                max_concurrency: int = SEMANTIC_MATCH_CONCURRENCY) -> List[List[Dict[str, Any]]]:
+        """
+        Match many issues against the same healing codes concurrently
+        
+        At most max_concurrency matches are in flight; every request still
+        passes through the rate limiter. Results are in issue order.
+        """
+        slots = asyncio.Semaphore(max_concurrency)
+        
+        async def match(issue: str) -> List[Dict[str, Any]]:
+            async with slots:
+                return await self.asemantic_healing_code_match(issue, healing_codes, limit)
+        
+        return await asyncio.gather(*(match(issue) for issue in issues))
+    
+    def precompute_healing_embeddings(self, healing_codes: List[Dict[str, Any]], wait: bool = True) -> bool:
+        """
+        Embed the descriptions of healing codes not embedded yet, in as few requests as possible
+        
+        Vectors in the embedding store are loaded instead of embedded. Only one
+        caller (across processes sharing the store) embeds at a time; others
+        wait for it and then embed whatever is still missing, or with
+        wait=False return at once. Returns whether every code now has an
+        embedding (False without OpenAI or NumPy, or without waiting while
+        another caller is embedding).
+        """
+        if not self.enabled or not NUMPY_AVAILABLE:
+            return False
+        if not self._unembedded_code_texts(healing_codes):
+            return True
+        if not self._embedding_lock.acquire(blocking=wait):
+            return False
+        store_db = None
+        try:
+            missing = self._load_stored_embeddings(healing_codes)
+            if missing and self.embedding_store is not None:
+                store_db = self.embedding_store.lock(wait)
+                if store_db is None:
+                    return False
+                missing = self._load_stored_embeddings(healing_codes)
+            for start in range(0, len(missing), EMBEDDING_BATCH_SIZE):
+                batch = missing[start:start + EMBEDDING_BATCH_SIZE]
+                response = self.client.embeddings.create(model=EMBEDDING_MODEL, input=batch)
+                self._store_code_embeddings(batch, response, store_db)
+            return True
+        except Exception as e:
+            logger.warning("Embedding healing codes failed: %s", e)
+            return False
+        finally:
+            self._release_embedding_locks(store_db)
+    
+    async def aprecompute_healing_embeddings(self, healing_codes: List[Dict[str, Any]]) -> bool:
+        """
+        Embed the descriptions of healing codes not embedded yet, without blocking the event loop
+        
+        Returns False at once if another caller is embedding them.
+        """
+        if not self.enabled or not NUMPY_AVAILABLE:
+            return False
+        if not self._unembedded_code_texts(healing_codes):
+            return True
+        if not self._embedding_lock.acquire(blocking=False):
+            return False
+        store_db = None
+        try:
+            missing = self._load_stored_embeddings(healing_codes)
+            if missing and self.embedding_store is not None:
+                store_db = self.embedding_store.lock(wait=False)
+                if store_db is None:
+                    return False
+                missing = self._load_stored_embeddings(healing_codes)
+            client = self._get_async_client()
+            for start in range(0, len(missing), EMBEDDING_BATCH_SIZE):
+                batch = missing[start:start + EMBEDDING_BATCH_SIZE]
+                response = await client.embeddings.create(model=EMBEDDING_MODEL, input=batch)
+                self._store_code_embeddings(batch, response, store_db)
+            return True
+        except Exception as e:
+            logger.warning("Embedding healing codes failed: %s", e)
+            return False
+        finally:
+            self._release_embedding_locks(store_db)
+    
+    def _code_embeddings_ready(self, healing_codes: List[Dict[str, Any]]) -> bool:
+        """
+        Whether every healing code has an embedding to rank by
+        
+        If not, the missing ones are embedded in a background thread (unless
+        one is already running) and the caller matches another way meanwhile,
+        instead of waiting for the whole code list to be embedded.
+        """
+        if not NUMPY_AVAILABLE:
+            return False
+        if not self._unembedded_code_texts(healing_codes):
+            return True
+        if not self._embedding_lock.locked():
+            threading.Thread(
+                target=self.precompute_healing_embeddings, args=(healing_codes, False), daemon=True
+            ).start()
+        return False
+    
+    @staticmethod
+    def _code_text(code: Dict[str, Any]) -> str:
+        """Text embedded for a healing code"""
+        return code.get("description") or code.get("code") or ""
+    
+    def _index_codes(self, healing_codes: List[Dict[str, Any]]) -> Dict[str, Any]:
+        """
+        Fields of each healing code as parallel lists, extracted once per code list
+        
+        The index is rebuilt when a different list (or one of a different length)
+        is matched, so callers must not edit a code list in place between calls.
+        """
+        index = self._code_index
+        if index is None or index['codes'] is not healing_codes or index['size'] != len(healing_codes):
+            descriptions = [(code.get("description") or "").lower() for code in healing_codes]
+            index = {
+                'codes': healing_codes,
+                'size': len(healing_codes),
+                'texts': [self._code_text(code) for code in healing_codes],
+                'descriptions': descriptions,
+                'description_blob': '\x00'.join(descriptions),
+                'description_starts': list(itertools.accumulate([0] + [len(d) + 1 for d in descriptions[:-1]])),
+                'categories': [(code.get("category") or "").lower() for code in healing_codes],
+                'by_id': {code.get("id"): code for code in healing_codes},
+                'matrix': None  # Stacked embeddings, filled in on the first ranking
+            }
+            self._code_index = index
+        return index
+    
+    def _unembedded_code_texts(self, healing_codes: List[Dict[str, Any]]) -> List[str]:
+        index = self._index_codes(healing_codes)
+        if index['matrix'] is not None:
+            return []
+        texts = dict.fromkeys(index['texts'])
+        return [text for text in texts if text not in self._code_embeddings]
+    
+    def _load_stored_embeddings(self, healing_codes: List[Dict[str, Any]]) -> List[str]:
+        """Load the embedding store's vectors for unembedded codes, returning the texts still missing"""
+        missing = self._unembedded_code_texts(healing_codes)
+        if missing and self.embedding_store is not None:
+            self._code_embeddings.update(self.embedding_store.load(missing))
+            missing = [text for text in missing if text not in self._code_embeddings]
+        return missing
+    
+    def _store_code_embeddings(self, texts: List[str], response: Any,
+                               store_db: Optional[sqlite3.Connection] = None) -> None:
+        vectors = {}
+        for item in response.data:
+            vector = np.asarray(item.embedding, dtype=np.float32)
+            norm = np.linalg.norm(vector)
+            vectors[texts[item.index]] = vector / norm if norm else vector
+        self._code_embeddings.update(vectors)
+        if store_db is not None:
+            self.embedding_store.save(store_db, vectors)
+    
+    def _release_embedding_locks(self, store_db: Optional[sqlite3.Connection]) -> None:
+        """Commit whatever was embedded to the store (releasing its lock), then the handler's lock"""
+        try:
+            if store_db is not None:
+                try:
+                    store_db.execute('COMMIT')
+                finally:
+                    store_db.close()
+        finally:
+            self._embedding_lock.release()
+    
+    def _rank_healing_codes(self, query: List[float], healing_codes: List[Dict[str, Any]],
+                            limit: int) -> List[Dict[str, Any]]:
+        """The limit healing codes most similar to the query embedding, best first"""
+        index = self._index_codes(healing_codes)
+        code_matrix = index['matrix']
+        if code_matrix is None:
+            code_matrix = index['matrix'] = np.stack([self._code_embeddings[text] for text in index['texts']])
+        
+        # One matrix-vector product scores every code; the norm is constant per query
+        scores = code_matrix @ np.asarray(query, dtype=np.float32)
+        if limit < len(scores):
+            top = np.argpartition(-scores, limit)[:limit]
+        else:
+            top = np.arange(len(scores))
+        top = top[np.argsort(-scores[top], kind="stable")]
+        return [healing_codes[i] for i in top]
+    
+    def _semantic_match_request(self, user_issue: str, healing_codes: List[Dict[str, Any]]) -> Dict[str, Any]:
+        """Chat completion arguments for ranking healing codes against a user's issue"""
+        # Prepare a condensed version of healing codes for the prompt
+        code_info = [{
+            "id": code.get("id"),
+            "code": code.get("code"),
+            "description": (code.get("description") or "")[:SEMANTIC_MATCH_DESCRIPTION_CHARS],
+            "category": code.get("category", "UNCATEGORIZED")
+        } for code in healing_codes[:SEMANTIC_MATCH_PROMPT_CODES]]
+        
+        # The code list comes before the issue, so repeated matches against
+        # the same codes share a prompt prefix; only a list long enough to take
+        # it past 1024 tokens is eligible for OpenAI's prompt caching
+        codes_json = json.dumps(code_info, separators=(',', ':'), ensure_ascii=False)
+        prompt = f'Healing codes: {codes_json}\n\nHealth issue or concern: "{user_issue}"'
+        
+        return dict(
+            model=self.model,
+            messages=[
+                {"role": "system", "content": SEMANTIC_MATCH_SYSTEM_PROMPT},
+                {"role": "user", "content": prompt}
+            ],
+            temperature=0.3,
+            max_tokens=100,
+            response_format=SEMANTIC_MATCH_RESPONSE_FORMAT
+        )
+    
+    def _semantic_match_scope(self, healing_codes: List[Dict[str, Any]]) -> str:
+        """Semantic cache scope of a match: its request with the issue left out"""
+        return "match:" + self.cache.key(self._semantic_match_request("", healing_codes))
+    
+    def _store_semantic_match(self, cache_key: str, embedding: Optional[List[float]],
+                              scope: str, result: Dict[str, Any]) -> None:
+        """Cache the ranked IDs of a semantic match"""
+        self.cache.set(cache_key, result)
+        if embedding is not None:
+            self.semantic_cache.set(embedding, scope, result)
+    
+    @staticmethod
+    def _parse_semantic_match_ids(result_text: str) -> List[Any]:
+        """Parse the ranked healing code IDs of a semantic match response"""
+        relevant_ids = json.loads(result_text)["ids"]
+        if not isinstance(relevant_ids, list):
+            raise ValueError("Expected list result")
+        return relevant_ids
+    
+    def _semantic_match_codes(self, relevant_ids: List[Any], healing_codes: List[Dict[str, Any]],
+                              limit: int) -> List[Dict[str, Any]]:
+        """Resolve ranked IDs to healing codes, topped up from the original list"""
+        # Get the full code objects for these IDs
+        result_codes = []
+        id_to_code = self._index_codes(healing_codes)['by_id']
+        
+        for code_id in relevant_ids:
+            if code_id in id_to_code:
+                result_codes.append(id_to_code[code_id])
+                if len(result_codes) >= limit:
+                    break
+        
+        # If we didn't get enough results, add more from the original list
+        if len(result_codes) < limit:
+            picked = set(map(id, result_codes))
+            for code in healing_codes:
+                if id(code) not in picked:
+                    result_codes.append(code)
+                    if len(result_codes) >= limit:
+                        break
+        
+        return result_codes
+    
     def _fallback_semantic_match(self, user_issue: str, healing_codes: List[Dict[str, Any]], limit: int = 5) -> List[Dict[str, Any]]:
         """Simple keyword-based fallback when OpenAI is unavailable"""
         # Convert user issue to lowercase for case-insensitive matching
@@ -310,63 +1728,62 @@ class OpenAIHandler:
         keywords = [word.strip() for word in user_issue_lower.split() if len(word.strip()) > 3]
         
         # Score each code based on keyword matches
-        scored_codes = []
-        for code in healing_codes:
-            score = 0
-            description = code.get("description", "").lower()
-            category = code.get("category", "").lower()
-            
-            # Check for exact phrase match (highest score)
-            if user_issue_lower in description:
-                score += 10
-                
-            # Check for keyword matches
-            for keyword in keywords:
-                if keyword in description:
-                    score += 2
-                if keyword in category:
-                    score += 1
-            
-            # Add to scored list
-            scored_codes.append((score, code))
+        index = self._index_codes(healing_codes)
+        keyword_counts = Counter(keywords)
         
-        # Sort by score (descending) and return top matches
-        scored_codes.sort(reverse=True, key=lambda x: x[0])
-        return [code for score, code in scored_codes[:limit]]
+        # Categories repeat across codes, so score each distinct one once
+        category_scores = {category: sum(count for keyword, count in keyword_counts.items() if keyword in category)
+                           for category in dict.fromkeys(index['categories'])}
+        scores = [category_scores[category] for category in index['categories']]
+        
+        # Exact phrase match scores highest, then 2 per keyword found in the description
+        for i, _ in self._description_hits(index, [user_issue_lower]):
+            scores[i] += 10
+        for i, keyword in self._description_hits(index, keyword_counts):
+            scores[i] += 2 * keyword_counts[keyword]
+        
+        # Top matches by score, in list order among equal scores
+        top = heapq.nlargest(limit, range(len(scores)), key=scores.__getitem__)
+        return [healing_codes[i] for i in top]
     
-    def _fallback_intention_enhancement(self, original_intention: str, context: str) -> Dict[str, Any]:
-        """Provide a fallback response when OpenAI is unavailable"""
-        # Context-specific fallback responses
-        if context == "healing":
-            enhanced = f"I am completely healed and vibrant with {original_intention}"
-            field_type = "flower_of_life"
-            frequency = 528.0
-            reason = "Healing intentions work best with present tense affirmations and the repair frequency of 528Hz"
-        elif context == "manifestation":
-            enhanced = f"I am gratefully experiencing {original_intention} in my life now"
-            field_type = "torus"
-            frequency = 7.83
-            reason = "Manifestation intentions work best with gratitude and present tense phrasing"
-        elif context == "protection":
-            enhanced = f"I am divinely protected from all forms of {original_intention}"
-            field_type = "merkaba"
-            frequency = 13.0
-            reason = "Protection intentions work best with the Merkaba field, which creates a natural energetic boundary"
-        elif context == "transformation":
-            enhanced = f"I am easily transforming {original_intention} with divine grace"
-            field_type = "metatron"
-            frequency = 9.0
-            reason = "Transformation intentions benefit from Metatron's Cube which connects all platonic solids"
-        elif context == "connection":
-            enhanced = f"I am deeply connected to {original_intention} at all levels of my being"
-            field_type = "sri_yantra"
-            frequency = 7.83
-            reason = "Connection intentions work best with Sri Yantra which represents the cosmos and unity consciousness"
+    @staticmethod
+    def _description_hits(index: Dict[str, Any], keywords: Iterable[str]) -> Set[Tuple[int, str]]:
+        """(position, keyword) for each code whose lowercased description contains a keyword"""
+        keywords = set(keywords)
+        descriptions = index['descriptions']
+        if '' in keywords or any('\x00' in keyword for keyword in keywords):
+            # Keywords spanning the blob separator need the per-description check
+            hits = {(i, keyword) for keyword in keywords for i, description in enumerate(descriptions)
+                    if keyword in description}
         else:
-            enhanced = f"I am in perfect harmony with {original_intention}"
-            field_type = "torus"
-            frequency = 7.83
-            reason = "This balanced intention works for general purposes and aligns with Earth's natural frequency"
+            blob = index['description_blob']
+            starts = index['description_starts']
+            hits = set()
+            if AHOCORASICK_AVAILABLE and len(keywords) >= FALLBACK_AHOCORASICK_MIN_KEYWORDS:
+                # One pass over the blob for all keywords
+                automaton = ahocorasick.Automaton()
+                for keyword in keywords:
+                    automaton.add_word(keyword, keyword)
+                automaton.make_automaton()
+                for end, keyword in automaton.iter(blob):
+                    hits.add((bisect.bisect_right(starts, end - len(keyword) + 1) - 1, keyword))
+            else:
+                # One str.find scan per keyword, skipping to the next description on a hit
+                for keyword in keywords:
+                    position = blob.find(keyword)
+                    while position != -1:
+                        i = bisect.bisect_right(starts, position) - 1
+                        hits.add((i, keyword))
+                        if i + 1 >= len(starts):
+                            break
+                        position = blob.find(keyword, starts[i + 1])
+        return hits
+    
+    def _fallback_intention_enhancement(self, original_intention: str, context: str,
+                                        note: str = "Basic enhancement provided (OpenAI integration unavailable)") -> Dict[str, Any]:
+        """Provide a fallback response when OpenAI is unavailable"""
+        template, field_type, frequency, reason = FALLBACK_ENHANCEMENTS.get(context, DEFAULT_FALLBACK_ENHANCEMENT)
+        enhanced = template.format(original_intention)
         
         return {
             "original_input": original_intention,
@@ -374,19 +1791,22 @@ class OpenAIHandler:
             "reason": reason,
             "suggested_field_type": field_type,
             "suggested_frequency": frequency,
-            "note": "Basic enhancement provided (OpenAI integration unavailable)"
+            "note": note
         }
 
 
 # Example usage
 if __name__ == "__main__":
-    # Initialize the handler (will use OPENAI_API_KEY from environment)
-    handler = OpenAIHandler()
+    logging.basicConfig(level=logging.INFO,
+                        format='%(asctime)s - %(name)s - %(levelname)s - %(message)s')
     
-    # Test intention enhancement
-    result = handler.enhance_intention("finding inner peace", "healing")
-    print(json.dumps(result, indent=2))
-    
-    # Test healing code recommendation
-    healing_result = handler.recommend_healing_codes("chronic back pain", "back", "anxiety")
-    print(json.dumps(healing_result, indent=2))
\ No newline at end of file
+    # Initialize the handler (will use OPENAI_API_KEY from environment);
+    # both calls reuse the shared client's connection pool
+    with OpenAIHandler() as handler:
+        # Test intention enhancement
+        result = handler.enhance_intention("finding inner peace", "healing")
+        print(json.dumps(result, indent=2))
+        
+        # Test healing code recommendation
+        healing_result = handler.recommend_healing_codes("chronic back pain", "back", "anxiety")
+        print(json.dumps(healing_result, indent=2))
\ No newline at end of file
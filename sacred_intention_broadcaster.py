@@ -12,23 +12,32 @@ Usage:
 Requirements:
   - Python 3.7+
   - websockets (optional, for WebSocket broadcasting)
+  - orjson (optional, for faster packet serialization)
   - hashlib, base64, json (standard library)
 """
 
 import argparse
 import asyncio
 import base64
+import bisect
+import functools
 import hashlib
+import itertools
 import json
 import logging
 import os
 import random
-import secrets
 import sys
 import time
 from enum import Enum
 from typing import Dict, List, Optional, Union, Any, Tuple
 
+try:
+    import orjson
+    HAS_ORJSON = True
+except ImportError:
+    HAS_ORJSON = False
+
 
 # Configure logging
 logging.basicConfig(
@@ -37,6 +46,27 @@ logging.basicConfig(
 )
 logger = logging.getLogger('sacred-broadcaster')
 
+# Compact JSON (de)serialization, using orjson's C implementation when available
+if HAS_ORJSON:
+    # Like json.dumps, accept non-string dict keys (stringified)
+    _ORJSON_OPTIONS = orjson.OPT_NON_STR_KEYS
+    
+    def _dumps_bytes(obj: Any) -> bytes:
+        return orjson.dumps(obj, option=_ORJSON_OPTIONS)
+    
+    _loads = orjson.loads
+    
+    def _dumps_indented_bytes(obj: Any) -> bytes:
+        return orjson.dumps(obj, option=_ORJSON_OPTIONS | orjson.OPT_INDENT_2)
+else:
+    def _dumps_bytes(obj: Any) -> bytes:
+        return json.dumps(obj, separators=(',', ':'), ensure_ascii=False).encode('utf-8')
+    
+    _loads = json.loads
+    
+    def _dumps_indented_bytes(obj: Any) -> bytes:
+        return json.dumps(obj, indent=2, ensure_ascii=False).encode('utf-8')
+
 
 class PacketType(Enum):
     """Network packet types for sacred intention transmission"""
@@ -67,22 +97,42 @@ FIBONACCI = [1, 1, 2, 3, 5, 8, 13, 21, 34, 55, 89, 144, 233, 377, 610, 987]
 METATRON = [3, 6, 9, 12, 15, 18, 21, 24, 27, 30, 33, 36, 39, 42, 45, 48]  # Tesla's 3-6-9 sequence
 SOLFEGGIO = [396, 417, 528, 639, 741, 852, 963]  # Solfeggio frequencies
 
-# Global sequence counter for packet IDs
-SEQUENCE_COUNTER = 0
+# PHI spiral powers (PHI^1 .. PHI^7) used for the phi-segment encoding
+PHI_POWERS = tuple(PHI ** (k + 1) for k in range(7))
+
+# Two-digit PHI spiral segment of each hex digit; a segment only depends on
+# the digit and its hexdigest position modulo 7
+_PHI_PHASE_SEGMENTS = [
+    {char: f"{int(ord(char) * power % 100):02d}" for char in "0123456789abcdef"}
+    for power in PHI_POWERS
+]
+
+# Both segments (four digits) of each SHA-512 digest byte, per byte position;
+# byte k holds hex digits 2k and 2k + 1, so the tables repeat every 7 bytes
+_PHI_BYTE_SEGMENTS = [
+    [_PHI_PHASE_SEGMENTS[2 * k % 7][f"{byte:02x}"[0]] + _PHI_PHASE_SEGMENTS[(2 * k + 1) % 7][f"{byte:02x}"[1]]
+     for byte in range(256)]
+    for k in range(7)
+]
+PHI_SEGMENT_TABLES = [_PHI_BYTE_SEGMENTS[k % 7] for k in range(64)]
+
+# Global sequence counter for packet IDs; next() on it is atomic, so
+# headers built on several threads never share an ID
+SEQUENCE_COUNTER = itertools.count()
 
 
 # Network packet data structures
 class PacketHeader:
     """IEEE 802.11 inspired packet header for intention transmission"""
     
+    __slots__ = ('version', 'type', 'length', 'sequence_id', 'timestamp', 'checksum')
+    
     def __init__(self, packet_type: PacketType, payload_length: int):
-        global SEQUENCE_COUNTER
         self.version = 1
         self.type = packet_type.value
         self.length = payload_length
-        self.sequence_id = SEQUENCE_COUNTER
-        SEQUENCE_COUNTER += 1
-        self.timestamp = int(time.time() * 1000)  # milliseconds
+        self.sequence_id = next(SEQUENCE_COUNTER)
+        self.timestamp = time.time_ns() // 1_000_000  # milliseconds
         self.checksum = None  # Will be calculated later
     
     def to_dict(self) -> Dict[str, Any]:
@@ -97,9 +147,24 @@ class PacketHeader:
         }
 
 
+# Packet metadata in serialized key order; the target device and intention
+# strength placeholders are filled in per packet on a copy
+PACKET_METADATA_TEMPLATE = {
+    "source_device": "sacred-python-broadcaster",
+    "target_device": None,
+    "intention_strength": None,
+    "sacred_encoding": "merkaba-torus-fibonacci"
+}
+
+
 class IntentionPacket:
     """Complete network packet with intention data"""
     
+    __slots__ = (
+        'intention', 'frequency', 'field_type', 'target_device', 'energy_signature', 'quantum_key',
+        'intention_strength', 'payload', '_payload_bytes', 'header', 'metadata', '_packet_bytes'
+    )
+    
     def __init__(
         self, 
         intention: str,
@@ -112,11 +177,14 @@ class IntentionPacket:
         self.field_type = field_type
         self.target_device = target_device
         
+        # One CSPRNG draw for both the energy signature and the quantum key
+        raw = os.urandom(24)
+        
         # Create energy signature with quantum noise
-        self.energy_signature = secrets.token_hex(8)
+        self.energy_signature = raw[:8].hex()
         
         # Generate quantum entanglement key
-        self.quantum_key = secrets.token_hex(16)
+        self.quantum_key = raw[8:].hex()
         
         # Calculate intention strength based on frequency and length
         self.intention_strength = min((len(intention) * frequency) / 100, 100)
@@ -130,24 +198,24 @@ class IntentionPacket:
             "quantum_entanglement_key": self.quantum_key
         }
         
-        # Create header
-        payload_str = json.dumps(self.payload)
-        self.header = PacketHeader(PacketType.INTENTION, len(payload_str))
+        # Create header (length is the serialized payload size in bytes)
+        self._payload_bytes = _dumps_bytes(self.payload)
+        self.header = PacketHeader(PacketType.INTENTION, len(self._payload_bytes))
         
         # Calculate checksum
-        self.header.checksum = self._calculate_checksum(payload_str)
+        self.header.checksum = self._calculate_checksum(self._payload_bytes)
         
         # Metadata
-        self.metadata = {
-            "source_device": "sacred-python-broadcaster",
-            "target_device": target_device,
-            "intention_strength": self.intention_strength,
-            "sacred_encoding": "merkaba-torus-fibonacci"
-        }
+        self.metadata = PACKET_METADATA_TEMPLATE.copy()
+        self.metadata["target_device"] = target_device
+        self.metadata["intention_strength"] = self.intention_strength
+        
+        # Serialized packet, built on first use
+        self._packet_bytes = None
     
-    def _calculate_checksum(self, payload: str) -> str:
-        """Calculate SHA-256 checksum of payload"""
-        return hashlib.sha256(payload.encode('utf-8')).hexdigest()[:16]
+    def _calculate_checksum(self, payload: bytes) -> str:
+        """Calculate SHA-256 checksum of the serialized payload"""
+        return hashlib.sha256(payload).digest()[:8].hex()
     
     def to_dict(self) -> Dict[str, Any]:
         """Convert packet to dictionary for JSON serialization"""
@@ -157,13 +225,25 @@ class IntentionPacket:
             "metadata": self.metadata
         }
     
+    def to_bytes(self) -> bytes:
+        """Convert packet to compact UTF-8 JSON bytes, serialized once per packet"""
+        if self._packet_bytes is None:
+            # Same bytes as dumping to_dict(), reusing the already serialized payload
+            self._packet_bytes = b''.join((
+                b'{"header":', _dumps_bytes(self.header.to_dict()),
+                b',"payload":', self._payload_bytes,
+                b',"metadata":', _dumps_bytes(self.metadata),
+                b'}'
+            ))
+        return self._packet_bytes
+    
     def to_json(self) -> str:
         """Convert packet to JSON string"""
-        return json.dumps(self.to_dict())
+        return self.to_bytes().decode('utf-8')
     
     def to_base64(self) -> str:
         """Convert packet to base64 string (for network transmission)"""
-        return base64.b64encode(self.to_json().encode('utf-8')).decode('utf-8')
+        return base64.b64encode(self.to_bytes()).decode('ascii')
 
 
 class SacredGeometryCalculator:
@@ -176,26 +256,27 @@ class SacredGeometryCalculator:
             raise ValueError("Intention cannot be empty")
         
         # Calculate hash using SHA-512
-        intention_hash = hashlib.sha512(intention.encode('utf-8')).hexdigest()
+        intention_bytes = intention.encode('utf-8')
+        intention_digest = hashlib.sha512(intention_bytes).digest()
         
         # Use PHI spiral to generate fibonacci-aligned energetic signature
-        phi_segments = []
-        for i in range(len(intention_hash)):
-            char_code = ord(intention_hash[i])
-            segment_value = char_code * (PHI ** ((i % 7) + 1))
-            phi_segments.append(f"{int(segment_value % 100):02d}")
-        
-        amplified = ''.join(phi_segments)
+        amplified = ''.join([table[byte] for table, byte in zip(PHI_SEGMENT_TABLES, intention_digest)])
         
         # Create a phi-spiral encoding with the intention
-        spiral_hash_data = amplified + intention
-        spiral_hash = hashlib.sha256(spiral_hash_data.encode('utf-8')).hexdigest()
+        spiral_hash = hashlib.sha256(amplified.encode('ascii') + intention_bytes).hexdigest()
         
-        # Apply the multiplier using the closest Fibonacci number
-        fib_multiplier = next((f for f in FIBONACCI if f >= multiplier), FIBONACCI[-1])
+        # Apply the multiplier using the closest Fibonacci number; the recheck
+        # sends NaN (which bisects to the front) to the last one as before
+        fib_index = bisect.bisect_left(FIBONACCI, multiplier)
+        if fib_index < len(FIBONACCI) and FIBONACCI[fib_index] >= multiplier:
+            fib_multiplier = FIBONACCI[fib_index]
+        else:
+            fib_multiplier = FIBONACCI[-1]
         
-        # Calculate Tesla's 3-6-9 principle (sum of char codes modulo 9, or 9 if result is 0)
-        metatronic_alignment = sum(ord(c) for c in intention) % 9 or 9
+        # Calculate Tesla's 3-6-9 principle (sum of char codes modulo 9, or 9 if result is 0);
+        # ASCII char codes are the UTF-8 bytes, which sum without a per-char call
+        char_code_sum = sum(intention_bytes) if intention.isascii() else sum(map(ord, intention))
+        metatronic_alignment = char_code_sum % 9 or 9
         
         return {
             "original": intention,
@@ -215,12 +296,14 @@ class SacredGeometryCalculator:
         # Map frequency to the optimal torus ratio based on Earth's Schumann resonance
         schumann_ratio = hz / SCHUMANN_RESONANCE
         
-        # Generate the torus inner and outer flows
-        inner_flow_data = intention + "inner"
-        inner_flow = hashlib.sha512(inner_flow_data.encode('utf-8')).hexdigest()[:12]
+        # Generate the torus inner and outer flows; both extend the hash of the intention
+        intention_hasher = hashlib.sha512(intention.encode('utf-8'))
+        inner_hasher = intention_hasher.copy()
+        inner_hasher.update(b"inner")
+        inner_flow = inner_hasher.digest()[:6].hex()
         
-        outer_flow_data = intention + "outer"
-        outer_flow = hashlib.sha512(outer_flow_data.encode('utf-8')).hexdigest()[:12]
+        intention_hasher.update(b"outer")
+        outer_flow = intention_hasher.digest()[:6].hex()
         
         # Calculate the phase angle for maximum resonance
         phase_angle = (hz * 360) % 360
@@ -228,9 +311,10 @@ class SacredGeometryCalculator:
         # Determine the coherence ratio (based on cardiac coherence principles)
         coherence = 0.618 * schumann_ratio  # 0.618 is the inverse of the golden ratio
         
-        # Find the closest Tesla number (3, 6, or 9) for the torus power node
-        tesla_nodes = [3, 6, 9]
-        tesla_node = min(tesla_nodes, key=lambda x: abs(x - (hz % 10)))
+        # Find the closest Tesla number (3, 6, or 9) for the torus power node;
+        # ties go to the smaller node, and NaN (from an infinite hz) to 3
+        node_offset = hz % 10
+        tesla_node = 9 if node_offset > 7.5 else 6 if node_offset > 4.5 else 3
         
         return {
             "intention": intention,
@@ -245,6 +329,24 @@ class SacredGeometryCalculator:
         }
 
 
+# Pure (time-independent) generator results are memoized per argument tuple,
+# so re-broadcasting an intention skips the hashing (typed, since results
+# echo the frequency back)
+GEOMETRY_CACHE_SIZE = 4096
+
+
+@functools.lru_cache(maxsize=GEOMETRY_CACHE_SIZE, typed=True)
+def _memoized_geometry(generator: str, *args) -> Dict[str, Any]:
+    """Return the memoized result of a SacredGeometryCalculator generator (read-only)"""
+    return getattr(SacredGeometryCalculator, generator)(*args)
+
+
+def _geometry_result(generator: str, *args) -> Dict[str, Any]:
+    """Return a SacredGeometryCalculator generator result, computed once per argument tuple"""
+    # Results are flat, so a shallow copy keeps callers from editing the cached dict
+    return dict(_memoized_geometry(generator, *args))
+
+
 class SacredIntentionBroadcaster:
     """Main class for broadcasting intentions over networks"""
     
@@ -271,7 +373,7 @@ class SacredIntentionBroadcaster:
         multiplier: float = 1.0
     ) -> Dict[str, Any]:
         """Broadcast intention over network"""
-        logger.info(f"Broadcasting intention: '{intention}'")
+        logger.info("Broadcasting intention: '%s'", intention)
         
         # Create the basic packet
         packet = self.create_intention_packet(intention, frequency, field_type)
@@ -280,13 +382,13 @@ class SacredIntentionBroadcaster:
         packet_base64 = packet.to_base64()
         
         # Calculate sacred geometry data
-        geometry_data = SacredGeometryCalculator.torus_field_generator(intention, frequency)
+        geometry_data = _geometry_result("torus_field_generator", intention, frequency)
         
         # Apply divine amplification if requested
         amplified_data = None
         if amplify:
-            amplified_data = SacredGeometryCalculator.divine_proportion_amplify(intention, multiplier)
-            logger.info(f"Divine amplification applied. Fibonacci multiplier: {amplified_data['fibonacci_multiplier']}")
+            amplified_data = _geometry_result("divine_proportion_amplify", intention, multiplier)
+            logger.info("Divine amplification applied. Fibonacci multiplier: %s", amplified_data['fibonacci_multiplier'])
         
         # In a real implementation, this would be broadcast over the network
         # Here we just return the packet and data
@@ -299,11 +401,11 @@ class SacredIntentionBroadcaster:
         if amplified_data:
             result["amplified_data"] = amplified_data
         
-        if self.debug:
-            logger.debug(f"Generated packet: {json.dumps(packet.to_dict(), indent=2)}")
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug("Generated packet: %s", json.dumps(packet.to_dict(), indent=2))
         
-        logger.info(f"Intention broadcast complete: {intention}")
-        logger.info(f"Field type: {field_type}, Frequency: {frequency} Hz")
+        logger.info("Intention broadcast complete: %s", intention)
+        logger.info("Field type: %s, Frequency: %s Hz", field_type, frequency)
         
         return result
 
@@ -311,22 +413,21 @@ class SacredIntentionBroadcaster:
 def extract_intention_from_packet(packet_base64: str) -> Optional[str]:
     """Extract intention from a base64-encoded packet (for receiving devices)"""
     try:
-        # Decode from base64
-        json_str = base64.b64decode(packet_base64).decode('utf-8')
-        packet = json.loads(json_str)
+        # Decode from base64; the JSON bytes are parsed without a str copy
+        packet = _loads(base64.b64decode(packet_base64))
         
         # Extract intention
         return packet["payload"]["intention"]
     except Exception as e:
-        logger.error(f"Failed to extract intention from packet: {e}")
+        logger.error("Failed to extract intention from packet: %s", e)
         return None
 
 
 def save_intention_to_file(intention_data: Dict[str, Any], filename: str) -> None:
     """Save intention data to file"""
-    with open(filename, 'w') as f:
-        json.dump(intention_data, f, indent=2)
-    logger.info(f"Intention data saved to {filename}")
+    with open(filename, 'wb') as f:
+        f.write(_dumps_indented_bytes(intention_data))
+    logger.info("Intention data saved to %s", filename)
 
 
 def main():
@@ -360,7 +461,7 @@ def main():
     # Extract intention from packet to verify
     packet_base64 = result["packet_base64"]
     extracted = extract_intention_from_packet(packet_base64)
-    logger.info(f"Verification - extracted intention: '{extracted}'")
+    logger.info("Verification - extracted intention: '%s'", extracted)
     
     # Save to file if requested
     if args.output: